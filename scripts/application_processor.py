@@ -1,50 +1,92 @@
-"""Background processor that validates loan applications from Kafka."""
+"""Background processor that validates loan applications from Kafka.
+
+With ``PROCESSOR_WORKERS`` above one, this process becomes a supervisor that
+spawns that many independent consumers in the same consumer group and serves
+their aggregated metrics.
+"""
 
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
-from decimal import Decimal
+import signal
 
 from aiokafka import AIOKafkaConsumer
-from prometheus_client import Counter, Histogram, start_http_server
+from prometheus_client import start_http_server
 
-from loans.application import ProcessApplication, ProcessApplicationCommand
+from loans.application import ProcessApplication
 from loans.interfaces.http.dependencies import AppContainer, cleanup_container
-from loans.utils.logging import configure_logging
-
-LOGGER = logging.getLogger("loans.application_processor")
-
-APPLICATIONS_PROCESSED = Counter(
-    "loan_applications_processed_total",
-    "Number of loan application messages processed",
-    labelnames=("status",),
-)
-PROCESSING_FAILURES = Counter(
-    "loan_application_processing_failures_total",
-    "Number of loan application messages that failed to process",
+from loans.interfaces.processor import (
+    BackpressurePipeline,
+    BatchApplicationProcessor,
+    PipelineRebalanceListener,
+    ProcessorSettings,
+    handle_payload,
 )
-PROCESSING_DURATION = Histogram(
-    "loan_application_processing_seconds",
-    "Time spent processing loan application messages",
+from loans.interfaces.processor.supervisor import (
+    WorkerSupervisor,
+    prepare_multiprocess_metrics,
+    serve_multiprocess_metrics,
 )
+from loans.interfaces.processor.metrics import PROCESSING_FAILURES
+from loans.utils import json_codec
+from loans.utils.logging import configure_logging, shutdown_logging
 
+LOGGER = logging.getLogger("loans.application_processor")
 
-async def main() -> None:
+
+def main() -> None:
     configure_logging()
+    settings = ProcessorSettings.from_env()
 
     metrics_port = int(os.getenv("PROCESSOR_METRICS_PORT", "9000"))
+    if settings.workers > 1:
+        prepare_multiprocess_metrics()
+        serve_multiprocess_metrics(metrics_port)
+        LOGGER.info(
+            "processor_supervisor_started",
+            extra={"extra_data": {"port": metrics_port, "workers": settings.workers}},
+        )
+        WorkerSupervisor(
+            run_worker,
+            settings.workers,
+            shutdown_timeout_seconds=settings.shutdown_timeout_seconds,
+        ).run()
+        return
+
     start_http_server(metrics_port)
     LOGGER.info("processor_metrics_started", extra={"extra_data": {"port": metrics_port}})
+    asyncio.run(consume(settings))
+
+
+def run_worker(index: int) -> None:
+    """Entry point of one supervised worker process."""
+    # Ctrl-C reaches the whole process group; let the supervisor coordinate the shutdown.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    configure_logging()
+    LOGGER.info(
+        "processor_worker_booting", extra={"extra_data": {"worker": index, "pid": os.getpid()}}
+    )
+    try:
+        asyncio.run(consume(ProcessorSettings.from_env()))
+    finally:
+        # Spawned workers skip atexit handlers, so flush the log queue explicitly.
+        shutdown_logging()
+
+
+async def consume(settings: ProcessorSettings) -> None:
+    """Consume until cancelled or sent SIGTERM, then leave the group and release resources."""
+    current = asyncio.current_task()
+    assert current is not None
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, current.cancel)
 
     container = AppContainer(publisher_backend="memory")
 
     process_application = ProcessApplication(
         repository=container.application_repository,
-        cache=container.status_cache,
-        cache_ttl_seconds=container.cache_ttl_seconds,
+        approval_threshold=container.approval_threshold,
+        status_notifier=container.status_changes,
     )
 
     bootstrap_servers = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "kafka:29092")
@@ -52,12 +94,20 @@ async def main() -> None:
     consumer_group = os.getenv("KAFKA_CONSUMER_GROUP", "loans-consumer")
 
     consumer = AIOKafkaConsumer(
-        topic,
         bootstrap_servers=bootstrap_servers,
         group_id=consumer_group,
-        enable_auto_commit=True,
-        value_deserializer=lambda v: json.loads(v.decode("utf-8")),
+        enable_auto_commit=settings.mode == "stream",
+        max_poll_records=settings.batch_size,
+        value_deserializer=json_codec.loads,
     )
+    pipeline: BackpressurePipeline | None = None
+    if settings.mode == "batch":
+        processor = BatchApplicationProcessor(process_application, settings.concurrency)
+        pipeline = BackpressurePipeline(consumer, processor, settings)
+        # Drop fetched records of revoked partitions before their new owner starts on them.
+        consumer.subscribe([topic], listener=PipelineRebalanceListener(pipeline))
+    else:
+        consumer.subscribe([topic])
 
     LOGGER.info(
         "processor_started",
@@ -66,14 +116,28 @@ async def main() -> None:
                 "topic": topic,
                 "bootstrap_servers": bootstrap_servers,
                 "consumer_group": consumer_group,
+                "mode": settings.mode,
+                "batch_size": settings.batch_size,
+                "concurrency": settings.concurrency,
+                "linger_ms": settings.linger_ms,
+                "ordering": settings.ordering,
+                "max_in_flight": settings.max_in_flight,
+                "pause_latency_ms": settings.pause_latency_ms,
+                "pid": os.getpid(),
             }
         },
     )
     await consumer.start()
     try:
-        async for record in consumer:
-            await _handle_record(process_application, record.value)
+        if pipeline is not None:
+            await pipeline.run()
+        else:
+            async for record in consumer:
+                await _handle_record(process_application, record.value)
+    except asyncio.CancelledError:
+        LOGGER.info("processor_stopping", extra={"extra_data": {"pid": os.getpid()}})
     finally:
+        # Stopping the consumer sends LeaveGroup, so the partitions are reassigned right away.
         await consumer.stop()
         await cleanup_container(container)
 
@@ -83,29 +147,11 @@ async def _handle_record(
     payload: dict[str, object],
 ) -> None:
     try:
-        command = ProcessApplicationCommand(
-            applicant_id=str(payload["applicant_id"]),
-            amount=Decimal(str(payload["amount"])),
-            term_months=int(payload["term_months"]),
-        )
-        with PROCESSING_DURATION.time():
-            result = await process_application.execute(command)
-        APPLICATIONS_PROCESSED.labels(status=result.status.value).inc()
-        LOGGER.info(
-            "application_processed",
-            extra={
-                "extra_data": {
-                    "applicant_id": result.applicant_id,
-                    "status": result.status.value,
-                    "amount": float(result.amount),
-                    "term_months": result.term_months,
-                }
-            },
-        )
-    except Exception as exc:  # pragma: no cover - defensive logging
+        await handle_payload(process_application, payload)
+    except Exception:  # pragma: no cover - defensive logging
         PROCESSING_FAILURES.inc()
         LOGGER.exception("application_processing_failed", extra={"extra_data": payload})
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
@@ -0,0 +1,56 @@
+"""Compare the JSON backends available to ``loans.utils.json_codec``.
+
+Encodes and decodes a representative Kafka payload and structured log record
+with every installed backend and prints operations per second, e.g.::
+
+    python scripts/benchmark_json.py --iterations 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Sequence
+
+from loans.utils.json_codec import available_codecs, codec
+
+SAMPLES: Dict[str, Any] = {
+    "kafka_message": {"applicant_id": "applicant-000123", "amount": "4999.99", "term_months": 36},
+    "log_record": {
+        "timestamp": datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        "level": "info",
+        "logger": "loans.application_processor",
+        "message": "application_processed",
+        "applicant_id": "applicant-000123",
+        "amount": Decimal("4999.99"),
+        "status": "approved",
+        "duration_ms": 1.734,
+    },
+}
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100_000)
+    return parser.parse_args(argv)
+
+
+def main(args: argparse.Namespace) -> None:
+    print(f"selected backend: {codec.name}")
+    print(f"{'sample':<16}{'backend':<10}{'dumps/s':>14}{'loads/s':>14}")
+    for sample_name, sample in SAMPLES.items():
+        for name, backend in available_codecs().items():
+            encoded = backend.dumps(sample)
+            dumps_seconds = timeit.timeit(lambda: backend.dumps(sample), number=args.iterations)
+            loads_seconds = timeit.timeit(lambda: backend.loads(encoded), number=args.iterations)
+            print(
+                f"{sample_name:<16}{name:<10}"
+                f"{args.iterations / dumps_seconds:>14,.0f}"
+                f"{args.iterations / loads_seconds:>14,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main(parse_args())
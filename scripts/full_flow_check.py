@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import os
 import sys
-import time
 import uuid
 
 import httpx
@@ -25,25 +25,25 @@ async def run_check() -> int:
         submit.raise_for_status()
         print(f"Submitted application {applicant_id}: {submit.json()}")
 
-        deadline = time.monotonic() + float(os.getenv("LOANS_STATUS_TIMEOUT", "15"))
-        poll_interval = float(os.getenv("LOANS_STATUS_POLL_INTERVAL", "0.5"))
-
-        while True:
-            status_resp = await client.get(f"/application/{applicant_id}")
-            if status_resp.status_code == 404:
-                print("Application not yet persisted; retrying...")
-            else:
-                status_resp.raise_for_status()
-                body = status_resp.json()
-                print(f"Latest status: {body}")
-                if body.get("status") != "pending":
-                    print("Application processed successfully.")
-                    return 0
-
-            if time.monotonic() > deadline:
-                print("Timed out waiting for application processing.", file=sys.stderr)
-                return 1
-            await asyncio.sleep(poll_interval)
+        timeout = float(os.getenv("LOANS_STATUS_TIMEOUT", "15"))
+        try:
+            async with asyncio.timeout(timeout):
+                async with client.stream(
+                    "GET", f"/application/{applicant_id}/events", timeout=None
+                ) as events:
+                    events.raise_for_status()
+                    async for line in events.aiter_lines():
+                        if not line.startswith("data: "):
+                            continue
+                        body = json.loads(line.removeprefix("data: "))
+                        print(f"Latest status: {body}")
+                        if body.get("status") != "pending":
+                            print("Application processed successfully.")
+                            return 0
+        except TimeoutError:
+            pass
+        print("Timed out waiting for application processing.", file=sys.stderr)
+        return 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+"""Copy cached application snapshots from one Redis key layout into another.
+
+The destination is the layout the service is configured with
+(``CACHE_KEY_LAYOUT``/``CACHE_KEY_PREFIX``/``CACHE_HASH_BUCKETS``). A typical
+rollout to the hash layout is::
+
+    CACHE_KEY_LAYOUT=hash python scripts/migrate_cache_layout.py --source string
+    # switch the API and processor to CACHE_KEY_LAYOUT=hash, then
+    CACHE_KEY_LAYOUT=hash python scripts/migrate_cache_layout.py --source string --delete-source
+
+Entries the destination misses in between are simply read through from
+PostgreSQL, so the migration can run while the service is live.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import Sequence
+
+from loans.infrastructure.cache import HashBucketLayout, RedisStatusCache, StringKeyLayout
+from loans.interfaces.http.dependencies import AppContainer, cleanup_container
+from loans.utils.logging import configure_logging
+
+LOGGER = logging.getLogger("loans.cache_migration")
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", choices=["string", "hash"], default="string")
+    parser.add_argument(
+        "--source-prefix",
+        default=None,
+        help="Key prefix of the source layout ('' for string, 'loans:status' for hash by default).",
+    )
+    parser.add_argument(
+        "--source-buckets",
+        type=int,
+        default=65536,
+        help="Bucket count of a hash source layout.",
+    )
+    parser.add_argument(
+        "--ttl-seconds",
+        type=int,
+        default=None,
+        help="TTL for migrated entries (defaults to the service TTL).",
+    )
+    parser.add_argument(
+        "--delete-source",
+        action="store_true",
+        help="Remove each source entry once it has been copied.",
+    )
+    return parser.parse_args(argv)
+
+
+async def migrate(args: argparse.Namespace) -> None:
+    container = AppContainer(repository_backend="memory", publisher_backend="memory")
+    status_cache = container.status_cache
+    if not isinstance(status_cache, RedisStatusCache):
+        LOGGER.info("cache_migration_skipped", extra={"extra_data": {"reason": "cache_not_redis"}})
+        await cleanup_container(container)
+        return
+
+    source = (
+        HashBucketLayout(prefix=args.source_prefix or "loans:status", buckets=args.source_buckets)
+        if args.source == "hash"
+        else StringKeyLayout(prefix=args.source_prefix or "")
+    )
+    if args.source == container.cache_key_layout and args.source_prefix is None:
+        LOGGER.warning(
+            "cache_migration_skipped", extra={"extra_data": {"reason": "source_is_destination"}}
+        )
+        await cleanup_container(container)
+        return
+
+    started = time.perf_counter()
+    try:
+        migrated = await status_cache.migrate_from(
+            source,
+            ttl_seconds=args.ttl_seconds or container.cache_ttl_seconds,
+            delete_source=args.delete_source,
+        )
+    finally:
+        await cleanup_container(container)
+
+    LOGGER.info(
+        "cache_migration_complete",
+        extra={
+            "extra_data": {
+                "records": migrated,
+                "source": args.source,
+                "destination": container.cache_key_layout,
+                "elapsed_seconds": round(time.perf_counter() - started, 3),
+            }
+        },
+    )
+
+
+if __name__ == "__main__":
+    configure_logging()
+    asyncio.run(migrate(parse_args()))
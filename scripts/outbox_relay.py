@@ -0,0 +1,50 @@
+"""Relay transactional outbox events from PostgreSQL to Kafka.
+
+Run alongside an API configured with ``EVENT_DELIVERY=outbox``::
+
+    EVENT_DELIVERY=outbox python scripts/outbox_relay.py
+
+Several relays may run at once; each claims its own batch with
+``FOR UPDATE SKIP LOCKED``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+from prometheus_client import start_http_server
+
+from loans.interfaces.http.dependencies import AppContainer, cleanup_container
+from loans.utils.logging import configure_logging
+
+LOGGER = logging.getLogger("loans.outbox_relay")
+
+
+async def main() -> None:
+    configure_logging()
+
+    container = AppContainer(repository_backend="postgres", publisher_backend="kafka")
+    relay = container.outbox_relay
+    if relay is None:
+        LOGGER.warning(
+            "outbox_relay_disabled", extra={"extra_data": {"reason": "event_delivery_not_outbox"}}
+        )
+        await cleanup_container(container)
+        return
+
+    metrics_port = int(os.getenv("OUTBOX_RELAY_METRICS_PORT", "9001"))
+    start_http_server(metrics_port)
+    LOGGER.info(
+        "outbox_relay_started",
+        extra={"extra_data": {"topic": container.kafka_topic, "metrics_port": metrics_port}},
+    )
+    try:
+        await relay.run()
+    finally:
+        await cleanup_container(container)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
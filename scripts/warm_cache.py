@@ -1,25 +1,79 @@
-"""Warm Redis cache with the latest application statuses from PostgreSQL."""
+"""Warm Redis cache with the latest application statuses from PostgreSQL.
+
+Rows are streamed through a server-side cursor and written to Redis in
+pipelined chunks, so memory stays flat regardless of table size. Use the
+filters to rewarm only the hot set after a restart, e.g.::
+
+    python scripts/warm_cache.py --non-terminal --updated-within-hours 24
+"""
 
 from __future__ import annotations
 
+import argparse
 import asyncio
 import logging
-from typing import Optional
-
-from sqlalchemy import select
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Sequence
 
+from loans.domain import ApplicationStatus
+from loans.infrastructure import PostgresLoanApplicationRepository
 from loans.interfaces.http.dependencies import AppContainer, cleanup_container
-from loans.infrastructure.db.models import LoanApplicationModel
-
+from loans.utils.logging import configure_logging
 
 LOGGER = logging.getLogger("loans.cache_warmup")
 
 
-async def warm_cache() -> None:
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--status",
+        dest="statuses",
+        action="append",
+        choices=[status.value for status in ApplicationStatus],
+        help="Only warm applications in this status (repeatable).",
+    )
+    parser.add_argument(
+        "--non-terminal",
+        action="store_true",
+        help="Only warm applications still awaiting a decision.",
+    )
+    parser.add_argument(
+        "--updated-within-hours",
+        type=float,
+        default=None,
+        help="Only warm applications updated in the last N hours.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=5000,
+        help="Rows fetched per cursor round trip and written per Redis pipeline batch.",
+    )
+    parser.add_argument(
+        "--ttl-seconds",
+        type=int,
+        default=None,
+        help="Cache TTL for warmed entries (defaults to the service TTL).",
+    )
+    return parser.parse_args(argv)
+
+
+def _resolve_statuses(args: argparse.Namespace) -> list[ApplicationStatus] | None:
+    statuses = {ApplicationStatus(value) for value in args.statuses or []}
+    if args.non_terminal:
+        non_terminal = {status for status in ApplicationStatus if not status.is_terminal}
+        statuses = statuses & non_terminal if statuses else non_terminal
+    return sorted(statuses, key=lambda status: status.value) or None
+
+
+async def warm_cache(args: argparse.Namespace) -> None:
     container = AppContainer()
 
     if container.repository_backend != "postgres":
-        LOGGER.info("cache_warmup_skipped", extra={"extra_data": {"reason": "repository_not_postgres"}})
+        LOGGER.info(
+            "cache_warmup_skipped", extra={"extra_data": {"reason": "repository_not_postgres"}}
+        )
         await cleanup_container(container)
         return
 
@@ -34,22 +88,52 @@ async def warm_cache() -> None:
         await cleanup_container(container)
         return
 
+    statuses = _resolve_statuses(args)
+    updated_since = (
+        datetime.now(timezone.utc) - timedelta(hours=args.updated_within_hours)
+        if args.updated_within_hours is not None
+        else None
+    )
+    ttl_seconds = args.ttl_seconds or container.cache_ttl_seconds
+    repository = PostgresLoanApplicationRepository(session_factory)
+
+    LOGGER.info(
+        "cache_warmup_started",
+        extra={
+            "extra_data": {
+                "statuses": [status.value for status in statuses] if statuses else "all",
+                "updated_since": updated_since.isoformat() if updated_since else None,
+                "chunk_size": args.chunk_size,
+            }
+        },
+    )
+
     count = 0
-    async with session_factory() as session:
-        result = await session.execute(select(LoanApplicationModel))
-        for record in result.scalars():
-            application = record.to_domain()
-            await container.status_cache.set(
-                applicant_id=application.applicant_id,
-                status=application.status,
-                ttl_seconds=container.cache_ttl_seconds,
-            )
-            count += 1
+    started = time.perf_counter()
+    try:
+        async for chunk in repository.stream_latest(
+            statuses=statuses,
+            updated_since=updated_since,
+            chunk_size=args.chunk_size,
+        ):
+            await container.status_cache.set_many(chunk, ttl_seconds=ttl_seconds)
+            count += len(chunk)
+            LOGGER.info("cache_warmup_progress", extra={"extra_data": _progress(count, started)})
+    finally:
+        await cleanup_container(container)
+
+    LOGGER.info("cache_warmup_complete", extra={"extra_data": _progress(count, started)})
+
 
-    LOGGER.info("cache_warmup_complete", extra={"extra_data": {"records": count}})
-    await cleanup_container(container)
+def _progress(count: int, started: float) -> dict[str, float | int]:
+    elapsed = time.perf_counter() - started
+    return {
+        "records": count,
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(count / elapsed, 1) if elapsed > 0 else 0.0,
+    }
 
 
 if __name__ == "__main__":
-    logging.basicConfig(level=logging.INFO)
-    asyncio.run(warm_cache())
+    configure_logging()
+    asyncio.run(warm_cache(parse_args()))
@@ -3,21 +3,31 @@
 from .use_cases import (
     ApplicationNotFoundError,
     ApplicationStatusResult,
+    ApplicationStatusesResult,
     ApplicationValidationError,
     GetApplicationStatus,
+    GetApplicationStatuses,
     ProcessApplication,
     ProcessApplicationCommand,
     SubmitApplication,
     SubmitApplicationCommand,
+    SubmitApplications,
+    SubmissionOutcome,
+    SubmissionResult,
 )
 
 __all__ = [
     "SubmitApplication",
     "SubmitApplicationCommand",
+    "SubmitApplications",
+    "SubmissionOutcome",
+    "SubmissionResult",
     "ProcessApplication",
     "ProcessApplicationCommand",
     "ApplicationValidationError",
     "GetApplicationStatus",
     "ApplicationNotFoundError",
     "ApplicationStatusResult",
+    "GetApplicationStatuses",
+    "ApplicationStatusesResult",
 ]
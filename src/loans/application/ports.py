@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Protocol
+from enum import Enum
+from typing import Protocol, Sequence
 
 from ..domain import LoanApplication
 
@@ -18,31 +19,96 @@ class ApplicationMessage:
     term_months: int
 
 
+class CacheMarker(Enum):
+    """Sentinel values a status cache can hold instead of a snapshot."""
+
+    ABSENT = "absent"
+    """The applicant was recently looked up and does not exist."""
+
+
+CacheLookup = LoanApplication | CacheMarker | None
+"""Result of a cache lookup: a snapshot, a negative entry, or ``None`` on a miss."""
+
+
 class LoanApplicationRepository(Protocol):
     """Persistence gateway for loan applications."""
 
-    async def create(self, application: LoanApplication) -> None:
+    async def create(self, application: LoanApplication) -> None: ...
+
+    async def upsert(self, application: LoanApplication) -> None: ...
+
+    async def get_latest(self, applicant_id: str) -> LoanApplication | None: ...
+
+    async def create_many(self, applications: Sequence[LoanApplication]) -> list[str]:
+        """Insert applications that do not exist yet; return the applicant ids inserted."""
+        ...
+
+    async def upsert_many(self, applications: Sequence[LoanApplication]) -> None:
+        """Upsert many applications at once; the last entry wins per applicant."""
         ...
 
-    async def upsert(self, application: LoanApplication) -> None:
+    async def record_decisions(
+        self, applications: Sequence[LoanApplication]
+    ) -> list[LoanApplication]:
+        """Insert the applications, or set ``status``/``updated_at`` on existing ones.
+
+        Runs as one atomic write and returns the persisted rows, so callers get
+        the stored ``created_at``, amount and term without reading them first.
+        The last entry wins per applicant.
+        """
         ...
 
-    async def get_latest(self, applicant_id: str) -> LoanApplication | None:
+    async def get_latest_many(self, applicant_ids: Sequence[str]) -> dict[str, LoanApplication]:
+        """Return the latest application for each known applicant, keyed by id."""
         ...
 
 
 class ApplicationStatusCache(Protocol):
     """Cache for storing the most recent loan application snapshot."""
 
-    async def set(self, application: LoanApplication, ttl_seconds: int) -> None:
+    async def set(self, application: LoanApplication, ttl_seconds: int) -> None: ...
+
+    async def get(self, applicant_id: str) -> LoanApplication | None: ...
+
+    async def set_many(self, applications: Sequence[LoanApplication], ttl_seconds: int) -> None:
+        """Store many snapshots at once, batching round trips where possible."""
         ...
 
-    async def get(self, applicant_id: str) -> LoanApplication | None:
+    async def get_many(self, applicant_ids: Sequence[str]) -> dict[str, LoanApplication]:
+        """Return cached snapshots keyed by applicant id, omitting misses."""
+        ...
+
+    async def lookup(self, applicant_id: str) -> CacheLookup:
+        """Like :meth:`get`, but reports negative entries as ``CacheMarker.ABSENT``."""
+        ...
+
+    async def lookup_many(
+        self, applicant_ids: Sequence[str]
+    ) -> dict[str, LoanApplication | CacheMarker]:
+        """Like :meth:`get_many`, but includes negative entries."""
+        ...
+
+    async def mark_absent(self, applicant_ids: Sequence[str], ttl_seconds: int) -> None:
+        """Record that the applicants do not exist, without replacing live snapshots.
+
+        Negative entries are overwritten by the next ``set``/``set_many``.
+        """
         ...
 
 
 class ApplicationEventPublisher(Protocol):
     """Message bus used to publish application submissions."""
 
-    async def publish(self, topic: str, message: ApplicationMessage) -> None:
+    async def publish(self, topic: str, message: ApplicationMessage) -> None: ...
+
+    async def publish_many(self, topic: str, messages: Sequence[ApplicationMessage]) -> None:
+        """Publish messages together so the transport can batch them."""
+        ...
+
+
+class StatusChangeNotifier(Protocol):
+    """Broadcasts persisted status changes to API instances watching them."""
+
+    async def notify(self, applications: Sequence[LoanApplication]) -> None:
+        """Deliver the snapshots on a best-effort basis; never raises for transport errors."""
         ...
@@ -5,20 +5,27 @@ from .get_application_status import (
     ApplicationStatusResult,
     GetApplicationStatus,
 )
+from .get_application_statuses import ApplicationStatusesResult, GetApplicationStatuses
 from .process_application import (
     ApplicationValidationError,
     ProcessApplication,
     ProcessApplicationCommand,
 )
 from .submit_application import SubmitApplication, SubmitApplicationCommand
+from .submit_applications import SubmissionOutcome, SubmissionResult, SubmitApplications
 
 __all__ = [
     "SubmitApplication",
     "SubmitApplicationCommand",
+    "SubmitApplications",
+    "SubmissionOutcome",
+    "SubmissionResult",
     "ProcessApplication",
     "ProcessApplicationCommand",
     "ApplicationValidationError",
     "GetApplicationStatus",
     "ApplicationNotFoundError",
     "ApplicationStatusResult",
+    "GetApplicationStatuses",
+    "ApplicationStatusesResult",
 ]
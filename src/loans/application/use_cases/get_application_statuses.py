@@ -0,0 +1,54 @@
+"""Use case for retrieving the latest status of many applicants at once."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import AsyncIterator, Sequence
+
+from ..ports import LoanApplicationRepository
+from .get_application_status import ApplicationStatusResult, _to_result
+
+
+@dataclass(frozen=True)
+class ApplicationStatusesResult:
+    """Statuses found for a set of applicants, plus the ids with no application."""
+
+    found: list[ApplicationStatusResult]
+    missing: list[str]
+
+
+class GetApplicationStatuses:
+    """Resolve many applicants in chunks, each a single bulk repository read.
+
+    Behind the cached repository every chunk is one multi-key cache read, one
+    database query for the misses and one cache backfill.
+    """
+
+    def __init__(self, repository: LoanApplicationRepository, chunk_size: int = 500) -> None:
+        self._repository = repository
+        self._chunk_size = max(1, chunk_size)
+
+    async def execute(self, applicant_ids: Sequence[str]) -> ApplicationStatusesResult:
+        found: list[ApplicationStatusResult] = []
+        missing: list[str] = []
+        async for chunk in self.iter_chunks(applicant_ids):
+            found.extend(chunk.found)
+            missing.extend(chunk.missing)
+        return ApplicationStatusesResult(found=found, missing=missing)
+
+    async def iter_chunks(
+        self, applicant_ids: Sequence[str]
+    ) -> AsyncIterator[ApplicationStatusesResult]:
+        """Yield results chunk by chunk, in request order with duplicates removed."""
+        unique_ids = list(dict.fromkeys(applicant_ids))
+        for start in range(0, len(unique_ids), self._chunk_size):
+            chunk = unique_ids[start : start + self._chunk_size]
+            records = await self._repository.get_latest_many(chunk)
+            yield ApplicationStatusesResult(
+                found=[
+                    _to_result(records[applicant_id])
+                    for applicant_id in chunk
+                    if applicant_id in records
+                ],
+                missing=[applicant_id for applicant_id in chunk if applicant_id not in records],
+            )
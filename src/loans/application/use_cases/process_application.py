@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import Sequence
 
 from ...domain import ApplicationStatus, LoanApplication
-from ..ports import ApplicationStatusCache, LoanApplicationRepository
+from ..ports import LoanApplicationRepository, StatusChangeNotifier
 
 
 class ApplicationValidationError(ValueError):
@@ -23,43 +24,56 @@ class ProcessApplicationCommand:
 
 
 class ProcessApplication:
-    """Validate, persist, and cache loan application decisions."""
+    """Validate and decide loan applications, persisting decisions in bulk.
+
+    Each call to :meth:`record` is a single repository write that returns the
+    stored rows; behind the cached repository it also refreshes the cache once
+    for the whole batch, so no read or separate cache write is needed.
+    """
 
     def __init__(
         self,
         repository: LoanApplicationRepository,
-        cache: ApplicationStatusCache,
         approval_threshold: Decimal = Decimal("5000"),
-        cache_ttl_seconds: int = 3600,
+        status_notifier: StatusChangeNotifier | None = None,
     ) -> None:
         self._repository = repository
-        self._cache = cache
         self._approval_threshold = approval_threshold
-        self._cache_ttl_seconds = cache_ttl_seconds
+        self._status_notifier = status_notifier
 
     async def execute(self, command: ProcessApplicationCommand) -> LoanApplication:
+        (application,) = await self.record([self.decide(command)])
+        return application
+
+    async def execute_many(
+        self, commands: Sequence[ProcessApplicationCommand]
+    ) -> list[LoanApplication]:
+        """Decide and persist all commands; nothing is written if any is invalid."""
+        return await self.record([self.decide(command) for command in commands])
+
+    def decide(self, command: ProcessApplicationCommand) -> LoanApplication:
+        """Validate ``command`` and return the decided application, without persisting it."""
         self._validate(command)
         status = (
             ApplicationStatus.APPROVED
             if command.amount <= self._approval_threshold
             else ApplicationStatus.REJECTED
         )
-
-        existing = await self._repository.get_latest(command.applicant_id)
-        application = (
-            existing.with_status(status)
-            if existing
-            else LoanApplication(
-                applicant_id=command.applicant_id,
-                amount=command.amount,
-                term_months=command.term_months,
-                status=status,
-            )
+        return LoanApplication(
+            applicant_id=command.applicant_id,
+            amount=command.amount,
+            term_months=command.term_months,
+            status=status,
         )
 
-        await self._repository.upsert(application)
-        await self._cache.set(application, ttl_seconds=self._cache_ttl_seconds)
-        return application
+    async def record(self, decisions: Sequence[LoanApplication]) -> list[LoanApplication]:
+        """Persist decisions from :meth:`decide` and broadcast the stored rows."""
+        if not decisions:
+            return []
+        applications = await self._repository.record_decisions(decisions)
+        if self._status_notifier is not None:
+            await self._status_notifier.notify(applications)
+        return applications
 
     @staticmethod
     def _validate(command: ProcessApplicationCommand) -> None:
@@ -0,0 +1,81 @@
+"""Use case responsible for submitting loan applications in bulk."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Sequence
+
+from ...domain import LoanApplication
+from ..ports import ApplicationEventPublisher, ApplicationMessage, LoanApplicationRepository
+from .submit_application import SubmitApplicationCommand
+
+
+class SubmissionOutcome(str, Enum):
+    """What happened to one item of a bulk submission."""
+
+    ACCEPTED = "accepted"
+    DUPLICATE = "duplicate"
+    INVALID = "invalid"
+
+
+@dataclass(frozen=True)
+class SubmissionResult:
+    """Per-item result of a bulk submission."""
+
+    applicant_id: str
+    outcome: SubmissionOutcome
+    detail: str | None = None
+
+
+class SubmitApplications:
+    """Persist many pending applications at once and publish them as one batch.
+
+    Items for an applicant that already exists, or that repeat an earlier item
+    of the same request, are reported as duplicates and not published.
+    """
+
+    def __init__(
+        self,
+        repository: LoanApplicationRepository,
+        publisher: ApplicationEventPublisher,
+        topic: str,
+    ) -> None:
+        self._repository = repository
+        self._publisher = publisher
+        self._topic = topic
+
+    async def execute(self, commands: Sequence[SubmitApplicationCommand]) -> list[SubmissionResult]:
+        candidates: dict[str, LoanApplication] = {}
+        for command in commands:
+            candidates.setdefault(
+                command.applicant_id,
+                LoanApplication(
+                    applicant_id=command.applicant_id,
+                    amount=command.amount,
+                    term_months=command.term_months,
+                ),
+            )
+
+        created = set(await self._repository.create_many(list(candidates.values())))
+        await self._publisher.publish_many(
+            topic=self._topic,
+            messages=[
+                ApplicationMessage(
+                    applicant_id=application.applicant_id,
+                    amount=application.amount,
+                    term_months=application.term_months,
+                )
+                for application in candidates.values()
+                if application.applicant_id in created
+            ],
+        )
+
+        results: list[SubmissionResult] = []
+        for command in commands:
+            if command.applicant_id in created:
+                created.discard(command.applicant_id)
+                results.append(SubmissionResult(command.applicant_id, SubmissionOutcome.ACCEPTED))
+            else:
+                results.append(SubmissionResult(command.applicant_id, SubmissionOutcome.DUPLICATE))
+        return results
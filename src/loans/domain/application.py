@@ -15,6 +15,11 @@ class ApplicationStatus(str, Enum):
     APPROVED = "approved"
     REJECTED = "rejected"
 
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the application has reached a final decision."""
+        return self is not ApplicationStatus.PENDING
+
 
 @dataclass(slots=True)
 class LoanApplication:
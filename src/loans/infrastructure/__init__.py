@@ -3,6 +3,7 @@
 from .repositories.cached_repository import CachedLoanApplicationRepository
 from .repositories.in_memory_applications import InMemoryLoanApplicationRepository
 from .repositories.postgres_applications import PostgresLoanApplicationRepository
+from .repositories.write_behind import WriteBehindLoanApplicationRepository
 from .cache.in_memory_status_cache import InMemoryStatusCache
 from .messaging.in_memory import InMemoryApplicationEventPublisher
 
@@ -10,6 +11,7 @@ __all__ = [
     "CachedLoanApplicationRepository",
     "InMemoryLoanApplicationRepository",
     "PostgresLoanApplicationRepository",
+    "WriteBehindLoanApplicationRepository",
     "InMemoryStatusCache",
     "InMemoryApplicationEventPublisher",
 ]
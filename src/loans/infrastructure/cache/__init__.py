@@ -1,6 +1,20 @@
 """Cache implementations for loan application statuses."""
 
+from .codecs import BinarySnapshotCodec, JsonSnapshotCodec, SnapshotCodec
 from .in_memory_status_cache import InMemoryStatusCache
+from .key_layouts import CacheKeyLayout, HashBucketLayout, StringKeyLayout
+from .local_status_cache import LocalStatusCache
 from .redis_status_cache import RedisStatusCache, create_redis_client
 
-__all__ = ["InMemoryStatusCache", "RedisStatusCache", "create_redis_client"]
+__all__ = [
+    "BinarySnapshotCodec",
+    "CacheKeyLayout",
+    "HashBucketLayout",
+    "InMemoryStatusCache",
+    "JsonSnapshotCodec",
+    "LocalStatusCache",
+    "RedisStatusCache",
+    "SnapshotCodec",
+    "StringKeyLayout",
+    "create_redis_client",
+]
@@ -0,0 +1,155 @@
+"""Serialization formats for cached loan application snapshots.
+
+Every codec decodes every known format, dispatching on the first byte of the
+payload, so once every reader runs this module the encoding can be switched
+(or rolled back) without flushing the cache. Readers older than the binary
+layout cannot decode it, so roll out with JSON first and enable binary only
+afterwards:
+
+* ``{`` – legacy JSON document with ISO timestamps and a stringified amount.
+* ``0x01`` – version 1 of the compact binary layout described on
+  :class:`BinarySnapshotCodec`.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Final, Protocol
+
+from ...domain import ApplicationStatus, LoanApplication
+
+_EPOCH: Final = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND: Final = timedelta(microseconds=1)
+
+_JSON_PREFIX: Final = ord("{")
+_BINARY_V1: Final = 0x01
+# version, amount coefficient, amount exponent, term, status, created_at, updated_at
+_BINARY_V1_HEADER: Final = struct.Struct(">BqbHBqq")
+
+_STATUS_CODES: Final = {
+    ApplicationStatus.PENDING: 0,
+    ApplicationStatus.APPROVED: 1,
+    ApplicationStatus.REJECTED: 2,
+}
+_STATUS_BY_CODE: Final = {code: status for status, code in _STATUS_CODES.items()}
+
+
+class SnapshotCodec(Protocol):
+    """Encode snapshots for storage and decode any supported format."""
+
+    def encode(self, application: LoanApplication) -> bytes: ...
+
+    def decode(self, payload: bytes) -> LoanApplication: ...
+
+
+class JsonSnapshotCodec:
+    """Human-readable JSON encoding (the original cache format)."""
+
+    def encode(self, application: LoanApplication) -> bytes:
+        return _encode_json(application)
+
+    def decode(self, payload: bytes) -> LoanApplication:
+        return decode_snapshot(payload)
+
+
+class BinarySnapshotCodec:
+    """Fixed-layout binary encoding.
+
+    Layout (big-endian): version byte, amount as a signed 64-bit coefficient
+    plus signed 8-bit decimal exponent, term as unsigned 16-bit, status as a
+    one-byte code, created/updated timestamps as signed 64-bit microseconds
+    since the Unix epoch (UTC), followed by the UTF-8 applicant id. Amounts
+    that do not fit fall back to the JSON encoding.
+    """
+
+    def encode(self, application: LoanApplication) -> bytes:
+        scaled = _scaled_amount(application.amount)
+        if scaled is None:
+            return _encode_json(application)
+        coefficient, exponent = scaled
+        header = _BINARY_V1_HEADER.pack(
+            _BINARY_V1,
+            coefficient,
+            exponent,
+            application.term_months,
+            _STATUS_CODES[application.status],
+            _to_epoch_micros(application.created_at),
+            _to_epoch_micros(application.updated_at),
+        )
+        return header + application.applicant_id.encode("utf-8")
+
+    def decode(self, payload: bytes) -> LoanApplication:
+        return decode_snapshot(payload)
+
+
+def decode_snapshot(payload: bytes) -> LoanApplication:
+    """Decode a snapshot written by any codec version."""
+    if not payload:
+        raise ValueError("Empty snapshot payload.")
+    version = payload[0]
+    if version == _BINARY_V1:
+        return _decode_binary_v1(payload)
+    if version == _JSON_PREFIX:
+        return _decode_json(payload)
+    raise ValueError(f"Unknown snapshot format byte {version:#04x}.")
+
+
+def _decode_binary_v1(payload: bytes) -> LoanApplication:
+    _, coefficient, exponent, term_months, status_code, created, updated = (
+        _BINARY_V1_HEADER.unpack_from(payload)
+    )
+    return LoanApplication(
+        applicant_id=payload[_BINARY_V1_HEADER.size :].decode("utf-8"),
+        amount=Decimal(coefficient).scaleb(exponent),
+        term_months=term_months,
+        status=_STATUS_BY_CODE[status_code],
+        created_at=_EPOCH + created * _MICROSECOND,
+        updated_at=_EPOCH + updated * _MICROSECOND,
+    )
+
+
+def _encode_json(application: LoanApplication) -> bytes:
+    return json.dumps(
+        {
+            "applicant_id": application.applicant_id,
+            "amount": str(application.amount),
+            "term_months": application.term_months,
+            "status": application.status.value,
+            "created_at": application.created_at.isoformat(),
+            "updated_at": application.updated_at.isoformat(),
+        }
+    ).encode("utf-8")
+
+
+def _decode_json(payload: bytes) -> LoanApplication:
+    data = json.loads(payload)
+    return LoanApplication(
+        applicant_id=data["applicant_id"],
+        amount=Decimal(data["amount"]),
+        term_months=int(data["term_months"]),
+        status=ApplicationStatus(data["status"]),
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+    )
+
+
+def _scaled_amount(amount: Decimal) -> tuple[int, int] | None:
+    if not amount.is_finite():
+        return None
+    sign, digits, exponent = amount.as_tuple()
+    assert isinstance(exponent, int)  # finite decimals always have an int exponent
+    coefficient = int("".join(map(str, digits)) or "0")
+    if sign:
+        coefficient = -coefficient
+    if not (-(2**63) <= coefficient < 2**63 and -128 <= exponent <= 127):
+        return None
+    return coefficient, exponent
+
+
+def _to_epoch_micros(moment: datetime) -> int:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - _EPOCH) // _MICROSECOND
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Tuple
+from typing import Dict, Sequence, Tuple
 
-from ...application.ports import ApplicationStatusCache
+from ...application.ports import ApplicationStatusCache, CacheLookup, CacheMarker
 from ...domain import LoanApplication
 
 
@@ -13,18 +13,49 @@ class InMemoryStatusCache(ApplicationStatusCache):
     """Stores statuses with an expiration timestamp."""
 
     def __init__(self) -> None:
-        self._store: Dict[str, Tuple[LoanApplication, datetime]] = {}
+        self._store: Dict[str, Tuple[LoanApplication | CacheMarker, datetime]] = {}
 
     async def set(self, application: LoanApplication, ttl_seconds: int) -> None:
         expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
         self._store[application.applicant_id] = (application, expires_at)
 
     async def get(self, applicant_id: str) -> LoanApplication | None:
+        entry = await self.lookup(applicant_id)
+        return entry if isinstance(entry, LoanApplication) else None
+
+    async def set_many(self, applications: Sequence[LoanApplication], ttl_seconds: int) -> None:
+        for application in applications:
+            await self.set(application, ttl_seconds)
+
+    async def get_many(self, applicant_ids: Sequence[str]) -> dict[str, LoanApplication]:
+        return {
+            applicant_id: entry
+            for applicant_id, entry in (await self.lookup_many(applicant_ids)).items()
+            if isinstance(entry, LoanApplication)
+        }
+
+    async def lookup(self, applicant_id: str) -> CacheLookup:
         entry = self._store.get(applicant_id)
         if not entry:
             return None
-        application, expires_at = entry
+        value, expires_at = entry
         if expires_at < datetime.now(timezone.utc):
             del self._store[applicant_id]
             return None
-        return application
+        return value
+
+    async def lookup_many(
+        self, applicant_ids: Sequence[str]
+    ) -> dict[str, LoanApplication | CacheMarker]:
+        found: dict[str, LoanApplication | CacheMarker] = {}
+        for applicant_id in applicant_ids:
+            entry = await self.lookup(applicant_id)
+            if entry is not None:
+                found[applicant_id] = entry
+        return found
+
+    async def mark_absent(self, applicant_ids: Sequence[str], ttl_seconds: int) -> None:
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+        for applicant_id in applicant_ids:
+            if await self.lookup(applicant_id) is None:
+                self._store[applicant_id] = (CacheMarker.ABSENT, expires_at)
@@ -0,0 +1,157 @@
+"""Strategies for where status snapshots live in the Redis keyspace."""
+
+from __future__ import annotations
+
+import zlib
+from typing import AsyncIterator, Final, Protocol, Sequence, cast
+
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+DEFAULT_HASH_PREFIX: Final = "loans:status"
+DEFAULT_HASH_BUCKETS: Final = 65536
+
+
+class CacheKeyLayout(Protocol):
+    """Maps applicant ids onto Redis storage and back."""
+
+    def queue_set(
+        self,
+        pipe: Pipeline,
+        applicant_id: str,
+        payload: bytes,
+        ttl_seconds: int,
+        *,
+        only_if_absent: bool = False,
+    ) -> None:
+        """Append the commands that store ``payload`` to ``pipe``."""
+        ...
+
+    def queue_delete(self, pipe: Pipeline, applicant_id: str) -> None:
+        """Append the commands that remove the entry to ``pipe``."""
+        ...
+
+    async def fetch(self, client: Redis, applicant_ids: Sequence[str]) -> list[bytes | None]:
+        """Return the stored payload for each id, in order, in one round trip."""
+        ...
+
+    def scan_ids(self, client: Redis, count: int) -> AsyncIterator[list[str]]:
+        """Yield batches of applicant ids stored under this layout."""
+        ...
+
+
+class StringKeyLayout:
+    """One top-level string key per applicant: ``{prefix}{applicant_id}``.
+
+    With the default empty prefix this is the original layout, where the raw
+    applicant id is the key.
+    """
+
+    def __init__(self, prefix: str = "") -> None:
+        self._prefix = prefix
+
+    def key(self, applicant_id: str) -> str:
+        return f"{self._prefix}{applicant_id}"
+
+    def queue_set(
+        self,
+        pipe: Pipeline,
+        applicant_id: str,
+        payload: bytes,
+        ttl_seconds: int,
+        *,
+        only_if_absent: bool = False,
+    ) -> None:
+        pipe.set(self.key(applicant_id), payload, ex=ttl_seconds, nx=only_if_absent)
+
+    def queue_delete(self, pipe: Pipeline, applicant_id: str) -> None:
+        pipe.delete(self.key(applicant_id))
+
+    async def fetch(self, client: Redis, applicant_ids: Sequence[str]) -> list[bytes | None]:
+        # The client is built with ``decode_responses=False``, so values come back as bytes.
+        return cast(
+            list[bytes | None],
+            await client.mget([self.key(applicant_id) for applicant_id in applicant_ids]),
+        )
+
+    async def scan_ids(self, client: Redis, count: int) -> AsyncIterator[list[str]]:
+        batch: list[str] = []
+        async for key in client.scan_iter(match=f"{self._prefix}*", count=count, _type="string"):
+            name = key.decode("utf-8") if isinstance(key, bytes) else key
+            batch.append(name[len(self._prefix) :])
+            if len(batch) >= count:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+class HashBucketLayout:
+    """Applicants spread over ``buckets`` small hashes: ``{prefix}:{n}``.
+
+    Small hashes use Redis' compact listpack encoding, which costs far less
+    memory per entry than a top-level key. Each field carries its own TTL via
+    ``HEXPIRE``, so this layout requires Redis 7.4 or newer. Keep buckets below
+    ``hash-max-listpack-entries`` (128 by default) entries each by sizing
+    ``buckets`` to roughly ``expected applicants / 100``.
+    """
+
+    def __init__(
+        self, prefix: str = DEFAULT_HASH_PREFIX, buckets: int = DEFAULT_HASH_BUCKETS
+    ) -> None:
+        if buckets <= 0:
+            raise ValueError("buckets must be positive.")
+        self._prefix = prefix
+        self._buckets = buckets
+
+    def bucket_key(self, applicant_id: str) -> str:
+        bucket = zlib.crc32(applicant_id.encode("utf-8")) % self._buckets
+        return f"{self._prefix}:{bucket}"
+
+    def queue_set(
+        self,
+        pipe: Pipeline,
+        applicant_id: str,
+        payload: bytes,
+        ttl_seconds: int,
+        *,
+        only_if_absent: bool = False,
+    ) -> None:
+        key = self.bucket_key(applicant_id)
+        if only_if_absent:
+            pipe.hsetnx(key, applicant_id, payload)
+            # NX: only expire a field that has no TTL yet, i.e. the one just
+            # created, never a live snapshot that already carries its own TTL.
+            pipe.execute_command("HEXPIRE", key, ttl_seconds, "NX", "FIELDS", 1, applicant_id)
+        else:
+            pipe.hset(key, applicant_id, payload)
+            pipe.execute_command("HEXPIRE", key, ttl_seconds, "FIELDS", 1, applicant_id)
+
+    def queue_delete(self, pipe: Pipeline, applicant_id: str) -> None:
+        pipe.hdel(self.bucket_key(applicant_id), applicant_id)
+
+    async def fetch(self, client: Redis, applicant_ids: Sequence[str]) -> list[bytes | None]:
+        by_bucket: dict[str, list[int]] = {}
+        for index, applicant_id in enumerate(applicant_ids):
+            by_bucket.setdefault(self.bucket_key(applicant_id), []).append(index)
+        if len(by_bucket) == 1:
+            ((key, indexes),) = by_bucket.items()
+            return cast(
+                list[bytes | None], await client.hmget(key, [applicant_ids[i] for i in indexes])
+            )
+
+        async with client.pipeline(transaction=False) as pipe:
+            for key, indexes in by_bucket.items():
+                pipe.hmget(key, [applicant_ids[i] for i in indexes])
+            responses = await pipe.execute()
+        payloads: list[bytes | None] = [None] * len(applicant_ids)
+        for indexes, values in zip(by_bucket.values(), responses):
+            for index, value in zip(indexes, values):
+                payloads[index] = value
+        return payloads
+
+    async def scan_ids(self, client: Redis, count: int) -> AsyncIterator[list[str]]:
+        async for key in client.scan_iter(match=f"{self._prefix}:*", count=count, _type="hash"):
+            fields = await client.hkeys(key)
+            if fields:
+                yield [f.decode("utf-8") if isinstance(f, bytes) else f for f in fields]
@@ -0,0 +1,65 @@
+"""Bounded in-process cache tier for hot application snapshots."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable, Tuple
+
+from ...domain import LoanApplication
+
+
+class LocalStatusCache:
+    """Size-capped LRU cache with a fixed, short TTL.
+
+    Intended to sit in front of a shared cache such as Redis so repeated reads
+    from the same worker are served without a network round trip. The API is
+    synchronous on purpose: lookups never yield to the event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive.")
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, Tuple[LoanApplication, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, applicant_id: str) -> LoanApplication | None:
+        entry = self._entries.get(applicant_id)
+        if entry is None:
+            return None
+        application, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[applicant_id]
+            return None
+        self._entries.move_to_end(applicant_id)
+        return application
+
+    def put(self, application: LoanApplication) -> None:
+        self._entries[application.applicant_id] = (application, self._clock() + self._ttl_seconds)
+        self._entries.move_to_end(application.applicant_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def put_many(self, applications: Iterable[LoanApplication]) -> None:
+        for application in applications:
+            self.put(application)
+
+    def invalidate(self, applicant_id: str) -> None:
+        self._entries.pop(applicant_id, None)
+
+    def invalidate_many(self, applicant_ids: Iterable[str]) -> None:
+        for applicant_id in applicant_ids:
+            self._entries.pop(applicant_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -2,45 +2,158 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime
-from decimal import Decimal
-from typing import Final
+from typing import Final, Iterator, Sequence, TypeVar
 
 from redis.asyncio import Redis, from_url
 
-from ...application.ports import ApplicationStatusCache
-from ...domain import ApplicationStatus, LoanApplication
+from ...application.ports import ApplicationStatusCache, CacheLookup, CacheMarker
+from ...domain import LoanApplication
+from .codecs import JsonSnapshotCodec, SnapshotCodec
+from .key_layouts import CacheKeyLayout, StringKeyLayout
 
 LOGGER: Final = logging.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE: Final = 500
+
+# Stored in place of a snapshot to remember that an applicant does not exist.
+# It can never collide with a serialized snapshot.
+_ABSENT_PAYLOAD: Final = b"-"
+
+_T = TypeVar("_T")
+
 
 def create_redis_client(url: str) -> Redis:
-    """Factory to build a Redis client from the connection URL."""
-    return from_url(url, decode_responses=True)
+    """Factory to build a Redis client from the connection URL.
 
+    Responses are returned as raw bytes so binary snapshot codecs round-trip.
+    """
+    return from_url(url, decode_responses=False)
 
-class RedisStatusCache(ApplicationStatusCache):
-    """Persistence-backed cache using Redis."""
 
-    def __init__(self, client: Redis) -> None:
+class RedisStatusCache(ApplicationStatusCache):
+    """Persistence-backed cache using Redis.
+
+    Multi-key operations are split into chunks of ``batch_size`` keys so a
+    single pipeline or ``MGET`` never monopolises the Redis event loop.
+    Snapshots are stored with ``codec`` (JSON by default); entries
+    written in any other supported format are still readable. ``layout``
+    decides where each snapshot lives (one key per applicant by default).
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        codec: SnapshotCodec | None = None,
+        layout: CacheKeyLayout | None = None,
+    ) -> None:
         self._client = client
+        self._batch_size = max(1, batch_size)
+        self._codec = codec or JsonSnapshotCodec()
+        self._layout = layout or StringKeyLayout()
 
     async def set(self, application: LoanApplication, ttl_seconds: int) -> None:
-        payload = _serialize(application)
-        await self._client.set(application.applicant_id, payload, ex=ttl_seconds)
+        await self.set_many([application], ttl_seconds)
 
     async def get(self, applicant_id: str) -> LoanApplication | None:
-        payload = await self._client.get(applicant_id)
+        entry = await self.lookup(applicant_id)
+        return entry if isinstance(entry, LoanApplication) else None
+
+    async def set_many(self, applications: Sequence[LoanApplication], ttl_seconds: int) -> None:
+        for chunk in _chunks(applications, self._batch_size):
+            async with self._client.pipeline(transaction=False) as pipe:
+                for application in chunk:
+                    self._layout.queue_set(
+                        pipe, application.applicant_id, self._codec.encode(application), ttl_seconds
+                    )
+                await pipe.execute()
+
+    async def get_many(self, applicant_ids: Sequence[str]) -> dict[str, LoanApplication]:
+        return {
+            applicant_id: entry
+            for applicant_id, entry in (await self.lookup_many(applicant_ids)).items()
+            if isinstance(entry, LoanApplication)
+        }
+
+    async def lookup(self, applicant_id: str) -> CacheLookup:
+        (payload,) = await self._layout.fetch(self._client, [applicant_id])
+        return self._decode_entry(applicant_id, payload)
+
+    async def lookup_many(
+        self, applicant_ids: Sequence[str]
+    ) -> dict[str, LoanApplication | CacheMarker]:
+        found: dict[str, LoanApplication | CacheMarker] = {}
+        for chunk in _chunks(list(dict.fromkeys(applicant_ids)), self._batch_size):
+            payloads = await self._layout.fetch(self._client, chunk)
+            for applicant_id, payload in zip(chunk, payloads):
+                entry = self._decode_entry(applicant_id, payload)
+                if entry is not None:
+                    found[applicant_id] = entry
+        return found
+
+    async def mark_absent(self, applicant_ids: Sequence[str], ttl_seconds: int) -> None:
+        # NX keeps a snapshot written concurrently by another process from
+        # being shadowed by a stale "not found" result.
+        for chunk in _chunks(applicant_ids, self._batch_size):
+            async with self._client.pipeline(transaction=False) as pipe:
+                for applicant_id in chunk:
+                    self._layout.queue_set(
+                        pipe, applicant_id, _ABSENT_PAYLOAD, ttl_seconds, only_if_absent=True
+                    )
+                await pipe.execute()
+
+    async def migrate_from(
+        self,
+        source: CacheKeyLayout,
+        ttl_seconds: int,
+        *,
+        delete_source: bool = False,
+    ) -> int:
+        """Copy snapshots stored under ``source`` into this cache's layout.
+
+        Entries are re-encoded with the configured codec and given a fresh
+        ``ttl_seconds``. Negative entries and payloads that do not decode as
+        snapshots (e.g. unrelated keys) are skipped. Returns the number of
+        snapshots copied.
+        """
+        migrated = 0
+        async for applicant_ids in source.scan_ids(self._client, self._batch_size):
+            payloads = await source.fetch(self._client, applicant_ids)
+            snapshots = [
+                snapshot
+                for applicant_id, payload in zip(applicant_ids, payloads)
+                if (snapshot := self._try_decode(payload)) is not None
+                and snapshot.applicant_id == applicant_id
+            ]
+            await self.set_many(snapshots, ttl_seconds)
+            if delete_source and snapshots:
+                async with self._client.pipeline(transaction=False) as pipe:
+                    for application in snapshots:
+                        source.queue_delete(pipe, application.applicant_id)
+                    await pipe.execute()
+            migrated += len(snapshots)
+        return migrated
+
+    def _decode_entry(self, applicant_id: str, payload: bytes | None) -> CacheLookup:
         if payload is None:
             return None
+        if payload == _ABSENT_PAYLOAD:
+            return CacheMarker.ABSENT
         try:
-            return _deserialize(payload)
+            return self._codec.decode(payload)
         except Exception as exc:  # pragma: no cover - defensive logging
             LOGGER.warning("Failed to deserialize cached application for %s: %s", applicant_id, exc)
             return None
 
+    def _try_decode(self, payload: bytes | None) -> LoanApplication | None:
+        if not payload or payload == _ABSENT_PAYLOAD:
+            return None
+        try:
+            return self._codec.decode(payload)
+        except Exception:
+            return None
+
     async def close(self) -> None:
         try:
             await self._client.aclose()
@@ -48,26 +161,6 @@ class RedisStatusCache(ApplicationStatusCache):
             LOGGER.exception("Failed closing Redis client")
 
 
-def _serialize(application: LoanApplication) -> str:
-    return json.dumps(
-        {
-            "applicant_id": application.applicant_id,
-            "amount": str(application.amount),
-            "term_months": application.term_months,
-            "status": application.status.value,
-            "created_at": application.created_at.isoformat(),
-            "updated_at": application.updated_at.isoformat(),
-        }
-    )
-
-
-def _deserialize(payload: str) -> LoanApplication:
-    data = json.loads(payload)
-    return LoanApplication(
-        applicant_id=data["applicant_id"],
-        amount=Decimal(data["amount"]),
-        term_months=int(data["term_months"]),
-        status=ApplicationStatus(data["status"]),
-        created_at=datetime.fromisoformat(data["created_at"]),
-        updated_at=datetime.fromisoformat(data["updated_at"]),
-    )
+def _chunks(items: Sequence[_T], size: int) -> Iterator[Sequence[_T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -2,6 +2,7 @@
 
 from .session import (
     Base,
+    PoolSettings,
     create_session_factory,
     dispose_engine,
     get_engine,
@@ -10,6 +11,7 @@ from .session import (
 
 __all__ = [
     "Base",
+    "PoolSettings",
     "create_session_factory",
     "dispose_engine",
     "get_engine",
@@ -0,0 +1,41 @@
+"""Prometheus metrics for the database connection pool."""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge, Histogram
+
+DB_POOL_CHECKOUT_DURATION = Histogram(
+    "loan_application_db_pool_checkout_seconds",
+    "Time spent waiting for a pooled database connection",
+    buckets=(
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+        30.0,
+    ),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "loan_application_db_pool_checkout_timeouts_total",
+    "Number of connection checkouts that gave up after DB_POOL_TIMEOUT_SECONDS",
+)
+DB_POOL_IN_USE = Gauge(
+    "loan_application_db_pool_in_use",
+    "Database connections currently checked out of the pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_IDLE = Gauge(
+    "loan_application_db_pool_idle",
+    "Open database connections currently idle in the pool",
+    multiprocess_mode="livesum",
+)
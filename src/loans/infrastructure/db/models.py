@@ -4,8 +4,19 @@ from __future__ import annotations
 
 from datetime import datetime
 from decimal import Decimal
+from typing import Any
 
-from sqlalchemy import CheckConstraint, DateTime, Integer, Numeric, String
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    DateTime,
+    Identity,
+    Integer,
+    Numeric,
+    String,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ...domain import ApplicationStatus, LoanApplication
@@ -25,7 +36,9 @@ class LoanApplicationModel(Base):
     applicant_id: Mapped[str] = mapped_column(String(255), primary_key=True)
     amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
     term_months: Mapped[int] = mapped_column(Integer, nullable=False)
-    status: Mapped[str] = mapped_column(String(32), nullable=False, default=ApplicationStatus.PENDING.value)
+    status: Mapped[str] = mapped_column(
+        String(32), nullable=False, default=ApplicationStatus.PENDING.value
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
@@ -57,3 +70,21 @@ class LoanApplicationModel(Base):
             created_at=self.created_at,
             updated_at=self.updated_at,
         )
+
+
+class OutboxEventModel(Base):
+    """Event waiting to be relayed to Kafka.
+
+    Rows are inserted in the same transaction as the application they
+    describe and deleted by the relay once the broker has acknowledged them.
+    The publisher keys each record by the ``applicant_id`` in ``payload``.
+    """
+
+    __tablename__ = "application_outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), primary_key=True)
+    topic: Mapped[str] = mapped_column(String(255), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
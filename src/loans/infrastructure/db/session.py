@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import os
+import time
+from dataclasses import dataclass
 from functools import lru_cache
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Dict
 
 from contextlib import asynccontextmanager
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -14,6 +18,14 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, PoolProxiedConnection
+
+from .metrics import (
+    DB_POOL_CHECKOUT_DURATION,
+    DB_POOL_CHECKOUT_TIMEOUTS,
+    DB_POOL_IDLE,
+    DB_POOL_IN_USE,
+)
 
 
 @lru_cache
@@ -25,6 +37,82 @@ def get_database_url() -> str:
     )
 
 
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool and asyncpg statement cache tuning.
+
+    The defaults match SQLAlchemy's and asyncpg's own, so an unconfigured
+    deployment behaves as before.
+    """
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    timeout_seconds: float = 30.0
+    recycle_seconds: int = -1
+    pre_ping: bool = False
+    statement_cache_size: int = 100
+    prepared_statement_cache_size: int = 100
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        return cls(
+            pool_size=max(1, int(os.getenv("DB_POOL_SIZE", "5"))),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+            timeout_seconds=float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30")),
+            recycle_seconds=int(os.getenv("DB_POOL_RECYCLE_SECONDS", "-1")),
+            pre_ping=os.getenv("DB_POOL_PRE_PING", "false").lower() in {"1", "true", "yes"},
+            statement_cache_size=max(0, int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))),
+            prepared_statement_cache_size=max(
+                0, int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "100"))
+            ),
+        )
+
+    def engine_options(self, url: str) -> Dict[str, Any]:
+        """Keyword arguments for ``create_async_engine``."""
+        options: Dict[str, Any] = {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.timeout_seconds,
+            "pool_recycle": self.recycle_seconds,
+            "pool_pre_ping": self.pre_ping,
+        }
+        if make_url(url).get_driver_name() == "asyncpg":
+            # statement_cache_size goes to asyncpg itself; prepared_statement_cache_size
+            # sizes SQLAlchemy's per-connection cache of prepared statements.
+            options["connect_args"] = {
+                "statement_cache_size": self.statement_cache_size,
+                "prepared_statement_cache_size": self.prepared_statement_cache_size,
+            }
+        return options
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records checkout wait time and connection usage."""
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_DURATION.observe(time.perf_counter() - started)
+        self._report_usage()
+        return connection
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)
+        self._report_usage()
+
+    def _report_usage(self) -> None:
+        # Pushed on every checkout/checkin rather than read on scrape, so the values
+        # also reach the multiprocess collector of a supervised processor.
+        DB_POOL_IN_USE.set(self.checkedout())
+        DB_POOL_IDLE.set(self.checkedin())
+
+
 class Base(DeclarativeBase):
     """Base class for declarative ORM models."""
 
@@ -34,10 +122,13 @@ _session_factory: async_sessionmaker[AsyncSession] | None = None
 
 
 def get_engine() -> AsyncEngine:
-    """Return a singleton async engine."""
+    """Return a singleton async engine configured from :meth:`PoolSettings.from_env`."""
     global _engine
     if _engine is None:
-        _engine = create_async_engine(get_database_url(), echo=False, future=True)
+        url = get_database_url()
+        _engine = create_async_engine(
+            url, echo=False, future=True, **PoolSettings.from_env().engine_options(url)
+        )
     return _engine
 
 
@@ -0,0 +1,194 @@
+"""Timing and error metrics around the repository, cache and publisher ports.
+
+Each wrapper delegates to the adapter it wraps and records one histogram
+sample per call, labelled with the port, the backend and the operation, plus
+an error counter by exception type. The status cache wrapper can also count
+lookups by result as the shared ``l2`` tier of ``CACHE_LOOKUPS``; the
+container turns that off because the cached repository counts both tiers.
+When instrumentation is disabled the container simply does not wrap the
+adapters, so there is no overhead at all.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Awaitable, Dict, Iterable, Sequence, TypeVar
+
+from prometheus_client import Counter, Histogram
+
+from ..application.ports import (
+    ApplicationEventPublisher,
+    ApplicationMessage,
+    ApplicationStatusCache,
+    CacheLookup,
+    CacheMarker,
+    LoanApplicationRepository,
+)
+from ..domain import LoanApplication
+
+T = TypeVar("T")
+
+ADAPTER_OPERATION_DURATION = Histogram(
+    "loan_application_adapter_operation_seconds",
+    "Time spent in repository, cache and publisher operations",
+    labelnames=("port", "backend", "operation"),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+ADAPTER_OPERATION_ERRORS = Counter(
+    "loan_application_adapter_operation_errors_total",
+    "Repository, cache and publisher operations that raised",
+    labelnames=("port", "backend", "operation", "error"),
+)
+CACHE_LOOKUPS = Counter(
+    "loan_application_cache_lookups_total",
+    "Status cache lookups per key by cache tier and result (hit, miss or absent)",
+    labelnames=("tier", "backend", "result"),
+)
+
+
+class _Timer:
+    """Per-adapter operation timer with pre-bound histogram children."""
+
+    def __init__(self, port: str, backend: str) -> None:
+        self._port = port
+        self._backend = backend
+        self._histograms: Dict[str, Any] = {}
+
+    async def measure(self, operation: str, call: Awaitable[T]) -> T:
+        histogram = self._histograms.get(operation)
+        if histogram is None:
+            histogram = ADAPTER_OPERATION_DURATION.labels(self._port, self._backend, operation)
+            self._histograms[operation] = histogram
+        started = time.perf_counter()
+        try:
+            return await call
+        except Exception as exc:
+            ADAPTER_OPERATION_ERRORS.labels(
+                self._port, self._backend, operation, type(exc).__name__
+            ).inc()
+            raise
+        finally:
+            histogram.observe(time.perf_counter() - started)
+
+
+class InstrumentedLoanApplicationRepository(LoanApplicationRepository):
+    """Time every call made to the wrapped repository."""
+
+    def __init__(self, inner: LoanApplicationRepository, backend: str) -> None:
+        self._inner = inner
+        self._timer = _Timer("repository", backend)
+
+    async def create(self, application: LoanApplication) -> None:
+        await self._timer.measure("create", self._inner.create(application))
+
+    async def upsert(self, application: LoanApplication) -> None:
+        await self._timer.measure("upsert", self._inner.upsert(application))
+
+    async def get_latest(self, applicant_id: str) -> LoanApplication | None:
+        return await self._timer.measure("get_latest", self._inner.get_latest(applicant_id))
+
+    async def create_many(self, applications: Sequence[LoanApplication]) -> list[str]:
+        return await self._timer.measure("create_many", self._inner.create_many(applications))
+
+    async def upsert_many(self, applications: Sequence[LoanApplication]) -> None:
+        await self._timer.measure("upsert_many", self._inner.upsert_many(applications))
+
+    async def record_decisions(
+        self, applications: Sequence[LoanApplication]
+    ) -> list[LoanApplication]:
+        return await self._timer.measure(
+            "record_decisions", self._inner.record_decisions(applications)
+        )
+
+    async def get_latest_many(self, applicant_ids: Sequence[str]) -> dict[str, LoanApplication]:
+        return await self._timer.measure(
+            "get_latest_many", self._inner.get_latest_many(applicant_ids)
+        )
+
+
+class InstrumentedStatusCache(ApplicationStatusCache):
+    """Time every call made to the wrapped cache and count hits and misses."""
+
+    def __init__(
+        self, inner: ApplicationStatusCache, backend: str, count_lookups: bool = True
+    ) -> None:
+        self._inner = inner
+        self._timer = _Timer("cache", backend)
+        self._count_lookups = count_lookups
+        self._hits = CACHE_LOOKUPS.labels("l2", backend, "hit")
+        self._misses = CACHE_LOOKUPS.labels("l2", backend, "miss")
+        self._absent = CACHE_LOOKUPS.labels("l2", backend, "absent")
+
+    async def set(self, application: LoanApplication, ttl_seconds: int) -> None:
+        await self._timer.measure("set", self._inner.set(application, ttl_seconds))
+
+    async def get(self, applicant_id: str) -> LoanApplication | None:
+        found = await self._timer.measure("get", self._inner.get(applicant_id))
+        if self._count_lookups:
+            self._count([found])
+        return found
+
+    async def set_many(self, applications: Sequence[LoanApplication], ttl_seconds: int) -> None:
+        await self._timer.measure("set_many", self._inner.set_many(applications, ttl_seconds))
+
+    async def get_many(self, applicant_ids: Sequence[str]) -> dict[str, LoanApplication]:
+        found = await self._timer.measure("get_many", self._inner.get_many(applicant_ids))
+        if self._count_lookups:
+            self._count_many(len(set(applicant_ids)), found.values())
+        return found
+
+    async def lookup(self, applicant_id: str) -> CacheLookup:
+        found = await self._timer.measure("lookup", self._inner.lookup(applicant_id))
+        if self._count_lookups:
+            self._count([found])
+        return found
+
+    async def lookup_many(
+        self, applicant_ids: Sequence[str]
+    ) -> dict[str, LoanApplication | CacheMarker]:
+        found = await self._timer.measure("lookup_many", self._inner.lookup_many(applicant_ids))
+        if self._count_lookups:
+            self._count_many(len(set(applicant_ids)), found.values())
+        return found
+
+    async def mark_absent(self, applicant_ids: Sequence[str], ttl_seconds: int) -> None:
+        await self._timer.measure(
+            "mark_absent", self._inner.mark_absent(applicant_ids, ttl_seconds)
+        )
+
+    def _count(self, entries: Iterable[CacheLookup]) -> None:
+        for entry in entries:
+            if entry is None:
+                self._misses.inc()
+            elif entry is CacheMarker.ABSENT:
+                self._absent.inc()
+            else:
+                self._hits.inc()
+
+    def _count_many(self, requested: int, entries: Iterable[LoanApplication | CacheMarker]) -> None:
+        found = 0
+        absent = 0
+        for entry in entries:
+            found += 1
+            if entry is CacheMarker.ABSENT:
+                absent += 1
+        if found > absent:
+            self._hits.inc(found - absent)
+        if absent:
+            self._absent.inc(absent)
+        if requested > found:
+            self._misses.inc(requested - found)
+
+
+class InstrumentedEventPublisher(ApplicationEventPublisher):
+    """Time every publish made through the wrapped publisher."""
+
+    def __init__(self, inner: ApplicationEventPublisher, backend: str) -> None:
+        self._inner = inner
+        self._timer = _Timer("publisher", backend)
+
+    async def publish(self, topic: str, message: ApplicationMessage) -> None:
+        await self._timer.measure("publish", self._inner.publish(topic, message))
+
+    async def publish_many(self, topic: str, messages: Sequence[ApplicationMessage]) -> None:
+        await self._timer.measure("publish_many", self._inner.publish_many(topic, messages))
@@ -1,6 +1,35 @@
 """Messaging adapters for loan application events."""
 
 from .in_memory import InMemoryApplicationEventPublisher
-from .kafka import KafkaApplicationEventPublisher, build_producer
+from .kafka import (
+    KafkaApplicationEventPublisher,
+    build_partitioner,
+    build_producer,
+    parse_acks,
+    parse_compression_type,
+)
+from .outbox import OutboxEventPublisher, OutboxRelay, enqueue_statement
+from .status_changes import (
+    InMemoryStatusChangeBus,
+    RedisStatusChangeBus,
+    StatusSubscription,
+    StatusWatchRegistry,
+    WatchCapacityError,
+)
 
-__all__ = ["InMemoryApplicationEventPublisher", "KafkaApplicationEventPublisher", "build_producer"]
+__all__ = [
+    "InMemoryApplicationEventPublisher",
+    "InMemoryStatusChangeBus",
+    "KafkaApplicationEventPublisher",
+    "OutboxEventPublisher",
+    "OutboxRelay",
+    "RedisStatusChangeBus",
+    "StatusSubscription",
+    "StatusWatchRegistry",
+    "WatchCapacityError",
+    "build_partitioner",
+    "build_producer",
+    "enqueue_statement",
+    "parse_acks",
+    "parse_compression_type",
+]
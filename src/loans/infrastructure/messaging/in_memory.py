@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict, deque
-from typing import DefaultDict, Deque, List
+from typing import DefaultDict, Deque, List, Sequence
 
 from ...application.ports import ApplicationEventPublisher, ApplicationMessage
 
@@ -17,6 +17,9 @@ class InMemoryApplicationEventPublisher(ApplicationEventPublisher):
     async def publish(self, topic: str, message: ApplicationMessage) -> None:
         self._messages[topic].append(message)
 
+    async def publish_many(self, topic: str, messages: Sequence[ApplicationMessage]) -> None:
+        self._messages[topic].extend(messages)
+
     def get_messages(self, topic: str) -> List[ApplicationMessage]:
         return list(self._messages.get(topic, []))
 
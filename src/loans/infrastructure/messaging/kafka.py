@@ -3,33 +3,120 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from typing import Any, Final, Mapping
+import time
+import zlib
+from typing import Any, Callable, Final, Literal, Mapping, Sequence, Set, cast, get_args
 
 from aiokafka import AIOKafkaProducer
+from aiokafka.partitioner import DefaultPartitioner
 
 from ...application.ports import ApplicationEventPublisher, ApplicationMessage
+from ...utils import json_codec
+from .metrics import PUBLISH_DELIVERY_DURATION, PUBLISH_DELIVERY_FAILURES, PUBLISH_PENDING
 
 LOGGER: Final = logging.getLogger(__name__)
 
-
-def build_producer(bootstrap_servers: str, client_id: str | None = None) -> AIOKafkaProducer:
-    """Create an AIOKafkaProducer with JSON serialization."""
+CompressionType = Literal["gzip", "snappy", "lz4", "zstd"]
+Acks = Literal[0, 1, "all"]
+PartitionerName = Literal["murmur2", "crc32"]
+Partitioner = Callable[[bytes | None, list[int], list[int]], int]
+DeliveryFailureCallback = Callable[[str, ApplicationMessage, BaseException], None]
+
+
+def crc32_partitioner(key: bytes | None, all_partitions: list[int], available: list[int]) -> int:
+    """Pick a partition by CRC32 of the key, as librdkafka's ``consistent`` partitioner does."""
+    if key is None:
+        partition: int = DefaultPartitioner()(key, all_partitions, available)
+        return partition
+    return all_partitions[zlib.crc32(key) % len(all_partitions)]
+
+
+def build_partitioner(name: PartitionerName) -> Partitioner:
+    """Return the partitioner for ``name``; ``murmur2`` matches the Java client."""
+    if name == "crc32":
+        return crc32_partitioner
+    partitioner: Partitioner = DefaultPartitioner()
+    return partitioner
+
+
+def parse_compression_type(value: str) -> CompressionType | None:
+    """Validate a ``KAFKA_COMPRESSION_TYPE`` value; empty or ``none`` disables compression."""
+    normalized = value.strip().lower()
+    if normalized in {"", "none"}:
+        return None
+    if normalized not in get_args(CompressionType):
+        raise ValueError(
+            f"KAFKA_COMPRESSION_TYPE must be gzip, snappy, lz4, zstd or none, not {value!r}."
+        )
+    return cast(CompressionType, normalized)
+
+
+def parse_acks(value: str) -> Acks:
+    """Validate a ``KAFKA_ACKS`` value: ``0``, ``1`` or ``all`` (``-1`` is accepted for ``all``)."""
+    normalized = value.strip().lower()
+    if normalized in {"all", "-1"}:
+        return "all"
+    if normalized == "0":
+        return 0
+    if normalized == "1":
+        return 1
+    raise ValueError(f"KAFKA_ACKS must be 0, 1 or all, not {value!r}.")
+
+
+def build_producer(
+    bootstrap_servers: str,
+    client_id: str | None = None,
+    *,
+    linger_ms: int = 0,
+    max_batch_size: int = 16384,
+    compression_type: CompressionType | None = None,
+    acks: Acks = 1,
+    partitioner: Partitioner | None = None,
+) -> AIOKafkaProducer:
+    """Create an AIOKafkaProducer with JSON serialization.
+
+    Records are keyed by applicant id, so ``partitioner`` decides which
+    partition (and therefore which ordered consumer lane) owns an applicant.
+
+    ``lz4``/``snappy``/``zstd`` compression need the matching aiokafka extra installed.
+    """
     return AIOKafkaProducer(
         bootstrap_servers=bootstrap_servers,
         client_id=client_id,
-        value_serializer=lambda v: json.dumps(v).encode("utf-8"),
+        value_serializer=json_codec.dumps,
+        linger_ms=linger_ms,
+        max_batch_size=max_batch_size,
+        compression_type=compression_type,
+        acks=acks,
+        partitioner=partitioner or DefaultPartitioner(),
     )
 
 
 class KafkaApplicationEventPublisher(ApplicationEventPublisher):
-    """Publish application messages to Kafka."""
-
-    def __init__(self, producer_factory: callable[[], AIOKafkaProducer]) -> None:
+    """Publish application messages to Kafka.
+
+    By default ``publish`` waits for the broker acknowledgement. With
+    ``wait_for_delivery=False`` it only enqueues the record in the producer's
+    batch buffer and tracks the delivery in the background; failures are
+    logged, counted and passed to ``on_delivery_failure``.
+    """
+
+    def __init__(
+        self,
+        producer_factory: callable[[], AIOKafkaProducer],
+        *,
+        wait_for_delivery: bool = True,
+        on_delivery_failure: DeliveryFailureCallback | None = None,
+        drain_timeout_seconds: float = 10.0,
+    ) -> None:
         self._producer_factory = producer_factory
         self._producer: AIOKafkaProducer | None = None
         self._lock = asyncio.Lock()
+        self._wait_for_delivery = wait_for_delivery
+        self._on_delivery_failure = on_delivery_failure
+        self._drain_timeout_seconds = drain_timeout_seconds
+        self._pending: Set[asyncio.Future[Any]] = set()
 
     async def _ensure_producer(self) -> AIOKafkaProducer:
         if self._producer is not None:
@@ -43,21 +130,98 @@ class KafkaApplicationEventPublisher(ApplicationEventPublisher):
         assert self._producer is not None  # for type-checkers
         return self._producer
 
+    @property
+    def pending_deliveries(self) -> int:
+        return len(self._pending)
+
     async def publish(self, topic: str, message: ApplicationMessage) -> None:
+        delivery = await self.send(topic, message)
+        if self._wait_for_delivery:
+            await delivery
+
+    async def publish_many(self, topic: str, messages: Sequence[ApplicationMessage]) -> None:
+        """Enqueue every message before awaiting any ack, so they share producer batches."""
+        deliveries = [await self.send(topic, message) for message in messages]
+        if self._wait_for_delivery and deliveries:
+            await asyncio.gather(*deliveries)
+
+    async def send(self, topic: str, message: ApplicationMessage) -> asyncio.Future[Any]:
+        """Enqueue ``message`` and return the future resolved on broker acknowledgement."""
         producer = await self._ensure_producer()
         payload = _message_to_mapping(message)
-        await producer.send_and_wait(topic, payload)
+        delivery: asyncio.Future[Any] = await producer.send(
+            topic, payload, key=message.applicant_id.encode("utf-8")
+        )
+        started = time.perf_counter()
+
+        self._pending.add(delivery)
+        PUBLISH_PENDING.inc()
+        delivery.add_done_callback(
+            lambda future: self._delivery_done(future, topic, message, started)
+        )
+        return delivery
+
+    async def drain(self, timeout_seconds: float | None = None) -> None:
+        """Wait until every tracked send has been acknowledged or failed."""
+        if not self._pending:
+            return
+        if self._producer is not None:
+            await self._producer.flush()
+        _, still_pending = await asyncio.wait(
+            set(self._pending),
+            timeout=self._drain_timeout_seconds if timeout_seconds is None else timeout_seconds,
+        )
+        if still_pending:
+            LOGGER.warning(
+                "kafka_drain_timed_out",
+                extra={"extra_data": {"pending": len(still_pending)}},
+            )
 
     async def close(self) -> None:
         if self._producer is None:
             return
         try:
+            await self.drain()
             await self._producer.stop()
         except Exception:  # pragma: no cover - defensive
             LOGGER.exception("Failed stopping Kafka producer")
         finally:
             self._producer = None
 
+    def _delivery_done(
+        self,
+        delivery: asyncio.Future[Any],
+        topic: str,
+        message: ApplicationMessage,
+        started: float,
+    ) -> None:
+        self._pending.discard(delivery)
+        PUBLISH_PENDING.dec()
+        if delivery.cancelled():
+            error: BaseException | None = asyncio.CancelledError()
+        else:
+            error = delivery.exception()
+        if error is None:
+            PUBLISH_DELIVERY_DURATION.observe(time.perf_counter() - started)
+            return
+
+        PUBLISH_DELIVERY_FAILURES.labels(topic=topic).inc()
+        LOGGER.error(
+            "kafka_delivery_failed",
+            extra={
+                "extra_data": {
+                    "topic": topic,
+                    "applicant_id": message.applicant_id,
+                    "error": repr(error),
+                }
+            },
+        )
+        if self._on_delivery_failure is not None:
+            try:
+                self._on_delivery_failure(topic, message, error)
+            except Exception:  # pragma: no cover - defensive
+                LOGGER.exception("Delivery failure callback raised")
+
 
 def _message_to_mapping(message: ApplicationMessage) -> Mapping[str, Any]:
     return {
@@ -0,0 +1,29 @@
+"""Prometheus metrics for outgoing application events."""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge, Histogram
+
+PUBLISH_DELIVERY_FAILURES = Counter(
+    "loan_application_publish_failures_total",
+    "Number of application events the broker failed to acknowledge",
+    labelnames=("topic",),
+)
+PUBLISH_PENDING = Gauge(
+    "loan_application_publish_pending",
+    "Application events handed to the producer and still awaiting acknowledgement",
+    multiprocess_mode="livesum",
+)
+PUBLISH_DELIVERY_DURATION = Histogram(
+    "loan_application_publish_delivery_seconds",
+    "Time from handing an application event to the producer until the broker acknowledged it",
+)
+OUTBOX_RELAYED = Counter(
+    "loan_application_outbox_relayed_total",
+    "Number of outbox events published to Kafka and removed from the outbox",
+)
+OUTBOX_RELAY_BATCH_SIZE = Histogram(
+    "loan_application_outbox_relay_batch_records",
+    "Number of outbox events claimed per relay batch",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000),
+)
@@ -0,0 +1,129 @@
+"""Transactional outbox for application events.
+
+With the outbox enabled, the PostgreSQL repository inserts one outbox row per
+submitted application in the same transaction as the application itself, so
+an accepted submission can never lose its event (and no event exists for a
+submission that rolled back). :class:`OutboxRelay` drains the table to Kafka
+in bulk.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from decimal import Decimal
+from typing import Any, Dict, Final, List, Mapping, Sequence
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ...application.ports import ApplicationEventPublisher, ApplicationMessage
+from ...domain import LoanApplication
+from ..db.models import OutboxEventModel
+from .metrics import OUTBOX_RELAY_BATCH_SIZE, OUTBOX_RELAYED
+
+LOGGER: Final = logging.getLogger(__name__)
+
+
+def enqueue_statement(topic: str, applications: Sequence[LoanApplication]) -> Insert:
+    """Multi-row insert of the submission events for ``applications``."""
+    return insert(OutboxEventModel).values(
+        [
+            {
+                "topic": topic,
+                "payload": {
+                    "applicant_id": application.applicant_id,
+                    "amount": str(application.amount),
+                    "term_months": application.term_months,
+                },
+            }
+            for application in applications
+        ]
+    )
+
+
+class OutboxEventPublisher(ApplicationEventPublisher):
+    """Publisher used when events travel through the outbox.
+
+    The repository already wrote the event inside the submission transaction,
+    so there is nothing left to do on the request path.
+    """
+
+    async def publish(self, topic: str, message: ApplicationMessage) -> None:
+        return None
+
+    async def publish_many(self, topic: str, messages: Sequence[ApplicationMessage]) -> None:
+        return None
+
+
+class OutboxRelay:
+    """Move outbox rows to Kafka in large batches.
+
+    Each batch is claimed with ``SELECT ... FOR UPDATE SKIP LOCKED``,
+    published through ``publisher`` (which must wait for broker
+    acknowledgements), and deleted in the same transaction. Several relays
+    can run side by side; a failed publish rolls back and the rows are
+    retried, so delivery is at least once.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        publisher: ApplicationEventPublisher,
+        batch_size: int = 1000,
+        idle_interval_seconds: float = 0.5,
+        retry_backoff_seconds: float = 1.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._publisher = publisher
+        self._batch_size = max(1, batch_size)
+        self._idle_interval_seconds = idle_interval_seconds
+        self._retry_backoff_seconds = retry_backoff_seconds
+
+    async def run(self) -> None:
+        """Relay until cancelled, sleeping only while the outbox is empty."""
+        while True:
+            try:
+                relayed = await self.relay_batch()
+            except Exception:
+                LOGGER.exception("outbox_relay_failed")
+                await asyncio.sleep(self._retry_backoff_seconds)
+                continue
+            if relayed < self._batch_size:
+                await asyncio.sleep(self._idle_interval_seconds)
+
+    async def relay_batch(self) -> int:
+        """Publish and delete one batch of outbox rows; return how many were relayed."""
+        model = OutboxEventModel
+        async with self._session_factory() as session:
+            async with session.begin():
+                result = await session.execute(
+                    select(model.id, model.topic, model.payload)
+                    .order_by(model.id)
+                    .limit(self._batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                rows = result.all()
+                if not rows:
+                    return 0
+
+                by_topic: Dict[str, List[ApplicationMessage]] = {}
+                for row in rows:
+                    by_topic.setdefault(row.topic, []).append(_to_message(row.payload))
+                for topic, messages in by_topic.items():
+                    await self._publisher.publish_many(topic, messages)
+
+                await session.execute(delete(model).where(model.id.in_([row.id for row in rows])))
+
+        OUTBOX_RELAY_BATCH_SIZE.observe(len(rows))
+        OUTBOX_RELAYED.inc(len(rows))
+        return len(rows)
+
+
+def _to_message(payload: Mapping[str, Any]) -> ApplicationMessage:
+    return ApplicationMessage(
+        applicant_id=str(payload["applicant_id"]),
+        amount=Decimal(str(payload["amount"])),
+        term_months=int(payload["term_months"]),
+    )
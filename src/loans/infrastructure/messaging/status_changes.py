@@ -0,0 +1,188 @@
+"""Fan-out of persisted status changes from the processor to API clients.
+
+The processor publishes every decision through a :class:`StatusChangeNotifier`.
+Each API instance feeds what it receives into a :class:`StatusWatchRegistry`,
+which wakes the requests watching that applicant. Watchers keep only the most
+recent snapshot, so memory per open connection stays constant no matter how
+fast updates arrive.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, Final, Sequence, Set
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from ...application.ports import StatusChangeNotifier
+from ...domain import LoanApplication
+from ..cache.codecs import BinarySnapshotCodec, SnapshotCodec, decode_snapshot
+
+LOGGER: Final = logging.getLogger(__name__)
+
+DEFAULT_STATUS_CHANNEL: Final = "loans:status-changes"
+_RECONNECT_DELAY_SECONDS: Final = 1.0
+
+
+class WatchCapacityError(RuntimeError):
+    """Raised when the registry already holds its maximum number of watchers."""
+
+
+class StatusSubscription:
+    """A single watcher of one applicant, holding at most the latest snapshot."""
+
+    def __init__(self, registry: StatusWatchRegistry, applicant_id: str) -> None:
+        self.applicant_id = applicant_id
+        self._registry = registry
+        self._latest: LoanApplication | None = None
+        self._changed = asyncio.Event()
+
+    def push(self, application: LoanApplication) -> None:
+        self._latest = application
+        self._changed.set()
+
+    async def next(self, timeout: float | None = None) -> LoanApplication | None:
+        """Wait for the next snapshot; ``None`` when ``timeout`` expires first."""
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except TimeoutError:
+            return None
+        self._changed.clear()
+        application, self._latest = self._latest, None
+        return application
+
+    def close(self) -> None:
+        self._registry._remove(self)
+
+    def __enter__(self) -> StatusSubscription:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class StatusWatchRegistry:
+    """In-process index of watchers by applicant id."""
+
+    def __init__(self, max_subscriptions: int = 10000) -> None:
+        self._max_subscriptions = max_subscriptions
+        self._subscriptions: Dict[str, Set[StatusSubscription]] = {}
+        self._count = 0
+
+    def subscribe(self, applicant_id: str) -> StatusSubscription:
+        if self._count >= self._max_subscriptions:
+            raise WatchCapacityError("Too many clients are watching application statuses.")
+        subscription = StatusSubscription(self, applicant_id)
+        self._subscriptions.setdefault(applicant_id, set()).add(subscription)
+        self._count += 1
+        return subscription
+
+    def dispatch(self, application: LoanApplication) -> None:
+        for subscription in self._subscriptions.get(application.applicant_id, ()):
+            subscription.push(application)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _remove(self, subscription: StatusSubscription) -> None:
+        watchers = self._subscriptions.get(subscription.applicant_id)
+        if watchers is None or subscription not in watchers:
+            return
+        watchers.discard(subscription)
+        self._count -= 1
+        if not watchers:
+            del self._subscriptions[subscription.applicant_id]
+
+
+class InMemoryStatusChangeBus(StatusChangeNotifier):
+    """Deliver changes straight to the local registry (single-process setups)."""
+
+    def __init__(self, registry: StatusWatchRegistry) -> None:
+        self._registry = registry
+
+    async def notify(self, applications: Sequence[LoanApplication]) -> None:
+        for application in applications:
+            self._registry.dispatch(application)
+
+
+class RedisStatusChangeBus(StatusChangeNotifier):
+    """Broadcast changes over a Redis pub/sub channel shared by all API instances.
+
+    ``notify`` publishes encoded snapshots; ``start`` runs a background
+    listener that feeds received snapshots into ``registry``. Pub/sub is
+    fire-and-forget, so clients re-read the current status when they connect
+    rather than relying on having seen every message.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        registry: StatusWatchRegistry,
+        channel: str = DEFAULT_STATUS_CHANNEL,
+        codec: SnapshotCodec | None = None,
+    ) -> None:
+        self._client = client
+        self._registry = registry
+        self._channel = channel
+        self._codec = codec or BinarySnapshotCodec()
+        self._listener: asyncio.Task[None] | None = None
+
+    async def notify(self, applications: Sequence[LoanApplication]) -> None:
+        if not applications:
+            return
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for application in applications:
+                    pipe.publish(self._channel, self._codec.encode(application))
+                await pipe.execute()
+        except RedisError:
+            LOGGER.warning(
+                "status_change_publish_failed",
+                extra={"extra_data": {"channel": self._channel, "count": len(applications)}},
+                exc_info=True,
+            )
+
+    def start(self) -> None:
+        """Start listening for changes, if not already running."""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen(), name="status-change-listener")
+
+    async def close(self) -> None:
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self._channel)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._dispatch(message["data"])
+            except RedisError:
+                LOGGER.warning(
+                    "status_change_listener_disconnected",
+                    extra={"extra_data": {"channel": self._channel}},
+                    exc_info=True,
+                )
+                await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+            finally:
+                await pubsub.aclose()
+
+    def _dispatch(self, payload: bytes) -> None:
+        try:
+            application = decode_snapshot(payload)
+        except Exception:  # pragma: no cover - defensive logging
+            LOGGER.warning(
+                "status_change_undecodable", extra={"extra_data": {"channel": self._channel}}
+            )
+            return
+        self._registry.dispatch(application)
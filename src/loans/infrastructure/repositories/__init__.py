@@ -3,9 +3,11 @@
 from .cached_repository import CachedLoanApplicationRepository
 from .in_memory_applications import InMemoryLoanApplicationRepository
 from .postgres_applications import PostgresLoanApplicationRepository
+from .write_behind import WriteBehindLoanApplicationRepository
 
 __all__ = [
     "CachedLoanApplicationRepository",
     "InMemoryLoanApplicationRepository",
     "PostgresLoanApplicationRepository",
+    "WriteBehindLoanApplicationRepository",
 ]
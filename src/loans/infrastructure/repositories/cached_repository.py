@@ -2,36 +2,254 @@
 
 from __future__ import annotations
 
-from ...application.ports import ApplicationStatusCache, LoanApplicationRepository
+import asyncio
+import logging
+import random
+from datetime import datetime, timezone
+from typing import Final, Iterable, Sequence
+
+from prometheus_client import Histogram
+
+from ...application.ports import ApplicationStatusCache, CacheMarker, LoanApplicationRepository
 from ...domain import LoanApplication
+from ...utils.concurrency import MicroBatcher, SingleFlight
+from ..cache.local_status_cache import LocalStatusCache
+from ..instrumentation import CACHE_LOOKUPS
+from .metrics import (
+    CACHE_BACKFILLS,
+    CACHE_CONSISTENCY_CHECKS,
+    CACHE_SNAPSHOT_AGE,
+    CACHE_STALENESS,
+)
+
+LOGGER: Final = logging.getLogger(__name__)
+
+_L1_HITS: Final = CACHE_LOOKUPS.labels("l1", "local", "hit")
+_L1_MISSES: Final = CACHE_LOOKUPS.labels("l1", "local", "miss")
+_L1_AGE: Final = CACHE_SNAPSHOT_AGE.labels("l1")
+_L2_AGE: Final = CACHE_SNAPSHOT_AGE.labels("l2")
+_BACKFILL_FOUND: Final = CACHE_BACKFILLS.labels("found")
+_BACKFILL_ABSENT: Final = CACHE_BACKFILLS.labels("absent")
+_CONSISTENT: Final = CACHE_CONSISTENCY_CHECKS.labels("consistent")
+_STALE: Final = CACHE_CONSISTENCY_CHECKS.labels("stale")
+_MISSING: Final = CACHE_CONSISTENCY_CHECKS.labels("missing")
+_CHECK_FAILED: Final = CACHE_CONSISTENCY_CHECKS.labels("error")
+_MAX_CONSISTENCY_CHECKS: Final = 8
 
 
 class CachedLoanApplicationRepository(LoanApplicationRepository):
-    """Repository decorator that caches loan applications after reads/writes."""
+    """Repository decorator that caches loan applications after reads/writes.
+
+    Reads consult an optional in-process ``local_cache`` first, then the shared
+    ``cache``, then the backing repository. Writes made by this process evict
+    the local entry so the next read picks up the fresh shared snapshot.
+
+    Cache misses are single-flighted per applicant, so concurrent readers of a
+    cold key share one backing lookup. With ``miss_batch_window_seconds`` set,
+    misses for different applicants arriving within that window are merged
+    into one ``get_latest_many`` call.
+
+    With ``negative_ttl_seconds`` set, applicants missing from the backing
+    store are remembered as absent for that long, so repeated polls for an
+    unknown id stop reaching the database. Writes overwrite those entries.
+
+    Lookups are counted in ``CACHE_LOOKUPS`` per tier (``l1`` local, ``l2``
+    shared, labelled with ``cache_backend``), misses resolved from the backing
+    store are counted as backfills, and the age of every snapshot served from
+    a cache is recorded. With
+    ``consistency_sample_rate`` set, that fraction of shared-cache hits is
+    compared against the backing store in the background, at most
+    ``_MAX_CONSISTENCY_CHECKS`` at a time, to measure staleness.
+    """
 
     def __init__(
         self,
         backing: LoanApplicationRepository,
         cache: ApplicationStatusCache,
         cache_ttl_seconds: int,
+        local_cache: LocalStatusCache | None = None,
+        miss_batch_window_seconds: float = 0.0,
+        miss_batch_max_size: int = 100,
+        negative_ttl_seconds: int = 0,
+        consistency_sample_rate: float = 0.0,
+        cache_backend: str = "shared",
     ) -> None:
         self._backing = backing
         self._cache = cache
         self._cache_ttl_seconds = cache_ttl_seconds
+        self._local_cache = local_cache
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._inflight: SingleFlight[str, LoanApplication | None] = SingleFlight()
+        self._miss_batcher: MicroBatcher[str, LoanApplication] | None = (
+            MicroBatcher(self._load_missing_many, miss_batch_window_seconds, miss_batch_max_size)
+            if miss_batch_window_seconds > 0
+            else None
+        )
+        self._consistency_sample_rate = consistency_sample_rate
+        self._consistency_checks: set[asyncio.Task[None]] = set()
+        self._l2_hits = CACHE_LOOKUPS.labels("l2", cache_backend, "hit")
+        self._l2_misses = CACHE_LOOKUPS.labels("l2", cache_backend, "miss")
+        self._l2_absent = CACHE_LOOKUPS.labels("l2", cache_backend, "absent")
 
     async def create(self, application: LoanApplication) -> None:
         await self._backing.create(application)
+        self._invalidate_local([application.applicant_id])
         await self._cache.set(application, ttl_seconds=self._cache_ttl_seconds)
 
     async def upsert(self, application: LoanApplication) -> None:
         await self._backing.upsert(application)
+        self._invalidate_local([application.applicant_id])
         await self._cache.set(application, ttl_seconds=self._cache_ttl_seconds)
 
     async def get_latest(self, applicant_id: str) -> LoanApplication | None:
-        cached = await self._cache.get(applicant_id)
-        if cached:
+        if self._local_cache is not None:
+            local = self._local_cache.get(applicant_id)
+            if local is not None:
+                _L1_HITS.inc()
+                _observe_age(_L1_AGE, [local])
+                return local
+            _L1_MISSES.inc()
+        cached = await self._cache.lookup(applicant_id)
+        if cached is CacheMarker.ABSENT:
+            self._l2_absent.inc()
+            return None
+        if isinstance(cached, LoanApplication):
+            self._l2_hits.inc()
+            _observe_age(_L2_AGE, [cached])
+            self._sample_consistency([cached])
+            self._remember_local([cached])
             return cached
+        self._l2_misses.inc()
+        return await self._inflight.do(applicant_id, lambda: self._load_missing(applicant_id))
+
+    async def create_many(self, applications: Sequence[LoanApplication]) -> list[str]:
+        created_ids = await self._backing.create_many(applications)
+        created = set(created_ids)
+        fresh = [app for app in applications if app.applicant_id in created]
+        self._invalidate_local(app.applicant_id for app in fresh)
+        await self._cache.set_many(fresh, ttl_seconds=self._cache_ttl_seconds)
+        return created_ids
+
+    async def upsert_many(self, applications: Sequence[LoanApplication]) -> None:
+        await self._backing.upsert_many(applications)
+        latest = list({app.applicant_id: app for app in applications}.values())
+        self._invalidate_local(app.applicant_id for app in latest)
+        await self._cache.set_many(latest, ttl_seconds=self._cache_ttl_seconds)
+
+    async def record_decisions(
+        self, applications: Sequence[LoanApplication]
+    ) -> list[LoanApplication]:
+        persisted = await self._backing.record_decisions(applications)
+        self._invalidate_local(app.applicant_id for app in persisted)
+        await self._cache.set_many(persisted, ttl_seconds=self._cache_ttl_seconds)
+        return persisted
+
+    async def get_latest_many(self, applicant_ids: Sequence[str]) -> dict[str, LoanApplication]:
+        unique_ids = list(dict.fromkeys(applicant_ids))
+        found: dict[str, LoanApplication] = {}
+        if self._local_cache is not None:
+            for applicant_id in unique_ids:
+                local = self._local_cache.get(applicant_id)
+                if local is not None:
+                    found[applicant_id] = local
+            _L1_HITS.inc(len(found))
+            _L1_MISSES.inc(len(unique_ids) - len(found))
+            _observe_age(_L1_AGE, found.values())
+            unique_ids = [applicant_id for applicant_id in unique_ids if applicant_id not in found]
+            if not unique_ids:
+                return found
+
+        cached = await self._cache.lookup_many(unique_ids)
+        snapshots = {
+            applicant_id: entry
+            for applicant_id, entry in cached.items()
+            if isinstance(entry, LoanApplication)
+        }
+        misses = [applicant_id for applicant_id in unique_ids if applicant_id not in cached]
+        self._l2_hits.inc(len(snapshots))
+        self._l2_absent.inc(len(cached) - len(snapshots))
+        self._l2_misses.inc(len(misses))
+        _observe_age(_L2_AGE, snapshots.values())
+        self._sample_consistency(snapshots.values())
+        self._remember_local(snapshots.values())
+        found.update(snapshots)
+        if not misses:
+            return found
+        found.update(await self._load_missing_many(misses))
+        return found
+
+    async def _load_missing(self, applicant_id: str) -> LoanApplication | None:
+        if self._miss_batcher is not None:
+            return await self._miss_batcher.load(applicant_id)
         record = await self._backing.get_latest(applicant_id)
         if record:
+            _BACKFILL_FOUND.inc()
             await self._cache.set(record, ttl_seconds=self._cache_ttl_seconds)
+            self._remember_local([record])
+            return record
+        _BACKFILL_ABSENT.inc()
+        if self._negative_ttl_seconds > 0:
+            await self._cache.mark_absent([applicant_id], ttl_seconds=self._negative_ttl_seconds)
         return record
+
+    async def _load_missing_many(self, applicant_ids: Sequence[str]) -> dict[str, LoanApplication]:
+        records = await self._backing.get_latest_many(applicant_ids)
+        _BACKFILL_FOUND.inc(len(records))
+        _BACKFILL_ABSENT.inc(len(applicant_ids) - len(records))
+        if records:
+            await self._cache.set_many(list(records.values()), ttl_seconds=self._cache_ttl_seconds)
+            self._remember_local(records.values())
+        missing = [applicant_id for applicant_id in applicant_ids if applicant_id not in records]
+        if missing and self._negative_ttl_seconds > 0:
+            await self._cache.mark_absent(missing, ttl_seconds=self._negative_ttl_seconds)
+        return records
+
+    def _sample_consistency(self, snapshots: Iterable[LoanApplication]) -> None:
+        if (
+            self._consistency_sample_rate <= 0
+            or len(self._consistency_checks) >= _MAX_CONSISTENCY_CHECKS
+        ):
+            return
+        sampled = [
+            snapshot for snapshot in snapshots if random.random() < self._consistency_sample_rate
+        ]
+        if not sampled:
+            return
+        task = asyncio.get_running_loop().create_task(self._check_consistency(sampled))
+        self._consistency_checks.add(task)
+        task.add_done_callback(self._consistency_checks.discard)
+
+    async def _check_consistency(self, snapshots: Sequence[LoanApplication]) -> None:
+        try:
+            stored = await self._backing.get_latest_many(
+                [snapshot.applicant_id for snapshot in snapshots]
+            )
+        except Exception:
+            _CHECK_FAILED.inc(len(snapshots))
+            LOGGER.warning("cache_consistency_check_failed", exc_info=True)
+            return
+        for snapshot in snapshots:
+            current = stored.get(snapshot.applicant_id)
+            if current is None:
+                _MISSING.inc()
+            elif current.status == snapshot.status and current.updated_at == snapshot.updated_at:
+                _CONSISTENT.inc()
+            else:
+                _STALE.inc()
+                CACHE_STALENESS.observe(
+                    max(0.0, (current.updated_at - snapshot.updated_at).total_seconds())
+                )
+
+    def _remember_local(self, applications: Iterable[LoanApplication]) -> None:
+        if self._local_cache is not None:
+            self._local_cache.put_many(applications)
+
+    def _invalidate_local(self, applicant_ids: Iterable[str]) -> None:
+        if self._local_cache is not None:
+            self._local_cache.invalidate_many(applicant_ids)
+
+
+def _observe_age(histogram: Histogram, snapshots: Iterable[LoanApplication]) -> None:
+    now = datetime.now(timezone.utc)
+    for snapshot in snapshots:
+        histogram.observe(max(0.0, (now - snapshot.updated_at).total_seconds()))
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import DefaultDict, List
+from dataclasses import replace
+from typing import DefaultDict, List, Sequence
 
 from ...application.ports import LoanApplicationRepository
 from ...domain import LoanApplication
@@ -30,3 +31,37 @@ class InMemoryLoanApplicationRepository(LoanApplicationRepository):
         if not history:
             return None
         return history[-1]
+
+    async def create_many(self, applications: Sequence[LoanApplication]) -> list[str]:
+        created: list[str] = []
+        for application in applications:
+            if application.applicant_id in self._items:
+                continue
+            await self.create(application)
+            created.append(application.applicant_id)
+        return created
+
+    async def upsert_many(self, applications: Sequence[LoanApplication]) -> None:
+        for application in applications:
+            await self.upsert(application)
+
+    async def record_decisions(
+        self, applications: Sequence[LoanApplication]
+    ) -> list[LoanApplication]:
+        persisted: dict[str, LoanApplication] = {}
+        for application in applications:
+            history = self._items.get(application.applicant_id)
+            if history:
+                application = replace(
+                    history[-1], status=application.status, updated_at=application.updated_at
+                )
+            await self.upsert(application)
+            persisted[application.applicant_id] = application
+        return list(persisted.values())
+
+    async def get_latest_many(self, applicant_ids: Sequence[str]) -> dict[str, LoanApplication]:
+        return {
+            applicant_id: history[-1]
+            for applicant_id in applicant_ids
+            if (history := self._items.get(applicant_id))
+        }
@@ -0,0 +1,38 @@
+"""Prometheus metrics for the repository decorators."""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Histogram
+
+WRITE_BEHIND_FLUSHES = Counter(
+    "loan_application_write_behind_flushes_total",
+    "Number of write-behind flushes by outcome",
+    labelnames=("outcome",),
+)
+WRITE_BEHIND_FLUSH_ROWS = Histogram(
+    "loan_application_write_behind_flush_rows",
+    "Number of collapsed applicant rows written per write-behind flush",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000),
+)
+
+CACHE_BACKFILLS = Counter(
+    "loan_application_repository_cache_backfills_total",
+    "Cache misses resolved from the backing store, by whether the applicant exists",
+    labelnames=("result",),
+)
+CACHE_SNAPSHOT_AGE = Histogram(
+    "loan_application_repository_cache_snapshot_age_seconds",
+    "Age (now minus updated_at) of snapshots served from a cache tier",
+    labelnames=("tier",),
+    buckets=(0.1, 0.5, 1, 5, 15, 60, 300, 900, 1800, 3600, 7200, 86400),
+)
+CACHE_CONSISTENCY_CHECKS = Counter(
+    "loan_application_repository_cache_consistency_checks_total",
+    "Sampled comparisons of cached snapshots against the backing store, by outcome",
+    labelnames=("result",),
+)
+CACHE_STALENESS = Histogram(
+    "loan_application_repository_cache_staleness_seconds",
+    "How far a stale cached snapshot lags the backing store (difference in updated_at)",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 15, 60, 300, 900, 3600),
+)
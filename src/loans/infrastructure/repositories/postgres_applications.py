@@ -2,24 +2,50 @@
 
 from __future__ import annotations
 
-from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Final, Iterator, Sequence
+
+from sqlalchemy import String, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, Insert, insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ...application.ports import LoanApplicationRepository
-from ...domain import LoanApplication
+from ...domain import ApplicationStatus, LoanApplication
 from ..db.models import LoanApplicationModel
+from ..messaging.outbox import enqueue_statement
+
+# asyncpg caps a statement at 32767 bind parameters; six columns per row keeps
+# each multi-row INSERT comfortably below that.
+_MAX_ROWS_PER_STATEMENT: Final = 5000
+_MUTABLE_COLUMNS: Final = ("amount", "term_months", "status", "updated_at")
+_DECISION_COLUMNS: Final = ("status", "updated_at")
 
 
 class PostgresLoanApplicationRepository(LoanApplicationRepository):
     """Persist loan applications using SQLAlchemy with PostgreSQL."""
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        outbox_topic: str | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._outbox_topic = outbox_topic
 
     async def create(self, application: LoanApplication) -> None:
+        """Insert the application; with an outbox, enqueue its event in the same transaction."""
         async with self._session_factory() as session:
-            await self._merge_application(session, application, create_only=True)
+            result = await session.execute(
+                _merge_statement([application], create_only=True).returning(
+                    LoanApplicationModel.applicant_id
+                )
+            )
+            # An existing applicant inserts nothing, so there is no new event to enqueue.
+            created = result.scalar_one_or_none() is not None
+            if self._outbox_topic is not None and created:
+                await session.execute(enqueue_statement(self._outbox_topic, [application]))
+            await session.commit()
 
     async def upsert(self, application: LoanApplication) -> None:
         async with self._session_factory() as session:
@@ -28,13 +54,123 @@ class PostgresLoanApplicationRepository(LoanApplicationRepository):
     async def get_latest(self, applicant_id: str) -> LoanApplication | None:
         async with self._session_factory() as session:
             result = await session.execute(
-                select(LoanApplicationModel).where(LoanApplicationModel.applicant_id == applicant_id)
+                select(LoanApplicationModel).where(
+                    LoanApplicationModel.applicant_id == applicant_id
+                )
             )
             record = result.scalar_one_or_none()
             if record is None:
                 return None
             return record.to_domain()
 
+    async def create_many(self, applications: Sequence[LoanApplication]) -> list[str]:
+        """Insert new applicants in one transaction, skipping ids that already exist."""
+        first_seen: dict[str, LoanApplication] = {}
+        for application in applications:
+            first_seen.setdefault(application.applicant_id, application)
+        if not first_seen:
+            return []
+        created: list[str] = []
+        async with self._session_factory() as session:
+            for chunk in _chunks(list(first_seen.values()), _MAX_ROWS_PER_STATEMENT):
+                result = await session.execute(
+                    _merge_statement(chunk, create_only=True).returning(
+                        LoanApplicationModel.applicant_id
+                    )
+                )
+                created.extend(result.scalars())
+            if self._outbox_topic is not None and created:
+                inserted = set(created)
+                await session.execute(
+                    enqueue_statement(
+                        self._outbox_topic,
+                        [app for app in first_seen.values() if app.applicant_id in inserted],
+                    )
+                )
+            await session.commit()
+        return created
+
+    async def upsert_many(self, applications: Sequence[LoanApplication]) -> None:
+        """Upsert all applications in one transaction using multi-row statements."""
+        latest = list({app.applicant_id: app for app in applications}.values())
+        if not latest:
+            return
+        async with self._session_factory() as session:
+            for chunk in _chunks(latest, _MAX_ROWS_PER_STATEMENT):
+                await session.execute(_merge_statement(chunk, create_only=False))
+            await session.commit()
+
+    async def record_decisions(
+        self, applications: Sequence[LoanApplication]
+    ) -> list[LoanApplication]:
+        """Write decisions with ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING``."""
+        latest = list({app.applicant_id: app for app in applications}.values())
+        if not latest:
+            return []
+        model = LoanApplicationModel
+        persisted: list[LoanApplication] = []
+        async with self._session_factory() as session:
+            for chunk in _chunks(latest, _MAX_ROWS_PER_STATEMENT):
+                stmt = _merge_statement(chunk, create_only=False, update_columns=_DECISION_COLUMNS)
+                result = await session.execute(
+                    stmt.returning(
+                        model.applicant_id,
+                        model.amount,
+                        model.term_months,
+                        model.status,
+                        model.created_at,
+                        model.updated_at,
+                    )
+                )
+                persisted.extend(_columns_to_domain(*row) for row in result)
+            await session.commit()
+        return persisted
+
+    async def get_latest_many(self, applicant_ids: Sequence[str]) -> dict[str, LoanApplication]:
+        """Fetch many applicants with a single ``applicant_id = ANY(...)`` query."""
+        unique_ids = list(dict.fromkeys(applicant_ids))
+        if not unique_ids:
+            return {}
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(LoanApplicationModel).where(
+                    LoanApplicationModel.applicant_id
+                    == any_(bindparam("applicant_ids", unique_ids, type_=ARRAY(String)))
+                )
+            )
+            return {record.applicant_id: record.to_domain() for record in result.scalars()}
+
+    async def stream_latest(
+        self,
+        *,
+        statuses: Sequence[ApplicationStatus] | None = None,
+        updated_since: datetime | None = None,
+        chunk_size: int = 5000,
+    ) -> AsyncIterator[list[LoanApplication]]:
+        """Yield applications in chunks using a server-side cursor.
+
+        Only plain columns are selected so rows are mapped straight to domain
+        objects without hydrating ORM instances or filling the identity map.
+        """
+        model = LoanApplicationModel
+        stmt = select(
+            model.applicant_id,
+            model.amount,
+            model.term_months,
+            model.status,
+            model.created_at,
+            model.updated_at,
+        ).execution_options(yield_per=chunk_size)
+        if statuses:
+            stmt = stmt.where(model.status.in_([status.value for status in statuses]))
+        if updated_since is not None:
+            stmt = stmt.where(model.updated_at >= updated_since)
+
+        async with self._session_factory() as session:
+            result = await session.stream(stmt)
+            async for rows in result.partitions():
+                yield [_columns_to_domain(*row) for row in rows]
+
     @staticmethod
     async def _merge_application(
         session: AsyncSession,
@@ -42,29 +178,55 @@ class PostgresLoanApplicationRepository(LoanApplicationRepository):
         *,
         create_only: bool,
     ) -> None:
-        values = {
-            "applicant_id": application.applicant_id,
-            "amount": application.amount,
-            "term_months": application.term_months,
-            "status": application.status.value,
-            "created_at": application.created_at,
-            "updated_at": application.updated_at,
-        }
-
-        stmt = insert(LoanApplicationModel).values(**values)
-
-        if create_only:
-            stmt = stmt.on_conflict_do_nothing(index_elements=[LoanApplicationModel.applicant_id])
-        else:
-            stmt = stmt.on_conflict_do_update(
-                index_elements=[LoanApplicationModel.applicant_id],
-                set_={
-                    "amount": application.amount,
-                    "term_months": application.term_months,
-                    "status": application.status.value,
-                    "updated_at": application.updated_at,
-                },
-            )
-
-        await session.execute(stmt)
+        await session.execute(_merge_statement([application], create_only=create_only))
         await session.commit()
+
+
+def _merge_statement(
+    applications: Sequence[LoanApplication],
+    *,
+    create_only: bool,
+    update_columns: Sequence[str] = _MUTABLE_COLUMNS,
+) -> Insert:
+    stmt = insert(LoanApplicationModel).values([_to_row(app) for app in applications])
+    if create_only:
+        return stmt.on_conflict_do_nothing(index_elements=[LoanApplicationModel.applicant_id])
+    return stmt.on_conflict_do_update(
+        index_elements=[LoanApplicationModel.applicant_id],
+        set_={column: stmt.excluded[column] for column in update_columns},
+    )
+
+
+def _to_row(application: LoanApplication) -> dict[str, Any]:
+    return {
+        "applicant_id": application.applicant_id,
+        "amount": application.amount,
+        "term_months": application.term_months,
+        "status": application.status.value,
+        "created_at": application.created_at,
+        "updated_at": application.updated_at,
+    }
+
+
+def _columns_to_domain(
+    applicant_id: str,
+    amount: Decimal,
+    term_months: int,
+    status: str,
+    created_at: datetime,
+    updated_at: datetime,
+) -> LoanApplication:
+    """Map a row of the plain columns, selected in model order, to the domain object."""
+    return LoanApplication(
+        applicant_id=applicant_id,
+        amount=amount,
+        term_months=term_months,
+        status=ApplicationStatus(status),
+        created_at=created_at,
+        updated_at=updated_at,
+    )
+
+
+def _chunks(items: Sequence[LoanApplication], size: int) -> Iterator[Sequence[LoanApplication]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
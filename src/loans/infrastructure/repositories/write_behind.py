@@ -0,0 +1,183 @@
+"""Decorator that coalesces repository writes into periodic bulk flushes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import replace
+from typing import Dict, Final, Sequence
+
+from ...application.ports import LoanApplicationRepository
+from ...domain import LoanApplication
+from .metrics import WRITE_BEHIND_FLUSH_ROWS, WRITE_BEHIND_FLUSHES
+
+LOGGER: Final = logging.getLogger(__name__)
+
+
+class _Generation:
+    """Writes accepted between two flushes and the future their callers await."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.upserts: Dict[str, LoanApplication] = {}
+        self.decisions: Dict[str, LoanApplication] = {}
+        self.done: asyncio.Future[Dict[str, LoanApplication]] = loop.create_future()
+
+    def __len__(self) -> int:
+        return len(self.upserts) + len(self.decisions)
+
+    def add_upsert(self, application: LoanApplication) -> None:
+        applicant_id = application.applicant_id
+        pending_upsert = self.upserts.get(applicant_id)
+        if pending_upsert is not None and pending_upsert.updated_at > application.updated_at:
+            return
+        # The row absorbs any pending status change; a newer decision keeps its status.
+        decision = self.decisions.pop(applicant_id, None)
+        if decision is not None and decision.updated_at > application.updated_at:
+            application = replace(
+                application, status=decision.status, updated_at=decision.updated_at
+            )
+        self.upserts[applicant_id] = application
+
+    def add_decision(self, application: LoanApplication) -> None:
+        applicant_id = application.applicant_id
+        pending_upsert = self.upserts.get(applicant_id)
+        if pending_upsert is not None:
+            if pending_upsert.updated_at <= application.updated_at:
+                self.upserts[applicant_id] = replace(
+                    pending_upsert, status=application.status, updated_at=application.updated_at
+                )
+            return
+        current = self.decisions.get(applicant_id)
+        if current is None or current.updated_at <= application.updated_at:
+            self.decisions[applicant_id] = application
+
+
+class WriteBehindLoanApplicationRepository(LoanApplicationRepository):
+    """Repository decorator that buffers upserts and decisions and writes them in bulk.
+
+    Writes are collapsed per applicant (the newest ``updated_at`` wins) and
+    flushed every ``flush_interval_seconds`` or as soon as ``max_pending_rows``
+    applicants are buffered, as one ``upsert_many`` and one
+    ``record_decisions`` call. Each ``upsert``/``record_decisions`` call
+    returns only after the flush holding its rows has committed (and raises if
+    it failed), so a caller that acknowledges work afterwards, such as the
+    processor committing Kafka offsets, keeps its durability guarantee.
+
+    Flushes run one at a time, so a later flush never overtakes an earlier one.
+    Creates and reads go straight to the backing repository.
+    """
+
+    def __init__(
+        self,
+        backing: LoanApplicationRepository,
+        flush_interval_seconds: float,
+        max_pending_rows: int = 500,
+    ) -> None:
+        self._backing = backing
+        self._flush_interval_seconds = flush_interval_seconds
+        self._max_pending_rows = max(1, max_pending_rows)
+        self._generation: _Generation | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._flush_lock = asyncio.Lock()
+        self._running: set[asyncio.Task[None]] = set()
+
+    async def create(self, application: LoanApplication) -> None:
+        await self._backing.create(application)
+
+    async def create_many(self, applications: Sequence[LoanApplication]) -> list[str]:
+        return await self._backing.create_many(applications)
+
+    async def upsert(self, application: LoanApplication) -> None:
+        await self.upsert_many([application])
+
+    async def upsert_many(self, applications: Sequence[LoanApplication]) -> None:
+        if not applications:
+            return
+        generation = self._current_generation()
+        for application in applications:
+            generation.add_upsert(application)
+        await self._wait(generation)
+
+    async def record_decisions(
+        self, applications: Sequence[LoanApplication]
+    ) -> list[LoanApplication]:
+        if not applications:
+            return []
+        generation = self._current_generation()
+        for application in applications:
+            generation.add_decision(application)
+        persisted = await self._wait(generation)
+        applicant_ids = dict.fromkeys(app.applicant_id for app in applications)
+        return [
+            persisted[applicant_id] for applicant_id in applicant_ids if applicant_id in persisted
+        ]
+
+    async def get_latest(self, applicant_id: str) -> LoanApplication | None:
+        return await self._backing.get_latest(applicant_id)
+
+    async def get_latest_many(self, applicant_ids: Sequence[str]) -> dict[str, LoanApplication]:
+        return await self._backing.get_latest_many(applicant_ids)
+
+    @property
+    def pending_rows(self) -> int:
+        return len(self._generation) if self._generation is not None else 0
+
+    async def flush(self) -> None:
+        """Write out everything buffered so far and wait for it."""
+        generation = self._generation
+        if generation is None:
+            return
+        self._schedule_flush()
+        await asyncio.shield(generation.done)
+
+    def _current_generation(self) -> _Generation:
+        if self._generation is None:
+            loop = asyncio.get_running_loop()
+            self._generation = _Generation(loop)
+            self._timer = loop.call_later(self._flush_interval_seconds, self._schedule_flush)
+        return self._generation
+
+    async def _wait(self, generation: _Generation) -> Dict[str, LoanApplication]:
+        if len(generation) >= self._max_pending_rows:
+            self._schedule_flush()
+        return await asyncio.shield(generation.done)
+
+    def _schedule_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        generation, self._generation = self._generation, None
+        if generation is None:
+            return
+        task = asyncio.get_running_loop().create_task(self._run(generation))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, generation: _Generation) -> None:
+        async with self._flush_lock:
+            try:
+                persisted: Dict[str, LoanApplication] = {}
+                if generation.upserts:
+                    upserts = list(generation.upserts.values())
+                    await self._backing.upsert_many(upserts)
+                    persisted.update((app.applicant_id, app) for app in upserts)
+                if generation.decisions:
+                    decided = await self._backing.record_decisions(
+                        list(generation.decisions.values())
+                    )
+                    persisted.update((app.applicant_id, app) for app in decided)
+            except asyncio.CancelledError:
+                generation.done.cancel()
+                raise
+            except Exception as exc:
+                WRITE_BEHIND_FLUSHES.labels(outcome="failed").inc()
+                LOGGER.warning(
+                    "write_behind_flush_failed",
+                    extra={"extra_data": {"rows": len(generation), "error": repr(exc)}},
+                )
+                generation.done.set_exception(exc)
+                generation.done.exception()  # waiters may all have been cancelled
+                return
+        WRITE_BEHIND_FLUSHES.labels(outcome="ok").inc()
+        WRITE_BEHIND_FLUSH_ROWS.observe(len(generation))
+        generation.done.set_result(persisted)
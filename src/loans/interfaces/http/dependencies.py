@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from dataclasses import dataclass
 from decimal import Decimal
 from typing import Literal
 
@@ -11,13 +12,16 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ...application import (
     GetApplicationStatus,
+    GetApplicationStatuses,
     ProcessApplication,
     SubmitApplication,
+    SubmitApplications,
 )
 from ...application.ports import (
     ApplicationEventPublisher,
     ApplicationStatusCache,
     LoanApplicationRepository,
+    StatusChangeNotifier,
 )
 from ...infrastructure import (
     CachedLoanApplicationRepository,
@@ -25,14 +29,51 @@ from ...infrastructure import (
     InMemoryLoanApplicationRepository,
     InMemoryStatusCache,
     PostgresLoanApplicationRepository,
+    WriteBehindLoanApplicationRepository,
+)
+from ...infrastructure.cache import (
+    BinarySnapshotCodec,
+    CacheKeyLayout,
+    HashBucketLayout,
+    JsonSnapshotCodec,
+    LocalStatusCache,
+    RedisStatusCache,
+    SnapshotCodec,
+    StringKeyLayout,
+    create_redis_client,
 )
-from ...infrastructure.cache import RedisStatusCache, create_redis_client
 from ...infrastructure.db import create_session_factory, dispose_engine
-from ...infrastructure.messaging import KafkaApplicationEventPublisher, build_producer
+from ...infrastructure.instrumentation import (
+    InstrumentedEventPublisher,
+    InstrumentedLoanApplicationRepository,
+    InstrumentedStatusCache,
+)
+from ...infrastructure.messaging import (
+    InMemoryStatusChangeBus,
+    KafkaApplicationEventPublisher,
+    OutboxEventPublisher,
+    OutboxRelay,
+    RedisStatusChangeBus,
+    StatusWatchRegistry,
+    build_partitioner,
+    build_producer,
+    parse_acks,
+    parse_compression_type,
+)
 
 RepositoryBackend = Literal["postgres", "memory"]
 CacheBackend = Literal["redis", "memory"]
+CacheKeyLayoutName = Literal["string", "hash"]
 PublisherBackend = Literal["kafka", "memory"]
+EventDelivery = Literal["direct", "outbox"]
+
+
+@dataclass(frozen=True)
+class EventStreamSettings:
+    """Timing of server-sent status event streams."""
+
+    heartbeat_seconds: float = 15.0
+    max_seconds: float = 300.0
 
 
 class AppContainer:
@@ -44,6 +85,7 @@ class AppContainer:
         repository_backend: RepositoryBackend | None = None,
         cache_backend: CacheBackend | None = None,
         publisher_backend: PublisherBackend | None = None,
+        cache_key_layout: CacheKeyLayoutName | None = None,
     ) -> None:
         if repository_backend is None:
             backend_env = os.getenv("REPOSITORY_BACKEND", "postgres").lower()
@@ -57,49 +99,184 @@ class AppContainer:
             publisher_env = os.getenv("PUBLISHER_BACKEND", "kafka").lower()
             publisher_backend = "memory" if publisher_env == "memory" else "kafka"
 
+        if cache_key_layout is None:
+            layout_env = os.getenv("CACHE_KEY_LAYOUT", "string").lower()
+            cache_key_layout = "hash" if layout_env == "hash" else "string"
+
         self.repository_backend: RepositoryBackend = repository_backend
         self.cache_backend: CacheBackend = cache_backend
         self.publisher_backend: PublisherBackend = publisher_backend
+        self.cache_key_layout: CacheKeyLayoutName = cache_key_layout
 
         self.session_factory: async_sessionmaker[AsyncSession] | None = None
         self.status_cache: ApplicationStatusCache
         self.event_publisher: ApplicationEventPublisher
         self._redis_client = None
         self._kafka_publisher: KafkaApplicationEventPublisher | None = None
+        self._redis_status_bus: RedisStatusChangeBus | None = None
+        self.status_changes: StatusChangeNotifier
+        self.status_watch = StatusWatchRegistry(
+            max_subscriptions=int(os.getenv("STATUS_WATCH_MAX_SUBSCRIBERS", "10000"))
+        )
+        self.event_stream = EventStreamSettings(
+            heartbeat_seconds=float(os.getenv("SSE_HEARTBEAT_SECONDS", "15")),
+            max_seconds=float(os.getenv("SSE_MAX_SECONDS", "300")),
+        )
+
+        self.kafka_topic = os.getenv("KAFKA_APPLICATION_TOPIC", "loan-applications")
+        # The outbox lives next to the applications, so it needs the PostgreSQL repository.
+        self.event_delivery: EventDelivery = (
+            "outbox"
+            if os.getenv("EVENT_DELIVERY", "direct").lower() == "outbox"
+            and self.repository_backend == "postgres"
+            else "direct"
+        )
+
+        # Timing wrappers around the adapters; when off, nothing is wrapped at all.
+        self.adapter_metrics = os.getenv("ADAPTER_METRICS", "true").lower() in {"1", "true", "yes"}
 
         repository: LoanApplicationRepository
         if self.repository_backend == "postgres":
             self.session_factory = create_session_factory()
-            repository = PostgresLoanApplicationRepository(self.session_factory)
+            repository = PostgresLoanApplicationRepository(
+                self.session_factory,
+                outbox_topic=self.kafka_topic if self.event_delivery == "outbox" else None,
+            )
         else:
             repository = InMemoryLoanApplicationRepository()
+        if self.adapter_metrics:
+            repository = InstrumentedLoanApplicationRepository(
+                repository, backend=self.repository_backend
+            )
+
+        self.write_behind: WriteBehindLoanApplicationRepository | None = None
+        write_behind_flush_ms = float(os.getenv("WRITE_BEHIND_FLUSH_MS", "0"))
+        if write_behind_flush_ms > 0:
+            self.write_behind = WriteBehindLoanApplicationRepository(
+                repository,
+                flush_interval_seconds=write_behind_flush_ms / 1000,
+                max_pending_rows=int(os.getenv("WRITE_BEHIND_MAX_ROWS", "500")),
+            )
+            repository = self.write_behind
 
         if self.cache_backend == "redis":
             redis_url = os.getenv("REDIS_URL", "redis://redis:6379/0")
             self._redis_client = create_redis_client(redis_url)
-            self.status_cache = RedisStatusCache(self._redis_client)
+            # JSON stays the default: pods predating the binary codec fail on binary entries.
+            codec_env = os.getenv("CACHE_CODEC", "json").lower()
+            codec: SnapshotCodec = (
+                BinarySnapshotCodec() if codec_env == "binary" else JsonSnapshotCodec()
+            )
+            self.status_cache = RedisStatusCache(
+                self._redis_client,
+                batch_size=int(os.getenv("CACHE_BATCH_SIZE", "500")),
+                codec=codec,
+                layout=build_cache_key_layout(self.cache_key_layout),
+            )
+            self._redis_status_bus = RedisStatusChangeBus(
+                self._redis_client,
+                self.status_watch,
+                channel=os.getenv("STATUS_CHANGES_CHANNEL", "loans:status-changes"),
+                codec=codec,
+            )
+            self.status_changes = self._redis_status_bus
         else:
             self.status_cache = InMemoryStatusCache()
+            self.status_changes = InMemoryStatusChangeBus(self.status_watch)
 
         if self.publisher_backend == "kafka":
             bootstrap_servers = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "kafka:29092")
             client_id = os.getenv("SERVICE_NAME", "loans-api")
+            linger_ms = int(os.getenv("KAFKA_LINGER_MS", "0"))
+            max_batch_size = int(os.getenv("KAFKA_MAX_BATCH_SIZE", "16384"))
+            compression_type = parse_compression_type(os.getenv("KAFKA_COMPRESSION_TYPE", ""))
+            acks = parse_acks(os.getenv("KAFKA_ACKS", "1"))
+            partitioner = build_partitioner(
+                "crc32"
+                if os.getenv("KAFKA_PARTITIONER", "murmur2").lower() == "crc32"
+                else "murmur2"
+            )
             self._kafka_publisher = KafkaApplicationEventPublisher(
-                lambda: build_producer(bootstrap_servers, client_id)
+                lambda: build_producer(
+                    bootstrap_servers,
+                    client_id,
+                    linger_ms=linger_ms,
+                    max_batch_size=max_batch_size,
+                    compression_type=compression_type,
+                    acks=acks,
+                    partitioner=partitioner,
+                ),
+                # The outbox relay deletes rows only after the broker acknowledged them.
+                wait_for_delivery=(
+                    self.event_delivery == "outbox"
+                    or os.getenv("KAFKA_PUBLISH_MODE", "ack").lower() != "async"
+                ),
+                drain_timeout_seconds=float(os.getenv("KAFKA_DRAIN_TIMEOUT_SECONDS", "10")),
             )
             self.event_publisher = self._kafka_publisher
         else:
             self.event_publisher = InMemoryApplicationEventPublisher()
+        # ``event_publisher`` stays the raw adapter; use cases publish through
+        # ``event_publisher_port``, which is the timed wrapper when enabled.
+        publisher: ApplicationEventPublisher = self.event_publisher
+        if self.adapter_metrics:
+            publisher = InstrumentedEventPublisher(publisher, backend=self.publisher_backend)
+        self.outbox_relay: OutboxRelay | None = None
+        # ``event_delivery`` is only "outbox" with the PostgreSQL backend, which sets the
+        # session factory.
+        if self.event_delivery == "outbox" and self.session_factory is not None:
+            self.outbox_relay = OutboxRelay(
+                self.session_factory,
+                publisher,
+                batch_size=int(os.getenv("OUTBOX_RELAY_BATCH_SIZE", "1000")),
+                idle_interval_seconds=float(os.getenv("OUTBOX_RELAY_IDLE_MS", "500")) / 1000,
+            )
+            self.event_publisher = publisher = OutboxEventPublisher()
+        self.event_publisher_port = publisher
 
-        self.kafka_topic = os.getenv("KAFKA_APPLICATION_TOPIC", "loan-applications")
         self.approval_threshold = Decimal("5000")
         self.cache_ttl_seconds = 3600
+        self.status_lookup_chunk_size = int(os.getenv("STATUS_LOOKUP_CHUNK_SIZE", "500"))
+        self.negative_cache_ttl_seconds = int(os.getenv("NEGATIVE_CACHE_TTL_SECONDS", "2"))
+
+        local_cache_max_entries = int(os.getenv("LOCAL_CACHE_MAX_ENTRIES", "0"))
+        self.local_cache: LocalStatusCache | None = (
+            LocalStatusCache(
+                max_entries=local_cache_max_entries,
+                ttl_seconds=float(os.getenv("LOCAL_CACHE_TTL_SECONDS", "1.0")),
+            )
+            if local_cache_max_entries > 0
+            else None
+        )
+
+        # Likewise ``status_cache`` stays the raw adapter, which maintenance
+        # scripts and cleanup rely on.
+        cache: ApplicationStatusCache = self.status_cache
+        if self.adapter_metrics:
+            # The cached repository counts lookups for both tiers itself.
+            cache = InstrumentedStatusCache(cache, backend=self.cache_backend, count_lookups=False)
 
         self.application_repository = CachedLoanApplicationRepository(
             backing=repository,
-            cache=self.status_cache,
+            cache=cache,
             cache_ttl_seconds=self.cache_ttl_seconds,
+            local_cache=self.local_cache,
+            miss_batch_window_seconds=float(os.getenv("CACHE_MISS_BATCH_WINDOW_MS", "0")) / 1000,
+            miss_batch_max_size=int(os.getenv("CACHE_MISS_BATCH_MAX_SIZE", "100")),
+            negative_ttl_seconds=self.negative_cache_ttl_seconds,
+            consistency_sample_rate=float(os.getenv("CACHE_CONSISTENCY_SAMPLE_RATE", "0")),
+            cache_backend=self.cache_backend,
+        )
+
+
+def build_cache_key_layout(name: CacheKeyLayoutName) -> CacheKeyLayout:
+    """Build the Redis key layout, honouring ``CACHE_KEY_PREFIX``/``CACHE_HASH_BUCKETS``."""
+    if name == "hash":
+        return HashBucketLayout(
+            prefix=os.getenv("CACHE_KEY_PREFIX", "loans:status"),
+            buckets=int(os.getenv("CACHE_HASH_BUCKETS", "65536")),
         )
+    return StringKeyLayout(prefix=os.getenv("CACHE_KEY_PREFIX", ""))
 
 
 container = AppContainer()
@@ -124,7 +301,11 @@ def get_status_cache() -> ApplicationStatusCache:
 
 
 def get_event_publisher() -> ApplicationEventPublisher:
-    return container.event_publisher
+    return container.event_publisher_port
+
+
+async def startup_container() -> None:
+    start_container(container)
 
 
 async def shutdown_container() -> None:
@@ -135,18 +316,27 @@ def get_submit_application_use_case(
     repository: LoanApplicationRepository = Depends(get_application_repository),
     publisher: ApplicationEventPublisher = Depends(get_event_publisher),
 ) -> SubmitApplication:
-    return SubmitApplication(repository=repository, publisher=publisher, topic=container.kafka_topic)
+    return SubmitApplication(
+        repository=repository, publisher=publisher, topic=container.kafka_topic
+    )
+
+
+def get_submit_applications_use_case(
+    repository: LoanApplicationRepository = Depends(get_application_repository),
+    publisher: ApplicationEventPublisher = Depends(get_event_publisher),
+) -> SubmitApplications:
+    return SubmitApplications(
+        repository=repository, publisher=publisher, topic=container.kafka_topic
+    )
 
 
 def get_process_application_use_case(
     repository: LoanApplicationRepository = Depends(get_application_repository),
-    cache: ApplicationStatusCache = Depends(get_status_cache),
 ) -> ProcessApplication:
     return ProcessApplication(
         repository=repository,
-        cache=cache,
         approval_threshold=container.approval_threshold,
-        cache_ttl_seconds=container.cache_ttl_seconds,
+        status_notifier=container.status_changes,
     )
 
 
@@ -156,13 +346,38 @@ def get_application_status_use_case(
     return GetApplicationStatus(repository=repository)
 
 
+def get_status_watch() -> StatusWatchRegistry:
+    return container.status_watch
+
+
+def get_event_stream_settings() -> EventStreamSettings:
+    return container.event_stream
+
+
+def get_application_statuses_use_case(
+    repository: LoanApplicationRepository = Depends(get_application_repository),
+) -> GetApplicationStatuses:
+    return GetApplicationStatuses(
+        repository=repository, chunk_size=container.status_lookup_chunk_size
+    )
+
+
+def start_container(instance: AppContainer) -> None:
+    """Start background listeners; only the API needs them, not the processor."""
+    if instance._redis_status_bus is not None:
+        instance._redis_status_bus.start()
+
+
 async def cleanup_container(instance: AppContainer) -> None:
     status_cache = instance.status_cache
-    event_publisher = instance.event_publisher
 
+    if instance.write_behind is not None:
+        await instance.write_behind.flush()
+    if instance._redis_status_bus is not None:
+        await instance._redis_status_bus.close()
     if isinstance(status_cache, RedisStatusCache):
         await status_cache.close()
-    if isinstance(event_publisher, KafkaApplicationEventPublisher):
-        await event_publisher.close()
+    if instance._kafka_publisher is not None:
+        await instance._kafka_publisher.close()
     if instance.repository_backend == "postgres":
         await dispose_engine()
@@ -3,24 +3,56 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+import os
+import time
+from collections import Counter
+from datetime import datetime, timezone
 from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List
 
-from fastapi import APIRouter, Depends, FastAPI, HTTPException, status
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+from pydantic import BaseModel, Field, ValidationError
 
 from ...application import (
     ApplicationNotFoundError,
     ApplicationStatusResult,
     GetApplicationStatus,
+    GetApplicationStatuses,
     SubmitApplication,
     SubmitApplicationCommand,
+    SubmitApplications,
+    SubmissionOutcome,
+)
+from ...domain import LoanApplication
+from ...infrastructure.messaging import StatusSubscription, StatusWatchRegistry, WatchCapacityError
+from ...utils import json_codec
+from ..http.dependencies import (
+    EventStreamSettings,
+    get_application_status_use_case,
+    get_application_statuses_use_case,
+    get_event_stream_settings,
+    get_status_watch,
+    get_submit_application_use_case,
+    get_submit_applications_use_case,
 )
-from ..http.dependencies import get_application_status_use_case, get_submit_application_use_case
 
 LOGGER = logging.getLogger("loans.api.routes")
 
+MAX_BATCH_ITEMS = 5000
+MAX_LOOKUP_IDS = 10000
+STREAM_LOOKUP_THRESHOLD = 500
+MAX_LONG_POLL_SECONDS = 60
+
 loans_router = APIRouter(prefix="/loans", tags=["loans"])
+metrics_router = APIRouter(tags=["observability"])
 applications_router = APIRouter(prefix="/application", tags=["applications"])
 
 
@@ -39,6 +71,33 @@ class SubmitApplicationResponse(BaseModel):
     status: str = Field(default="pending")
 
 
+class SubmitApplicationsRequest(BaseModel):
+    """Request body for POST /application/batch.
+
+    Items are validated one by one so a bad item is reported instead of
+    rejecting the whole batch.
+    """
+
+    items: List[Dict[str, Any]] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class SubmissionItemResponse(BaseModel):
+    """Outcome of one item of a bulk submission."""
+
+    applicant_id: str | None
+    result: SubmissionOutcome
+    detail: str | None = None
+
+
+class SubmitApplicationsResponse(BaseModel):
+    """Response for POST /application/batch, with results in request order."""
+
+    accepted: int
+    duplicate: int
+    invalid: int
+    results: List[SubmissionItemResponse]
+
+
 class ApplicationStatusResponse(BaseModel):
     """Response model returned by GET /application/{applicant_id}."""
 
@@ -49,7 +108,9 @@ class ApplicationStatusResponse(BaseModel):
     updated_at: datetime
 
 
-@applications_router.post("", response_model=SubmitApplicationResponse, status_code=status.HTTP_202_ACCEPTED)
+@applications_router.post(
+    "", response_model=SubmitApplicationResponse, status_code=status.HTTP_202_ACCEPTED
+)
 async def submit_application(
     payload: SubmitApplicationRequest,
     use_case: SubmitApplication = Depends(get_submit_application_use_case),
@@ -74,6 +135,121 @@ async def submit_application(
     return SubmitApplicationResponse(applicant_id=payload.applicant_id)
 
 
+@applications_router.post(
+    "/batch",
+    response_model=SubmitApplicationsResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_applications(
+    payload: SubmitApplicationsRequest,
+    use_case: SubmitApplications = Depends(get_submit_applications_use_case),
+) -> SubmitApplicationsResponse:
+    results: List[SubmissionItemResponse | None] = []
+    commands: List[SubmitApplicationCommand] = []
+    for item in payload.items:
+        try:
+            request = SubmitApplicationRequest.model_validate(item)
+        except ValidationError as exc:
+            applicant_id = item.get("applicant_id")
+            results.append(
+                SubmissionItemResponse(
+                    applicant_id=applicant_id if isinstance(applicant_id, str) else None,
+                    result=SubmissionOutcome.INVALID,
+                    detail=_validation_detail(exc),
+                )
+            )
+            continue
+        results.append(None)
+        commands.append(
+            SubmitApplicationCommand(
+                applicant_id=request.applicant_id,
+                amount=request.amount,
+                term_months=request.term_months,
+            )
+        )
+
+    submitted = iter(await use_case.execute(commands) if commands else [])
+    items: List[SubmissionItemResponse] = []
+    for result in results:
+        if result is None:
+            outcome = next(submitted)
+            result = SubmissionItemResponse(
+                applicant_id=outcome.applicant_id,
+                result=outcome.outcome,
+                detail=outcome.detail,
+            )
+        items.append(result)
+    counts = Counter(item.result for item in items)
+    LOGGER.info(
+        "applications_submitted",
+        extra={"extra_data": {outcome.value: counts[outcome] for outcome in SubmissionOutcome}},
+    )
+    return SubmitApplicationsResponse(
+        accepted=counts[SubmissionOutcome.ACCEPTED],
+        duplicate=counts[SubmissionOutcome.DUPLICATE],
+        invalid=counts[SubmissionOutcome.INVALID],
+        results=items,
+    )
+
+
+class ApplicationStatusesResponse(BaseModel):
+    """Response for GET /application?ids=..., in request order."""
+
+    applications: List[ApplicationStatusResponse]
+    missing: List[str]
+
+
+@applications_router.get(
+    "", response_model=ApplicationStatusesResponse, status_code=status.HTTP_200_OK
+)
+async def get_application_statuses(
+    ids: List[str] = Query(
+        ..., description="Applicant ids; repeat the parameter or separate with commas"
+    ),
+    use_case: GetApplicationStatuses = Depends(get_application_statuses_use_case),
+) -> Response:
+    applicant_ids = list(dict.fromkeys(part for value in ids for part in value.split(",") if part))
+    if not applicant_ids:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="No applicant ids given."
+        )
+    if len(applicant_ids) > MAX_LOOKUP_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {MAX_LOOKUP_IDS} applicant ids can be requested at once.",
+        )
+
+    LOGGER.info("application_statuses_requested", extra={"extra_data": {"ids": len(applicant_ids)}})
+    if len(applicant_ids) > STREAM_LOOKUP_THRESHOLD:
+        return StreamingResponse(
+            _stream_statuses(use_case, applicant_ids), media_type="application/json"
+        )
+
+    result = await use_case.execute(applicant_ids)
+    body = ApplicationStatusesResponse(
+        applications=[_status_response(found) for found in result.found],
+        missing=result.missing,
+    )
+    return Response(content=body.model_dump_json(), media_type="application/json")
+
+
+async def _stream_statuses(
+    use_case: GetApplicationStatuses, applicant_ids: List[str]
+) -> AsyncIterator[bytes]:
+    """Emit the ``ApplicationStatusesResponse`` document one resolved chunk at a time."""
+    missing: List[str] = []
+    separator = b""
+    yield b'{"applications":['
+    async for chunk in use_case.iter_chunks(applicant_ids):
+        if chunk.found:
+            yield separator + b",".join(
+                _status_response(found).model_dump_json().encode("utf-8") for found in chunk.found
+            )
+            separator = b","
+        missing.extend(chunk.missing)
+    yield b'],"missing":' + json_codec.dumps(missing) + b"}"
+
+
 @applications_router.get(
     "/{applicant_id}",
     response_model=ApplicationStatusResponse,
@@ -81,41 +257,191 @@ async def submit_application(
 )
 async def get_application_status(
     applicant_id: str,
+    wait: float = Query(
+        0,
+        ge=0,
+        le=MAX_LONG_POLL_SECONDS,
+        description="Seconds to hold the request until the status changes past `since`",
+    ),
+    since: datetime | None = Query(None, description="`updated_at` the client already has"),
     use_case: GetApplicationStatus = Depends(get_application_status_use_case),
+    registry: StatusWatchRegistry = Depends(get_status_watch),
 ) -> ApplicationStatusResponse:
-    try:
-        result: ApplicationStatusResult = await use_case.execute(applicant_id)
-    except ApplicationNotFoundError as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    if since is not None and since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if wait > 0:
+        result = await _wait_for_change(applicant_id, since, wait, use_case, registry)
+    else:
+        result = await _current_status(use_case, applicant_id)
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No application found for applicant '{applicant_id}'.",
+        )
 
-    response = ApplicationStatusResponse(
-        applicant_id=result.applicant_id,
-        status=result.status.value,
-        amount=result.amount,
-        term_months=result.term_months,
-        updated_at=result.updated_at,
-    )
+    response = _status_response(result)
     LOGGER.info(
         "application_status_fetched",
         extra={
-                "extra_data": {
-                    "applicant_id": response.applicant_id,
-                    "status": response.status,
-                    "amount": str(response.amount),
-                    "term_months": response.term_months,
-                }
+            "extra_data": {
+                "applicant_id": response.applicant_id,
+                "status": response.status,
+                "amount": str(response.amount),
+                "term_months": response.term_months,
+            }
         },
     )
     return response
 
 
+async def _wait_for_change(
+    applicant_id: str,
+    since: datetime | None,
+    wait: float,
+    use_case: GetApplicationStatus,
+    registry: StatusWatchRegistry,
+) -> ApplicationStatusResult | None:
+    """Return once the status is newer than ``since`` or ``wait`` seconds pass.
+
+    The request parks on a registry subscription and is woken by the change
+    notification, so waiting costs no cache or database reads.
+    """
+    try:
+        subscription = registry.subscribe(applicant_id)
+    except WatchCapacityError:
+        LOGGER.warning(
+            "long_poll_capacity_reached", extra={"extra_data": {"applicant_id": applicant_id}}
+        )
+        return await _current_status(use_case, applicant_id)
+
+    with subscription:
+        current = await _current_status(use_case, applicant_id)
+        deadline = time.monotonic() + wait
+        while not _is_newer(current, since) and (remaining := deadline - time.monotonic()) > 0:
+            application = await subscription.next(timeout=remaining)
+            if application is not None and (
+                current is None or application.updated_at > current.updated_at
+            ):
+                current = _to_status_result(application)
+        return current
+
+
+async def _current_status(
+    use_case: GetApplicationStatus, applicant_id: str
+) -> ApplicationStatusResult | None:
+    try:
+        return await use_case.execute(applicant_id)
+    except ApplicationNotFoundError:
+        return None
+
+
+def _is_newer(result: ApplicationStatusResult | None, since: datetime | None) -> bool:
+    return result is not None and (since is None or result.updated_at > since)
+
+
+@applications_router.get("/{applicant_id}/events", response_class=StreamingResponse)
+async def stream_application_events(
+    applicant_id: str,
+    use_case: GetApplicationStatus = Depends(get_application_status_use_case),
+    registry: StatusWatchRegistry = Depends(get_status_watch),
+    settings: EventStreamSettings = Depends(get_event_stream_settings),
+) -> StreamingResponse:
+    """Server-sent events with the current status and every later change.
+
+    The stream ends once a decision has been sent, or after ``SSE_MAX_SECONDS``.
+    """
+    try:
+        subscription = registry.subscribe(applicant_id)
+    except WatchCapacityError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        ) from exc
+    return StreamingResponse(
+        _status_events(applicant_id, subscription, use_case, settings),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _status_events(
+    applicant_id: str,
+    subscription: StatusSubscription,
+    use_case: GetApplicationStatus,
+    settings: EventStreamSettings,
+) -> AsyncIterator[bytes]:
+    # Subscribed before reading the current status, so no change between the
+    # read and the first wait can be missed.
+    with subscription:
+        current = await _current_status(use_case, applicant_id)
+        if current is not None:
+            yield _sse_event(_status_response(current))
+            if current.status.is_terminal:
+                return
+
+        deadline = time.monotonic() + settings.max_seconds
+        while (remaining := deadline - time.monotonic()) > 0:
+            application = await subscription.next(
+                timeout=min(settings.heartbeat_seconds, remaining)
+            )
+            if application is None:
+                yield b": keep-alive\n\n"
+                continue
+            if current is not None and application.updated_at <= current.updated_at:
+                continue
+            current = _to_status_result(application)
+            yield _sse_event(_status_response(current))
+            if current.status.is_terminal:
+                return
+
+
 @loans_router.get("/health", status_code=status.HTTP_200_OK)
 async def healthcheck() -> dict[str, str]:
     """Lightweight readiness indicator used for container health checks."""
     return {"status": "ok"}
 
 
+@metrics_router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus metrics of this process, or of every worker under ``PROMETHEUS_MULTIPROC_DIR``."""
+    registry = REGISTRY
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+def _status_response(result: ApplicationStatusResult) -> ApplicationStatusResponse:
+    return ApplicationStatusResponse(
+        applicant_id=result.applicant_id,
+        status=result.status.value,
+        amount=result.amount,
+        term_months=result.term_months,
+        updated_at=result.updated_at,
+    )
+
+
+def _to_status_result(application: LoanApplication) -> ApplicationStatusResult:
+    return ApplicationStatusResult(
+        applicant_id=application.applicant_id,
+        status=application.status,
+        amount=application.amount,
+        term_months=application.term_months,
+        updated_at=application.updated_at,
+    )
+
+
+def _sse_event(response: ApplicationStatusResponse) -> bytes:
+    return b"event: status\ndata: " + response.model_dump_json().encode("utf-8") + b"\n\n"
+
+
+def _validation_detail(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()
+    )
+
+
 def register_routes(app: FastAPI) -> None:
     """Attach routers to the FastAPI application."""
     app.include_router(loans_router)
     app.include_router(applications_router)
+    app.include_router(metrics_router)
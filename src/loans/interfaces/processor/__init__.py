@@ -0,0 +1,21 @@
+"""Kafka consumer adapters that drive the application processing use case."""
+
+from .batch import (
+    BatchApplicationProcessor,
+    handle_payload,
+    latest_per_applicant,
+    parse_command,
+)
+from .pipeline import BackpressurePipeline, PipelineRebalanceListener, consume_batches
+from .settings import ProcessorSettings
+
+__all__ = [
+    "BackpressurePipeline",
+    "BatchApplicationProcessor",
+    "PipelineRebalanceListener",
+    "ProcessorSettings",
+    "consume_batches",
+    "handle_payload",
+    "latest_per_applicant",
+    "parse_command",
+]
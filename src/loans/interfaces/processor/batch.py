@@ -0,0 +1,312 @@
+"""Batched Kafka consumption for loan application processing."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from decimal import Decimal, InvalidOperation
+from typing import Any, Final, Iterable, Mapping, Protocol, Sequence
+
+from aiokafka.errors import CommitFailedError, IllegalStateError
+from aiokafka.structs import ConsumerRecord, TopicPartition
+
+from ...application import (
+    ApplicationValidationError,
+    ProcessApplication,
+    ProcessApplicationCommand,
+)
+from ...domain import LoanApplication
+from .metrics import (
+    APPLICATIONS_PROCESSED,
+    BATCH_DURATION,
+    BATCH_FAILURES,
+    BATCH_SIZE,
+    PROCESSING_DURATION,
+    PROCESSING_FAILURES,
+)
+from .settings import ProcessorSettings
+
+LOGGER: Final = logging.getLogger("loans.application_processor")
+
+_POLL_TIMEOUT_MS: Final = 1000
+
+# Raised by ``commit()`` when the group rebalanced under an in-flight batch.
+REBALANCE_ERRORS: Final = (CommitFailedError, IllegalStateError)
+
+Batch = Mapping[TopicPartition, Sequence[ConsumerRecord]]
+
+
+class BatchConsumer(Protocol):
+    """Subset of ``AIOKafkaConsumer`` used by the batch loop."""
+
+    async def getmany(
+        self, *partitions: TopicPartition, timeout_ms: int = 0, max_records: int | None = None
+    ) -> dict[TopicPartition, list[ConsumerRecord]]: ...
+
+    async def commit(self, offsets: Mapping[TopicPartition, int] | None = None) -> None: ...
+
+    def seek(self, partition: TopicPartition, offset: int) -> None: ...
+
+    def assignment(self) -> set[TopicPartition]: ...
+
+    def pause(self, *partitions: TopicPartition) -> None: ...
+
+    def resume(self, *partitions: TopicPartition) -> None: ...
+
+    def paused(self) -> set[TopicPartition]: ...
+
+
+def parse_command(payload: Mapping[str, Any]) -> ProcessApplicationCommand:
+    """Translate a decoded Kafka payload into a processing command."""
+    return ProcessApplicationCommand(
+        applicant_id=str(payload["applicant_id"]),
+        amount=Decimal(str(payload["amount"])),
+        term_months=int(payload["term_months"]),
+    )
+
+
+def latest_per_applicant(payloads: Iterable[Mapping[str, Any]]) -> list[Mapping[str, Any]]:
+    """Collapse payloads to the last one seen per ``applicant_id``.
+
+    Payloads without an ``applicant_id`` are kept as-is so they surface as
+    processing failures instead of being silently dropped.
+    """
+    latest: dict[object, Mapping[str, Any]] = {}
+    for index, payload in enumerate(payloads):
+        key = payload.get("applicant_id") if isinstance(payload, Mapping) else None
+        if key is None:
+            key = ("__unkeyed__", index)
+        latest.pop(key, None)
+        latest[key] = payload
+    return list(latest.values())
+
+
+async def handle_payload(
+    process_application: ProcessApplication,
+    payload: Mapping[str, Any],
+) -> None:
+    """Process a single payload, swallowing (and counting) bad messages.
+
+    Malformed payloads and business-rule violations are logged and skipped;
+    any other error propagates so the caller can retry the record.
+    """
+    decision = decide_payload(process_application, payload)
+    if decision is None:
+        return
+    await record_decisions(process_application, [decision])
+
+
+def decide_payload(
+    process_application: ProcessApplication,
+    payload: Mapping[str, Any],
+) -> LoanApplication | None:
+    """Parse and decide ``payload``; ``None`` (counted and logged) when it is invalid."""
+    try:
+        return process_application.decide(parse_command(payload))
+    except (ApplicationValidationError, KeyError, TypeError, ValueError, InvalidOperation):
+        PROCESSING_FAILURES.inc()
+        LOGGER.exception("application_processing_failed", extra={"extra_data": dict(payload)})
+        return None
+
+
+async def record_decisions(
+    process_application: ProcessApplication,
+    decisions: Sequence[LoanApplication],
+) -> None:
+    """Persist decisions in one write and account for each stored application."""
+    if not decisions:
+        return
+    with PROCESSING_DURATION.time():
+        applications = await process_application.record(decisions)
+
+    for application in applications:
+        APPLICATIONS_PROCESSED.labels(status=application.status.value).inc()
+        LOGGER.info(
+            "application_processed",
+            extra={
+                "extra_data": {
+                    "applicant_id": application.applicant_id,
+                    "status": application.status.value,
+                    "amount": float(application.amount),
+                    "term_months": application.term_months,
+                }
+            },
+        )
+
+
+class BatchApplicationProcessor:
+    """Decide payloads and persist them in bulk, one write per lane.
+
+    ``concurrency`` bounds the lanes written at once. :meth:`process` splits a
+    de-duplicated batch into at most ``concurrency`` lanes;
+    :meth:`process_lanes` takes ordered lanes such as one per partition.
+    """
+
+    def __init__(self, process_application: ProcessApplication, concurrency: int) -> None:
+        self._process_application = process_application
+        self._concurrency = concurrency
+
+    async def process(self, payloads: Sequence[Mapping[str, Any]]) -> None:
+        """Persist the latest payload per applicant in up to ``concurrency`` parallel writes.
+
+        Each applicant appears once after de-duplication, so the chunks touch
+        disjoint rows and their writes need no ordering.
+        """
+        latest = latest_per_applicant(payloads)
+        chunk_size = max(1, -(-len(latest) // self._concurrency))
+        await self.process_lanes(
+            latest[start : start + chunk_size] for start in range(0, len(latest), chunk_size)
+        )
+
+    async def process_lanes(self, lanes: Iterable[Sequence[Mapping[str, Any]]]) -> None:
+        """Persist each lane with one write, with up to ``concurrency`` lanes in flight."""
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def _run_lane(lane: Sequence[Mapping[str, Any]]) -> None:
+            async with semaphore:
+                await self._process_lane(lane)
+
+        async with asyncio.TaskGroup() as group:
+            for lane in lanes:
+                group.create_task(_run_lane(lane))
+
+    async def _process_lane(self, lane: Sequence[Mapping[str, Any]]) -> None:
+        decisions = [
+            decision
+            for payload in lane
+            if (decision := decide_payload(self._process_application, payload)) is not None
+        ]
+        await record_decisions(self._process_application, decisions)
+
+
+def partition_lanes(batch: Batch) -> list[list[Mapping[str, Any]]]:
+    """One lane per partition, de-duplicated by applicant and kept in offset order."""
+    return [latest_per_applicant(record.value for record in records) for records in batch.values()]
+
+
+async def fetch_batch(
+    consumer: BatchConsumer,
+    settings: ProcessorSettings,
+    max_records: int | None = None,
+    into: dict[TopicPartition, list[ConsumerRecord]] | None = None,
+) -> Batch:
+    """Collect up to ``max_records`` (default ``batch_size``) records.
+
+    Blocks for up to ``_POLL_TIMEOUT_MS`` waiting for the first records, then
+    lingers at most ``linger_ms`` to fill the rest of the batch. Records are
+    added to ``into`` as they arrive, so a caller that is cancelled mid-fetch
+    still knows which records the consumer has already handed out.
+    """
+    limit = min(settings.batch_size, max_records or settings.batch_size)
+    collected: dict[TopicPartition, list[ConsumerRecord]] = {} if into is None else into
+    count = _merge(
+        collected,
+        await consumer.getmany(timeout_ms=_POLL_TIMEOUT_MS, max_records=limit),
+    )
+    deadline = time.monotonic() + settings.linger_ms / 1000
+    while 0 < count < limit:
+        remaining_ms = int((deadline - time.monotonic()) * 1000)
+        if remaining_ms <= 0:
+            break
+        fetched = await consumer.getmany(
+            timeout_ms=remaining_ms,
+            max_records=limit - count,
+        )
+        count += _merge(collected, fetched)
+    return collected
+
+
+def _merge(
+    collected: dict[TopicPartition, list[ConsumerRecord]],
+    fetched: Mapping[TopicPartition, Sequence[ConsumerRecord]],
+) -> int:
+    added = 0
+    for partition, records in fetched.items():
+        collected.setdefault(partition, []).extend(records)
+        added += len(records)
+    return added
+
+
+async def process_batch(
+    consumer: BatchConsumer,
+    processor: BatchApplicationProcessor,
+    batch: Batch,
+    settings: ProcessorSettings,
+) -> bool:
+    """Process and commit one batch; rewind and return ``False`` on failure."""
+    try:
+        await persist_batch(consumer, processor, batch, settings)
+    except REBALANCE_ERRORS:
+        rewind(consumer, [batch])
+        return False
+    except Exception:
+        rewind(consumer, [batch])
+        await asyncio.sleep(settings.retry_backoff_seconds)
+        return False
+    return True
+
+
+async def persist_batch(
+    consumer: BatchConsumer,
+    processor: BatchApplicationProcessor,
+    batch: Batch,
+    settings: ProcessorSettings,
+) -> None:
+    """Process one batch and commit its offsets; log, count and re-raise failures.
+
+    Only partitions still assigned are committed. A commit rejected because
+    the group rebalanced raises one of ``REBALANCE_ERRORS``; the records are
+    already persisted, so they only need to be refetched, not counted as a
+    failure.
+    """
+    payloads = [record.value for records in batch.values() for record in records]
+    BATCH_SIZE.observe(len(payloads))
+    started = time.perf_counter()
+    try:
+        if settings.ordering == "partition":
+            await processor.process_lanes(partition_lanes(batch))
+        else:
+            await processor.process(payloads)
+        assigned = consumer.assignment()
+        offsets = {
+            tp: records[-1].offset + 1
+            for tp, records in batch.items()
+            if records and tp in assigned
+        }
+        if offsets:
+            await consumer.commit(offsets)
+    except REBALANCE_ERRORS as exc:
+        LOGGER.warning(
+            "application_batch_commit_rejected",
+            extra={"extra_data": {"records": len(payloads), "error": repr(exc)}},
+        )
+        raise
+    except Exception:
+        BATCH_FAILURES.inc()
+        LOGGER.exception(
+            "application_batch_failed", extra={"extra_data": {"records": len(payloads)}}
+        )
+        raise
+    finally:
+        BATCH_DURATION.observe(time.perf_counter() - started)
+
+
+def rewind(consumer: BatchConsumer, batches: Iterable[Batch]) -> None:
+    """Seek every partition back to its earliest record in ``batches`` so they are redelivered.
+
+    Partitions no longer assigned (the failure may come from a rebalance) are
+    skipped; their new owner resumes from the last committed offset.
+    """
+    assigned = consumer.assignment()
+    earliest: dict[TopicPartition, int] = {}
+    for batch in batches:
+        for tp, records in batch.items():
+            if records and tp in assigned:
+                earliest[tp] = min(earliest.get(tp, records[0].offset), records[0].offset)
+    for tp, offset in earliest.items():
+        consumer.seek(tp, offset)
+
+
+def record_count(batch: Batch) -> int:
+    return sum(len(records) for records in batch.values())
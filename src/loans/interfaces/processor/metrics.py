@@ -0,0 +1,55 @@
+"""Prometheus metrics exported by the Kafka application processor."""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge, Histogram
+
+APPLICATIONS_PROCESSED = Counter(
+    "loan_applications_processed_total",
+    "Number of loan application messages processed",
+    labelnames=("status",),
+)
+PROCESSING_FAILURES = Counter(
+    "loan_application_processing_failures_total",
+    "Number of loan application messages that failed to process",
+)
+PROCESSING_DURATION = Histogram(
+    "loan_application_processing_seconds",
+    "Time spent processing loan application messages",
+)
+QUEUE_DEPTH = Gauge(
+    "loan_application_processor_queue_records",
+    "Records fetched from Kafka and waiting in the queue for processing",
+    multiprocess_mode="livesum",
+)
+IN_FLIGHT = Gauge(
+    "loan_application_processor_in_flight_records",
+    "Records fetched from Kafka whose offsets are not committed yet",
+    multiprocess_mode="livesum",
+)
+CONSUMER_PAUSED = Gauge(
+    "loan_application_processor_paused",
+    "Whether the consumer has paused its partitions because processing is slow",
+    multiprocess_mode="livesum",
+)
+CONSUMER_PAUSES = Counter(
+    "loan_application_processor_pauses_total",
+    "Number of times the consumer paused its partitions because processing was slow",
+)
+CONSUMER_PAUSED_SECONDS = Counter(
+    "loan_application_processor_paused_seconds_total",
+    "Time the consumer spent with its partitions paused",
+)
+BATCH_SIZE = Histogram(
+    "loan_application_batch_records",
+    "Number of Kafka records fetched per processing batch",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000),
+)
+BATCH_DURATION = Histogram(
+    "loan_application_batch_seconds",
+    "Time spent processing a batch of loan application messages, including the offset commit",
+)
+BATCH_FAILURES = Counter(
+    "loan_application_batch_failures_total",
+    "Number of processing batches rewound and retried after a downstream failure",
+)
@@ -0,0 +1,261 @@
+"""Fetch and process stages joined by a bounded queue, with consumer flow control."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Collection, Dict, Final, List
+
+from aiokafka import ConsumerRebalanceListener
+from aiokafka.structs import ConsumerRecord, TopicPartition
+
+from .batch import (
+    REBALANCE_ERRORS,
+    BatchApplicationProcessor,
+    BatchConsumer,
+    fetch_batch,
+    persist_batch,
+    record_count,
+    rewind,
+)
+from .metrics import (
+    CONSUMER_PAUSED,
+    CONSUMER_PAUSED_SECONDS,
+    CONSUMER_PAUSES,
+    IN_FLIGHT,
+    QUEUE_DEPTH,
+)
+from .settings import ProcessorSettings
+
+LOGGER: Final = logging.getLogger("loans.application_processor")
+
+_Batch = Dict[TopicPartition, List[ConsumerRecord]]
+
+
+class _BatchFailed(Exception):
+    """Raised by the process stage to stop the fetch stage and rewind."""
+
+
+class _CommitRejected(_BatchFailed):
+    """The group rebalanced under a batch; refetch without backing off."""
+
+
+class BackpressurePipeline:
+    """Fetch batches ahead of processing without letting work pile up.
+
+    The fetch stage puts batches on a queue holding at most
+    ``settings.queue_batches`` and waits while ``settings.max_in_flight``
+    records are fetched but not committed. The process stage persists and
+    commits batches one at a time, in fetch order, so offsets only ever move
+    past durable writes.
+
+    A batch slower than ``settings.pause_latency_ms`` pauses every assigned
+    partition, which also stops the client's background prefetch. Partitions
+    resume when a batch completes within ``settings.resume_latency_ms`` or,
+    once nothing is left in flight, after ``pause_latency_ms`` as a probe.
+
+    When a batch fails, both stages stop, every assigned partition is rewound
+    to its earliest uncommitted record and the pipeline restarts after
+    ``settings.retry_backoff_seconds``; a commit rejected by a rebalance
+    restarts it at once.
+
+    Subscribe with :class:`PipelineRebalanceListener` so records of revoked
+    partitions are dropped before their new owner starts on them.
+    """
+
+    def __init__(
+        self,
+        consumer: BatchConsumer,
+        processor: BatchApplicationProcessor,
+        settings: ProcessorSettings,
+    ) -> None:
+        self._consumer = consumer
+        self._processor = processor
+        self._settings = settings
+        self._queue: asyncio.Queue[_Batch] = asyncio.Queue(maxsize=max(1, settings.queue_batches))
+        # Every batch handed out by the consumer and not committed yet, oldest first;
+        # the last one may still be filling up.
+        self._outstanding: List[_Batch] = []
+        self._filling: _Batch | None = None
+        self._processing: _Batch | None = None
+        self._capacity = asyncio.Condition()
+        self._paused_since: float | None = None
+
+    @property
+    def in_flight(self) -> int:
+        return sum(record_count(batch) for batch in self._outstanding)
+
+    @property
+    def paused(self) -> bool:
+        return self._paused_since is not None
+
+    async def run(self) -> None:
+        """Fetch, process and commit until cancelled."""
+        try:
+            while True:
+                try:
+                    async with asyncio.TaskGroup() as group:
+                        group.create_task(self._fetch_loop())
+                        group.create_task(self._process_loop())
+                except* _CommitRejected:
+                    self._recover()
+                except* _BatchFailed:
+                    self._recover()
+                    await asyncio.sleep(self._settings.retry_backoff_seconds)
+        finally:
+            self._resume()
+
+    async def _fetch_loop(self) -> None:
+        while True:
+            async with self._capacity:
+                await self._capacity.wait_for(lambda: self.in_flight < self._settings.max_in_flight)
+            self._maybe_probe()
+
+            collected: _Batch = {}
+            self._outstanding.append(collected)
+            self._filling = collected
+            try:
+                await fetch_batch(
+                    self._consumer,
+                    self._settings,
+                    max_records=self._settings.max_in_flight - self.in_flight,
+                    into=collected,
+                )
+            finally:
+                self._filling = None
+            if not collected:
+                self._forget(collected)
+                continue
+            count = record_count(collected)
+            QUEUE_DEPTH.inc(count)
+            IN_FLIGHT.set(self.in_flight)
+            await self._queue.put(collected)
+
+    async def _process_loop(self) -> None:
+        while True:
+            batch = await self._queue.get()
+            QUEUE_DEPTH.dec(record_count(batch))
+            if not batch:  # every partition in it was revoked
+                self._forget(batch)
+                continue
+            started = time.perf_counter()
+            self._processing = batch
+            try:
+                await persist_batch(self._consumer, self._processor, batch, self._settings)
+            except REBALANCE_ERRORS as exc:
+                raise _CommitRejected() from exc
+            except Exception as exc:
+                raise _BatchFailed() from exc
+            finally:
+                self._processing = None
+            self._forget(batch)
+            IN_FLIGHT.set(self.in_flight)
+            async with self._capacity:
+                self._capacity.notify_all()
+            self._adjust_flow(time.perf_counter() - started)
+
+    async def revoke(self, partitions: Collection[TopicPartition]) -> None:
+        """Drop every fetched record of ``partitions``, which now belong to another consumer.
+
+        Revoked records of the batch being persisted are still written (the
+        writes are idempotent) but no longer committed.
+        """
+        revoked = set(partitions)
+        dropped = 0
+        for batch in self._outstanding:
+            for tp in revoked.intersection(batch):
+                count = len(batch.pop(tp))
+                dropped += count
+                if batch is not self._filling and batch is not self._processing:
+                    QUEUE_DEPTH.dec(count)
+        IN_FLIGHT.set(self.in_flight)
+        async with self._capacity:
+            self._capacity.notify_all()
+        LOGGER.info(
+            "processor_partitions_revoked",
+            extra={"extra_data": {"partitions": len(revoked), "dropped_records": dropped}},
+        )
+
+    def assign(self, partitions: Collection[TopicPartition]) -> None:
+        """Keep newly assigned partitions paused while the pipeline is paused."""
+        if self._paused_since is not None and partitions:
+            self._consumer.pause(*partitions)
+
+    def _forget(self, batch: _Batch) -> None:
+        self._outstanding = [pending for pending in self._outstanding if pending is not batch]
+
+    def _recover(self) -> None:
+        """Drop everything fetched but not committed and seek back to it."""
+        while not self._queue.empty():
+            QUEUE_DEPTH.dec(record_count(self._queue.get_nowait()))
+        rewind(self._consumer, self._outstanding)
+        self._outstanding.clear()
+        IN_FLIGHT.set(0)
+        self._resume()
+
+    def _adjust_flow(self, latency_seconds: float) -> None:
+        pause_at = self._settings.pause_latency_ms / 1000
+        if pause_at <= 0:
+            return
+        if self._paused_since is None and latency_seconds > pause_at:
+            partitions = self._consumer.assignment()
+            self._consumer.pause(*partitions)
+            self._paused_since = time.monotonic()
+            CONSUMER_PAUSES.inc()
+            CONSUMER_PAUSED.set(1)
+            LOGGER.warning(
+                "processor_paused",
+                extra={
+                    "extra_data": {
+                        "latency_seconds": round(latency_seconds, 3),
+                        "partitions": len(partitions),
+                        "queued_batches": self._queue.qsize(),
+                    }
+                },
+            )
+        elif (
+            self._paused_since is not None
+            and latency_seconds <= self._settings.resume_latency_ms / 1000
+        ):
+            self._resume()
+
+    def _maybe_probe(self) -> None:
+        if self._paused_since is None or self.in_flight > 0:
+            return
+        if time.monotonic() - self._paused_since >= self._settings.pause_latency_ms / 1000:
+            self._resume()
+
+    def _resume(self) -> None:
+        if self._paused_since is None:
+            return
+        paused_for = time.monotonic() - self._paused_since
+        self._paused_since = None
+        self._consumer.resume(*self._consumer.paused())
+        CONSUMER_PAUSED.set(0)
+        CONSUMER_PAUSED_SECONDS.inc(paused_for)
+        LOGGER.info(
+            "processor_resumed", extra={"extra_data": {"paused_seconds": round(paused_for, 3)}}
+        )
+
+
+class PipelineRebalanceListener(ConsumerRebalanceListener):
+    """Forward consumer-group rebalances to a :class:`BackpressurePipeline`."""
+
+    def __init__(self, pipeline: BackpressurePipeline) -> None:
+        self._pipeline = pipeline
+
+    async def on_partitions_revoked(self, revoked: Collection[TopicPartition]) -> None:
+        await self._pipeline.revoke(revoked)
+
+    async def on_partitions_assigned(self, assigned: Collection[TopicPartition]) -> None:
+        self._pipeline.assign(assigned)
+
+
+async def consume_batches(
+    consumer: BatchConsumer,
+    processor: BatchApplicationProcessor,
+    settings: ProcessorSettings,
+) -> None:
+    """Fetch, process, and commit batches until cancelled; see :class:`BackpressurePipeline`."""
+    await BackpressurePipeline(consumer, processor, settings).run()
@@ -0,0 +1,72 @@
+"""Environment-driven configuration for the Kafka application processor."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Literal
+
+ProcessorMode = Literal["batch", "stream"]
+ProcessorOrdering = Literal["key", "partition"]
+
+
+@dataclass(frozen=True)
+class ProcessorSettings:
+    """Tuning knobs for how records are fetched from Kafka and processed.
+
+    ``stream`` mode handles one record at a time with auto-committed offsets;
+    ``batch`` mode fetches up to ``batch_size`` records (waiting at most
+    ``linger_ms`` to fill a batch), persists them according to ``ordering``
+    and commits offsets only once the whole batch is written.
+
+    Records are keyed by applicant, so each applicant lives on one partition.
+    ``key`` ordering keeps the latest record per applicant across the batch
+    and splits them into up to ``concurrency`` writes run in parallel;
+    ``partition`` ordering runs one lane per partition, each persisted with its
+    own write, with up to ``concurrency`` lanes in flight.
+
+    In ``batch`` mode fetching runs ahead of processing through a queue of at
+    most ``queue_batches`` batches, and stops once ``max_in_flight`` records
+    are fetched but not yet committed. When a batch takes longer than
+    ``pause_latency_ms`` to persist, the assigned partitions are paused until a
+    batch completes within ``resume_latency_ms`` or, once everything queued is
+    done, ``pause_latency_ms`` has passed (``0`` disables pausing).
+
+    ``workers`` above one runs that many consumer processes under a
+    supervisor; each worker gets a share of the partitions.
+    """
+
+    mode: ProcessorMode = "batch"
+    batch_size: int = 500
+    concurrency: int = 32
+    linger_ms: int = 50
+    retry_backoff_seconds: float = 1.0
+    ordering: ProcessorOrdering = "key"
+    queue_batches: int = 2
+    max_in_flight: int = 2000
+    pause_latency_ms: int = 0
+    resume_latency_ms: int = 0
+    workers: int = 1
+    shutdown_timeout_seconds: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> "ProcessorSettings":
+        mode_env = os.getenv("PROCESSOR_MODE", "batch").lower()
+        ordering_env = os.getenv("PROCESSOR_ORDERING", "key").lower()
+        pause_latency_ms = max(0, int(os.getenv("PROCESSOR_PAUSE_LATENCY_MS", "0")))
+        return cls(
+            mode="stream" if mode_env == "stream" else "batch",
+            batch_size=max(1, int(os.getenv("PROCESSOR_BATCH_SIZE", "500"))),
+            concurrency=max(1, int(os.getenv("PROCESSOR_CONCURRENCY", "32"))),
+            linger_ms=max(0, int(os.getenv("PROCESSOR_LINGER_MS", "50"))),
+            retry_backoff_seconds=float(os.getenv("PROCESSOR_RETRY_BACKOFF_SECONDS", "1.0")),
+            ordering="partition" if ordering_env == "partition" else "key",
+            queue_batches=max(1, int(os.getenv("PROCESSOR_QUEUE_BATCHES", "2"))),
+            max_in_flight=max(1, int(os.getenv("PROCESSOR_MAX_IN_FLIGHT", "2000"))),
+            pause_latency_ms=pause_latency_ms,
+            resume_latency_ms=max(
+                0, int(os.getenv("PROCESSOR_RESUME_LATENCY_MS", str(pause_latency_ms // 2)))
+            ),
+            workers=max(1, int(os.getenv("PROCESSOR_WORKERS", "1"))),
+            shutdown_timeout_seconds=float(os.getenv("PROCESSOR_SHUTDOWN_TIMEOUT_SECONDS", "30")),
+        )
@@ -0,0 +1,157 @@
+"""Run several processor workers as separate processes in one consumer group."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import signal
+import tempfile
+import time
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from types import FrameType
+from typing import Callable, Dict, Final
+
+from prometheus_client import CollectorRegistry, start_http_server
+from prometheus_client import multiprocess
+
+LOGGER: Final = logging.getLogger(__name__)
+
+MULTIPROC_DIR_ENV: Final = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def prepare_multiprocess_metrics() -> Path:
+    """Point ``prometheus_client`` at an empty shared directory for worker metrics.
+
+    Must run before any worker starts; workers inherit the variable and write
+    their samples to per-process files there.
+    """
+    configured = os.getenv(MULTIPROC_DIR_ENV)
+    directory = Path(configured) if configured else Path(tempfile.mkdtemp(prefix="loans-metrics-"))
+    directory.mkdir(parents=True, exist_ok=True)
+    for stale in directory.glob("*.db"):
+        stale.unlink()
+    os.environ[MULTIPROC_DIR_ENV] = str(directory)
+    return directory
+
+
+def serve_multiprocess_metrics(port: int) -> None:
+    """Expose the metrics of every worker, aggregated, on ``port``."""
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    start_http_server(port, registry=registry)
+
+
+class WorkerSupervisor:
+    """Keep ``workers`` processes running ``target`` until asked to stop.
+
+    Workers are spawned (not forked), so each one builds its own container,
+    connection pools and producer from scratch. A worker that exits while the
+    supervisor is running is restarted on the first poll at least
+    ``restart_backoff_seconds`` after it exited, without holding up the
+    others. On SIGTERM/SIGINT every worker receives SIGTERM so it can leave
+    the consumer group cleanly; workers still alive after
+    ``shutdown_timeout_seconds`` are killed.
+
+    Every start, restart and exit rebalances the consumer group; workers
+    subscribe with :class:`~loans.interfaces.processor.PipelineRebalanceListener`
+    so siblings hand over revoked partitions instead of failing on them.
+    """
+
+    def __init__(
+        self,
+        target: Callable[[int], None],
+        workers: int,
+        shutdown_timeout_seconds: float = 30.0,
+        restart_backoff_seconds: float = 1.0,
+        poll_interval_seconds: float = 0.5,
+    ) -> None:
+        self._target = target
+        self._workers = max(1, workers)
+        self._shutdown_timeout_seconds = shutdown_timeout_seconds
+        self._restart_backoff_seconds = restart_backoff_seconds
+        self._poll_interval_seconds = poll_interval_seconds
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: Dict[int, BaseProcess] = {}
+        self._restart_at: Dict[int, float] = {}
+        self._stopping = False
+
+    def run(self) -> None:
+        """Start the workers and supervise them until a shutdown signal arrives."""
+        previous = {
+            signum: signal.signal(signum, self._request_stop)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        try:
+            for index in range(self._workers):
+                self._start(index)
+            while not self._stopping:
+                self._restart_exited()
+                time.sleep(self._poll_interval_seconds)
+        finally:
+            self._stop_all()
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+    def stop(self) -> None:
+        self._stopping = True
+
+    def _request_stop(self, signum: int, frame: FrameType | None) -> None:
+        LOGGER.info("processor_supervisor_stopping", extra={"extra_data": {"signal": signum}})
+        self.stop()
+
+    def _start(self, index: int) -> None:
+        process = self._context.Process(
+            target=self._target, args=(index,), name=f"processor-worker-{index}"
+        )
+        process.start()
+        self._processes[index] = process
+        LOGGER.info(
+            "processor_worker_started", extra={"extra_data": {"worker": index, "pid": process.pid}}
+        )
+
+    def _restart_exited(self) -> None:
+        now = time.monotonic()
+        for index, process in list(self._processes.items()):
+            if process.is_alive():
+                continue
+            if index not in self._restart_at:
+                _forget_worker_metrics(process)
+                LOGGER.error(
+                    "processor_worker_exited",
+                    extra={
+                        "extra_data": {
+                            "worker": index,
+                            "pid": process.pid,
+                            "exitcode": process.exitcode,
+                        }
+                    },
+                )
+                self._restart_at[index] = now + self._restart_backoff_seconds
+            if self._stopping or now < self._restart_at[index]:
+                continue
+            del self._restart_at[index]
+            self._start(index)
+
+    def _stop_all(self) -> None:
+        for process in self._processes.values():
+            if process.is_alive() and process.pid is not None:
+                os.kill(process.pid, signal.SIGTERM)
+        deadline = time.monotonic() + self._shutdown_timeout_seconds
+        for process in self._processes.values():
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                LOGGER.warning(
+                    "processor_worker_killed", extra={"extra_data": {"pid": process.pid}}
+                )
+                process.kill()
+                process.join()
+            _forget_worker_metrics(process)
+        self._processes.clear()
+        self._restart_at.clear()
+
+
+def _forget_worker_metrics(process: BaseProcess) -> None:
+    if process.pid is not None and os.getenv(MULTIPROC_DIR_ENV):
+        multiprocess.mark_process_dead(process.pid)
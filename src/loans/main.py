@@ -4,13 +4,14 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from .interfaces.http.dependencies import shutdown_container
+from .interfaces.http.dependencies import shutdown_container, startup_container
 from .interfaces.http.routes import register_routes
 from .utils.logging import configure_logging
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    await startup_container()
     yield
     await shutdown_container()
 
@@ -0,0 +1,100 @@
+"""Asyncio helpers for de-duplicating and coalescing concurrent lookups."""
+
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Mapping, Sequence, Set, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """Run at most one loader per key at a time and share its result.
+
+    The loader runs in its own task, so a cancelled caller (e.g. a client that
+    disconnected) does not cancel the lookup for the other waiters.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[K, asyncio.Future[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(loader())
+            self._inflight[key] = future
+            future.add_done_callback(partial(self._forget, key))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: K, future: asyncio.Future[V]) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()  # mark as retrieved when every waiter has gone away
+
+
+class MicroBatcher(Generic[K, V]):
+    """Coalesce single-key loads issued within a short window into one bulk load.
+
+    The first ``load`` opens a window of ``window_seconds``; every key requested
+    before it closes (or until ``max_batch_size`` keys are pending) is resolved
+    by a single ``bulk_loader`` call. Keys missing from its result resolve to
+    ``None``.
+    """
+
+    def __init__(
+        self,
+        bulk_loader: Callable[[Sequence[K]], Awaitable[Mapping[K, V]]],
+        window_seconds: float,
+        max_batch_size: int = 100,
+    ) -> None:
+        self._bulk_loader = bulk_loader
+        self._window_seconds = window_seconds
+        self._max_batch_size = max(1, max_batch_size)
+        self._pending: Dict[K, asyncio.Future[V | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._running: Set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> V | None:
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self._max_batch_size:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self._window_seconds, self._flush)
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: Dict[K, asyncio.Future[V | None]]) -> None:
+        try:
+            results = await self._bulk_loader(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
@@ -0,0 +1,138 @@
+"""Fast JSON encoding with optional native backends.
+
+The module picks the fastest installed backend – ``orjson``, then ``msgspec``,
+then the standard library – unless ``JSON_BACKEND`` names one explicitly.
+All backends emit ``Decimal`` as a string and ``datetime``/``date`` as ISO
+8601, and return ``bytes`` so payloads can go straight onto the wire.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Final, Protocol
+
+
+class JsonCodec(Protocol):
+    """Encode and decode JSON documents."""
+
+    name: str
+
+    def dumps(self, value: Any, *, lenient: bool = False) -> bytes:
+        """Serialize ``value``; ``lenient`` falls back to ``str()`` for unknown types."""
+        ...
+
+    def loads(self, data: bytes | str) -> Any: ...
+
+
+def _convert(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _convert_lenient(value: Any) -> Any:
+    try:
+        return _convert(value)
+    except TypeError:
+        return str(value)
+
+
+class StdlibJsonCodec:
+    """Pure-Python fallback built on :mod:`json`."""
+
+    name = "json"
+
+    def dumps(self, value: Any, *, lenient: bool = False) -> bytes:
+        return json.dumps(
+            value,
+            default=_convert_lenient if lenient else _convert,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """``orjson`` backend; serializes datetimes natively."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, value: Any, *, lenient: bool = False) -> bytes:
+        return self._dumps(value, default=_convert_lenient if lenient else _convert)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._loads(data)
+
+
+class MsgspecJsonCodec:
+    """``msgspec`` backend; serializes Decimal and datetimes natively."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._strict = msgspec.json.Encoder(enc_hook=_convert, decimal_format="string")
+        self._lenient = msgspec.json.Encoder(enc_hook=_convert_lenient, decimal_format="string")
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any, *, lenient: bool = False) -> bytes:
+        encoded: bytes = (self._lenient if lenient else self._strict).encode(value)
+        return encoded
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+_BACKENDS: Final[Dict[str, Callable[[], JsonCodec]]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecJsonCodec,
+    "json": StdlibJsonCodec,
+}
+
+
+def available_codecs() -> Dict[str, JsonCodec]:
+    """Return every backend importable in this environment, fastest first."""
+    codecs: Dict[str, JsonCodec] = {}
+    for name, factory in _BACKENDS.items():
+        try:
+            codecs[name] = factory()
+        except ImportError:
+            continue
+    return codecs
+
+
+def _select_codec() -> JsonCodec:
+    requested = os.getenv("JSON_BACKEND", "auto").lower()
+    codecs = available_codecs()
+    if requested in codecs:
+        return codecs[requested]
+    return next(iter(codecs.values()))
+
+
+codec: Final[JsonCodec] = _select_codec()
+
+
+def dumps(value: Any, *, lenient: bool = False) -> bytes:
+    """Serialize ``value`` to JSON bytes using the selected backend."""
+    return codec.dumps(value, lenient=lenient)
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document using the selected backend."""
+    return codec.loads(data)
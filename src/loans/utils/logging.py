@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
-import json
+import atexit
 import logging
 import os
+import random
 import sys
-from typing import Dict
+from logging.handlers import QueueHandler, QueueListener
+from queue import Full, Queue
+from typing import Dict, Mapping
+
+from prometheus_client import Counter
+
+from . import json_codec
+
+LOG_RECORDS_DROPPED = Counter(
+    "loan_application_log_records_dropped_total",
+    "Log records discarded because the log queue was full",
+)
 
 _LEVEL_NAMES: Dict[str, int] = {
     "critical": logging.CRITICAL,
@@ -36,21 +48,114 @@ class JsonFormatter(logging.Formatter):
             log.update(extra)
         if record.exc_info:
             log["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(log, default=str)
+        return json_codec.dumps(log, lenient=True).decode("utf-8")
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of the records for selected events.
+
+    Records are matched on their message, which is the event name throughout
+    the service. Warnings and errors are always kept.
+    """
+
+    def __init__(self, rates: Mapping[str, float]) -> None:
+        super().__init__()
+        self.rates = dict(rates)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not isinstance(record.msg, str):
+            return True
+        rate = self.rates.get(record.msg)
+        return rate is None or random.random() < rate
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Hand records to a :class:`QueueListener` without ever blocking the caller.
+
+    Records are queued as they are, so formatting happens in the listener
+    thread; when the queue is full the record is dropped and counted.
+    """
 
+    def __init__(self, queue: Queue[logging.LogRecord]) -> None:
+        super().__init__(queue)
+        self.dropped = 0
 
-def configure_logging(level: str | None = None) -> None:
-    """Configure root logging to emit JSON messages to stdout."""
-    resolved_level = _LEVEL_NAMES.get((level or os.getenv("LOG_LEVEL", "info")).lower(), logging.INFO)
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            self.dropped += 1
+            LOG_RECORDS_DROPPED.inc()
+
+
+_LISTENER: QueueListener | None = None
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """Parse ``event=rate`` pairs separated by commas, e.g. ``application_status_fetched=0.01``."""
+    rates: Dict[str, float] = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        event, _, rate = item.partition("=")
+        rates[event.strip()] = min(1.0, max(0.0, float(rate)))
+    return rates
+
+
+def configure_logging(
+    level: str | None = None,
+    queue_size: int | None = None,
+    sample_rates: Mapping[str, float] | None = None,
+) -> None:
+    """Configure root logging to emit JSON messages to stdout.
+
+    Unless the root logger already has handlers, records go through a bounded
+    queue of ``queue_size`` records (``LOG_QUEUE_SIZE``, ``0`` writes
+    synchronously) to a background thread that formats and writes them, so a
+    slow stdout never stalls the event loop. ``sample_rates``
+    (``LOG_SAMPLE_RATES``) keeps only that fraction of the named events.
+    """
+    global _LISTENER
+    level_name: str = level or os.getenv("LOG_LEVEL") or "info"
+    resolved_level = _LEVEL_NAMES.get(level_name.lower(), logging.INFO)
+    if queue_size is None:
+        queue_size = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+    if sample_rates is None:
+        sample_rates = parse_sample_rates(os.getenv("LOG_SAMPLE_RATES", ""))
     root = logging.getLogger()
     logging.captureWarnings(True)
 
     if not root.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(JsonFormatter())
-        root.addHandler(handler)
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(JsonFormatter())
+        if queue_size > 0:
+            queued = DroppingQueueHandler(Queue(maxsize=queue_size))
+            _LISTENER = QueueListener(queued.queue, output, respect_handler_level=True)
+            _LISTENER.start()
+            atexit.register(shutdown_logging)
+            root.addHandler(queued)
+        else:
+            root.addHandler(output)
     else:
-        for handler in root.handlers:
-            handler.setFormatter(JsonFormatter())
+        for existing in root.handlers:
+            if not isinstance(existing, DroppingQueueHandler):
+                existing.setFormatter(JsonFormatter())
+
+    for configured in root.handlers:
+        for stale in [item for item in configured.filters if isinstance(item, SamplingFilter)]:
+            configured.removeFilter(stale)
+        if sample_rates:
+            configured.addFilter(SamplingFilter(sample_rates))
 
     root.setLevel(resolved_level)
+
+
+def shutdown_logging() -> None:
+    """Write out every queued record and stop the background log thread."""
+    global _LISTENER
+    listener, _LISTENER = _LISTENER, None
+    if listener is not None:
+        listener.stop()
@@ -15,7 +15,11 @@ from loans.application import (
     ProcessApplicationCommand,
 )
 from loans.domain import ApplicationStatus
-from loans.interfaces.http.dependencies import AppContainer, override_container, container as default_container
+from loans.interfaces.http.dependencies import (
+    AppContainer,
+    override_container,
+    container as default_container,
+)
 from loans.main import create_app
 from loans.infrastructure.messaging import InMemoryApplicationEventPublisher
 
@@ -55,7 +59,6 @@ async def test_submit_application_flow() -> None:
 
             processor = ProcessApplication(
                 repository=container.application_repository,
-                cache=container.status_cache,
                 approval_threshold=Decimal("5000"),
             )
             processed = await processor.execute(
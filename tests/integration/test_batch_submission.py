@@ -0,0 +1,70 @@
+"""Integration tests for bulk application submission."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import cast
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from loans.domain import ApplicationStatus, LoanApplication
+from loans.infrastructure.messaging import InMemoryApplicationEventPublisher
+from loans.interfaces.http.dependencies import (
+    AppContainer,
+    override_container,
+    container as default_container,
+)
+from loans.main import create_app
+
+
+@pytest.mark.asyncio
+async def test_submit_applications_reports_per_item_results() -> None:
+    container = AppContainer(
+        repository_backend="memory", cache_backend="memory", publisher_backend="memory"
+    )
+    original_container = default_container
+    override_container(container)
+    app = create_app()
+
+    await container.application_repository.create(
+        LoanApplication(applicant_id="existing", amount=Decimal("1000"), term_months=12)
+    )
+    items = [
+        {"applicant_id": "new-1", "amount": "1500.00", "term_months": 12},
+        {"applicant_id": "existing", "amount": "2000.00", "term_months": 24},
+        {"applicant_id": "bad", "amount": "-1", "term_months": 12},
+        {"applicant_id": "new-1", "amount": "9999.00", "term_months": 6},
+        {"applicant_id": "new-2", "amount": "800", "term_months": 90},
+        {"applicant_id": "new-3", "amount": "800", "term_months": 60},
+    ]
+
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/application/batch", json={"items": items})
+
+        assert response.status_code == 202
+        body = response.json()
+        assert [(r["applicant_id"], r["result"]) for r in body["results"]] == [
+            ("new-1", "accepted"),
+            ("existing", "duplicate"),
+            ("bad", "invalid"),
+            ("new-1", "duplicate"),
+            ("new-2", "invalid"),
+            ("new-3", "accepted"),
+        ]
+        assert (body["accepted"], body["duplicate"], body["invalid"]) == (2, 2, 2)
+        assert "amount" in body["results"][2]["detail"]
+
+        publisher = cast(InMemoryApplicationEventPublisher, container.event_publisher)
+        assert [m.applicant_id for m in publisher.get_messages(container.kafka_topic)] == [
+            "new-1",
+            "new-3",
+        ]
+
+        latest = await container.application_repository.get_latest("new-1")
+        assert latest is not None
+        assert latest.status == ApplicationStatus.PENDING
+        assert str(latest.amount) == "1500.00"
+    finally:
+        override_container(original_container)
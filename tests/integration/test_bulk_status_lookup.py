@@ -0,0 +1,87 @@
+"""Integration tests for the bulk status lookup endpoint."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from loans.domain import ApplicationStatus, LoanApplication
+from loans.infrastructure import CachedLoanApplicationRepository, InMemoryLoanApplicationRepository
+from loans.interfaces.http import routes
+from loans.interfaces.http.dependencies import (
+    AppContainer,
+    override_container,
+    container as default_container,
+)
+from loans.main import create_app
+
+
+def _application(applicant_id: str) -> LoanApplication:
+    return LoanApplication(applicant_id=applicant_id, amount=Decimal("250"), term_months=12)
+
+
+@pytest.mark.asyncio
+async def test_get_application_statuses_resolves_cache_and_database() -> None:
+    container = AppContainer(
+        repository_backend="memory", cache_backend="memory", publisher_backend="memory"
+    )
+    backing = InMemoryLoanApplicationRepository()
+    container.application_repository = CachedLoanApplicationRepository(
+        backing=backing, cache=container.status_cache, cache_ttl_seconds=3600
+    )
+    original_container = default_container
+    override_container(container)
+    app = create_app()
+
+    await backing.upsert(_application("cached"))
+    await container.status_cache.set(
+        _application("cached").with_status(ApplicationStatus.APPROVED), ttl_seconds=3600
+    )
+    await backing.upsert(_application("db-only"))
+
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get(
+                "/application", params={"ids": "db-only,cached,ghost,cached"}
+            )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [(a["applicant_id"], a["status"]) for a in body["applications"]] == [
+            ("db-only", "pending"),
+            ("cached", "approved"),
+        ]
+        assert body["missing"] == ["ghost"]
+        assert await container.status_cache.get("db-only") is not None
+    finally:
+        override_container(original_container)
+
+
+@pytest.mark.asyncio
+async def test_get_application_statuses_streams_large_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    container = AppContainer(
+        repository_backend="memory", cache_backend="memory", publisher_backend="memory"
+    )
+    container.status_lookup_chunk_size = 2
+    original_container = default_container
+    override_container(container)
+    monkeypatch.setattr(routes, "STREAM_LOOKUP_THRESHOLD", 2)
+    app = create_app()
+
+    ids = [f"applicant-{index}" for index in range(5)]
+    await container.application_repository.upsert_many([_application(i) for i in ids[:4]])
+
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/application", params=[("ids", i) for i in ids])
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [a["applicant_id"] for a in body["applications"]] == ids[:4]
+        assert body["missing"] == ["applicant-4"]
+    finally:
+        override_container(original_container)
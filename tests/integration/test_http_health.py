@@ -1,7 +1,11 @@
 """Integration-level HTTP test stubs."""
 
+import pytest
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
+from loans.interfaces.http.dependencies import AppContainer, override_container
+from loans.interfaces.http.dependencies import container as default_container
 from loans.main import create_app
 
 
@@ -12,3 +16,31 @@ def test_healthcheck_returns_ok() -> None:
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exports_adapter_timings() -> None:
+    container = AppContainer(
+        repository_backend="memory", cache_backend="memory", publisher_backend="memory"
+    )
+    original_container = default_container
+    override_container(container)
+    app = create_app()
+
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            await client.get("/application/unknown-applicant")
+            response = await client.get("/metrics")
+    finally:
+        override_container(original_container)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        "loan_application_adapter_operation_seconds_count"
+        '{backend="memory",operation="get_latest",port="repository"}' in response.text
+    )
+    assert (
+        'loan_application_cache_lookups_total{backend="memory",result="miss",tier="l2"}'
+        in response.text
+    )
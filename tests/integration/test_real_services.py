@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import os
 from decimal import Decimal
 from uuid import uuid4
 
 import pytest
 
 from loans.application import GetApplicationStatus, ProcessApplication, ProcessApplicationCommand
-from loans.application.ports import ApplicationStatusCache, LoanApplicationRepository
+from loans.application.ports import ApplicationStatusCache, CacheMarker, LoanApplicationRepository
+from loans.domain import ApplicationStatus, LoanApplication
+from loans.infrastructure import PostgresLoanApplicationRepository
+from loans.infrastructure.cache import (
+    HashBucketLayout,
+    RedisStatusCache,
+    StringKeyLayout,
+    create_redis_client,
+)
 from loans.interfaces.http.dependencies import AppContainer, cleanup_container
 from sqlalchemy import text
 
-from loans.infrastructure.db import get_engine, initialize_database
+from loans.infrastructure.db import create_session_factory, get_engine, initialize_database
+from loans.infrastructure.messaging import InMemoryApplicationEventPublisher, OutboxRelay
 
 
 @pytest.mark.asyncio
@@ -21,9 +31,8 @@ async def test_process_application_with_real_services() -> None:
     await initialize_database()
 
     repository: LoanApplicationRepository = container.application_repository
-    cache: ApplicationStatusCache = container.status_cache
 
-    processor = ProcessApplication(repository=repository, cache=cache)
+    processor = ProcessApplication(repository=repository)
     applicant_id = f"applicant-real-{uuid4().hex[:8]}"
 
     command = ProcessApplicationCommand(
@@ -50,4 +59,157 @@ async def test_process_application_with_real_services() -> None:
 async def _truncate_tables() -> None:
     engine = get_engine()
     async with engine.begin() as conn:
-        await conn.execute(text("TRUNCATE TABLE loan_applications"))
+        await conn.execute(text("TRUNCATE TABLE loan_applications, application_outbox"))
+
+
+@pytest.mark.asyncio
+async def test_repository_batch_operations_with_real_services() -> None:
+    container = AppContainer()
+    await initialize_database()
+
+    repository: LoanApplicationRepository = container.application_repository
+    prefix = f"applicant-bulk-{uuid4().hex[:8]}"
+    applications = [
+        LoanApplication(applicant_id=f"{prefix}-{index}", amount=Decimal("100"), term_months=12)
+        for index in range(3)
+    ]
+
+    try:
+        await repository.upsert_many(applications)
+        await repository.upsert_many([applications[0].with_status(ApplicationStatus.APPROVED)])
+
+        found = await repository.get_latest_many(
+            [app.applicant_id for app in applications] + ["unknown"]
+        )
+        assert set(found) == {app.applicant_id for app in applications}
+        assert found[applications[0].applicant_id].status == ApplicationStatus.APPROVED
+
+        fresh = LoanApplication(applicant_id=f"{prefix}-fresh", amount=Decimal("10"), term_months=3)
+        created = await repository.create_many([applications[1], fresh, fresh])
+        assert created == [fresh.applicant_id]
+    finally:
+        await cleanup_container(container)
+        await _truncate_tables()
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_batch_operations_with_real_services() -> None:
+    container = AppContainer()
+    cache: ApplicationStatusCache = container.status_cache
+    prefix = f"applicant-cache-{uuid4().hex[:8]}"
+    applications = [
+        LoanApplication(applicant_id=f"{prefix}-{index}", amount=Decimal("42.50"), term_months=6)
+        for index in range(5)
+    ]
+
+    try:
+        await cache.set_many(applications, ttl_seconds=60)
+
+        found = await cache.get_many(
+            [app.applicant_id for app in applications] + [f"{prefix}-missing"]
+        )
+        assert set(found) == {app.applicant_id for app in applications}
+        assert found[applications[0].applicant_id].amount == Decimal("42.50")
+    finally:
+        await cleanup_container(container)
+
+
+@pytest.mark.asyncio
+async def test_postgres_stream_latest_filters_by_status() -> None:
+    container = AppContainer()
+    await initialize_database()
+
+    assert container.session_factory is not None
+    repository = PostgresLoanApplicationRepository(container.session_factory)
+    prefix = f"applicant-stream-{uuid4().hex[:8]}"
+    pending = LoanApplication(applicant_id=f"{prefix}-pending", amount=Decimal("10"), term_months=3)
+    approved = LoanApplication(
+        applicant_id=f"{prefix}-approved",
+        amount=Decimal("10"),
+        term_months=3,
+        status=ApplicationStatus.APPROVED,
+    )
+
+    try:
+        await repository.upsert_many([pending, approved])
+
+        streamed = [
+            application.applicant_id
+            async for chunk in repository.stream_latest(
+                statuses=[ApplicationStatus.PENDING], chunk_size=1
+            )
+            for application in chunk
+        ]
+        assert pending.applicant_id in streamed
+        assert approved.applicant_id not in streamed
+    finally:
+        await cleanup_container(container)
+        await _truncate_tables()
+
+
+@pytest.mark.asyncio
+async def test_redis_hash_layout_and_migration_with_real_services() -> None:
+    client = create_redis_client(os.getenv("REDIS_URL", "redis://redis:6379/0"))
+    prefix = f"applicant-layout-{uuid4().hex[:8]}"
+    namespace = f"test:{prefix}"
+    legacy = RedisStatusCache(client, layout=StringKeyLayout(prefix=f"{namespace}:legacy:"))
+    cache = RedisStatusCache(client, layout=HashBucketLayout(prefix=namespace, buckets=8))
+    applications = [
+        LoanApplication(applicant_id=f"{prefix}-{index}", amount=Decimal("10.25"), term_months=6)
+        for index in range(10)
+    ]
+
+    try:
+        await legacy.set_many(applications, ttl_seconds=60)
+
+        migrated = await cache.migrate_from(
+            StringKeyLayout(prefix=f"{namespace}:legacy:"), ttl_seconds=60, delete_source=True
+        )
+        assert migrated == len(applications)
+        assert await legacy.get_many([app.applicant_id for app in applications]) == {}
+
+        found = await cache.get_many([app.applicant_id for app in applications])
+        assert set(found) == {app.applicant_id for app in applications}
+
+        await cache.mark_absent([applications[0].applicant_id, f"{prefix}-ghost"], ttl_seconds=5)
+        assert await cache.get(applications[0].applicant_id) is not None
+        assert await cache.lookup(f"{prefix}-ghost") is CacheMarker.ABSENT
+    finally:
+        keys = [key async for key in client.scan_iter(match=f"{namespace}*")]
+        if keys:
+            await client.delete(*keys)
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_with_real_services() -> None:
+    await initialize_database()
+    session_factory = create_session_factory()
+    repository = PostgresLoanApplicationRepository(session_factory, outbox_topic="outbox-test")
+    publisher = InMemoryApplicationEventPublisher()
+    relay = OutboxRelay(session_factory, publisher, batch_size=2)
+    prefix = f"applicant-outbox-{uuid4().hex[:8]}"
+    first = LoanApplication(applicant_id=f"{prefix}-0", amount=Decimal("10.50"), term_months=6)
+    others = [
+        LoanApplication(applicant_id=f"{prefix}-{index}", amount=Decimal("20"), term_months=12)
+        for index in range(1, 3)
+    ]
+
+    try:
+        await _truncate_tables()
+        await repository.create(first)
+        assert await repository.create_many([first, *others]) == [
+            app.applicant_id for app in others
+        ]
+
+        assert await relay.relay_batch() == 2
+        assert await relay.relay_batch() == 1
+        assert await relay.relay_batch() == 0
+
+        published = publisher.get_messages("outbox-test")
+        assert [message.applicant_id for message in published] == [first.applicant_id] + [
+            app.applicant_id for app in others
+        ]
+        assert published[0].amount == Decimal("10.50")
+    finally:
+        await _truncate_tables()
@@ -0,0 +1,100 @@
+"""Integration tests for server-sent status events."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from decimal import Decimal
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from loans.application import ProcessApplication, ProcessApplicationCommand
+from loans.domain import LoanApplication
+from loans.interfaces.http.dependencies import (
+    AppContainer,
+    override_container,
+    container as default_container,
+)
+from loans.main import create_app
+
+
+@pytest.mark.asyncio
+async def test_status_events_push_decision_and_close() -> None:
+    container = AppContainer(
+        repository_backend="memory", cache_backend="memory", publisher_backend="memory"
+    )
+    original_container = default_container
+    override_container(container)
+    app = create_app()
+    await container.application_repository.create(
+        LoanApplication(applicant_id="watched", amount=Decimal("1200"), term_months=12)
+    )
+    processor = ProcessApplication(
+        repository=container.application_repository,
+        status_notifier=container.status_changes,
+    )
+
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            stream = asyncio.create_task(client.get("/application/watched/events"))
+            while not len(container.status_watch):
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.01)
+            await processor.execute(
+                ProcessApplicationCommand(
+                    applicant_id="watched", amount=Decimal("1200"), term_months=12
+                )
+            )
+            response = await asyncio.wait_for(stream, timeout=5)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            json.loads(line.removeprefix("data: "))
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+        ]
+        assert events[-1]["status"] == "approved"
+        assert [event["status"] for event in events[:-1]] in ([], ["pending"])
+        assert len(container.status_watch) == 0
+    finally:
+        override_container(original_container)
+
+
+@pytest.mark.asyncio
+async def test_long_poll_returns_when_status_moves_past_since() -> None:
+    container = AppContainer(
+        repository_backend="memory", cache_backend="memory", publisher_backend="memory"
+    )
+    original_container = default_container
+    override_container(container)
+    app = create_app()
+    pending = LoanApplication(applicant_id="polled", amount=Decimal("9000"), term_months=12)
+    await container.application_repository.create(pending)
+    processor = ProcessApplication(
+        repository=container.application_repository,
+        status_notifier=container.status_changes,
+    )
+    params = {"wait": 5, "since": pending.updated_at.isoformat()}
+
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            timed_out = await client.get("/application/polled", params={**params, "wait": 0.05})
+            assert timed_out.json()["status"] == "pending"
+
+            poll = asyncio.create_task(client.get("/application/polled", params=params))
+            while not len(container.status_watch):
+                await asyncio.sleep(0.01)
+            await processor.execute(
+                ProcessApplicationCommand(
+                    applicant_id="polled", amount=Decimal("9000"), term_months=12
+                )
+            )
+            response = await asyncio.wait_for(poll, timeout=5)
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "rejected"
+        assert len(container.status_watch) == 0
+    finally:
+        override_container(original_container)
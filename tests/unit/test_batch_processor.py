@@ -0,0 +1,396 @@
+"""Unit tests for the batched Kafka processing pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+from typing import Any, Mapping, Sequence
+
+import pytest
+from aiokafka.errors import CommitFailedError, IllegalStateError
+from aiokafka.structs import ConsumerRecord, TopicPartition
+
+from loans.application import ProcessApplication
+from loans.domain import ApplicationStatus, LoanApplication
+from loans.infrastructure import (
+    CachedLoanApplicationRepository,
+    InMemoryLoanApplicationRepository,
+    InMemoryStatusCache,
+)
+from loans.interfaces.processor import (
+    BatchApplicationProcessor,
+    ProcessorSettings,
+    latest_per_applicant,
+)
+from loans.interfaces.processor import BackpressurePipeline, PipelineRebalanceListener
+from loans.interfaces.processor.batch import fetch_batch, process_batch
+
+TOPIC = "loan-applications"
+
+
+def _record(partition: int, offset: int, value: Mapping[str, Any]) -> ConsumerRecord:
+    return ConsumerRecord(
+        topic=TOPIC,
+        partition=partition,
+        offset=offset,
+        timestamp=0,
+        timestamp_type=0,
+        key=None,
+        value=value,
+        checksum=None,
+        serialized_key_size=0,
+        serialized_value_size=0,
+        headers=(),
+    )
+
+
+class FakeConsumer:
+    def __init__(self, batches: list[dict[TopicPartition, list[ConsumerRecord]]]) -> None:
+        self._batches = batches
+        self.committed: list[dict[TopicPartition, int]] = []
+        self.seeks: list[tuple[TopicPartition, int]] = []
+        self.fetch_limits: list[int | None] = []
+        self.paused_partitions: set[TopicPartition] = set()
+        self.pause_calls = 0
+        self.assigned = {TopicPartition(TOPIC, 0), TopicPartition(TOPIC, 1)}
+        self.rejected_commits = 0
+
+    async def getmany(
+        self, *partitions: TopicPartition, timeout_ms: int = 0, max_records: int | None = None
+    ) -> dict[TopicPartition, list[ConsumerRecord]]:
+        if not self._batches:
+            await asyncio.sleep(0.001)
+            return {}
+        self.fetch_limits.append(max_records)
+        return self._batches.pop(0)
+
+    async def commit(self, offsets: Mapping[TopicPartition, int] | None = None) -> None:
+        for partition in offsets or {}:
+            self._require_assigned(partition)
+        if self.rejected_commits:
+            self.rejected_commits -= 1
+            raise CommitFailedError("group rebalanced")
+        self.committed.append(dict(offsets or {}))
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        self._require_assigned(partition)
+        self.seeks.append((partition, offset))
+
+    def assignment(self) -> set[TopicPartition]:
+        return set(self.assigned)
+
+    def _require_assigned(self, partition: TopicPartition) -> None:
+        if partition not in self.assigned:
+            raise IllegalStateError(f"No current assignment for partition {partition}")
+
+    def pause(self, *partitions: TopicPartition) -> None:
+        self.pause_calls += 1
+        self.paused_partitions.update(partitions)
+
+    def resume(self, *partitions: TopicPartition) -> None:
+        self.paused_partitions.difference_update(partitions)
+
+    def paused(self) -> set[TopicPartition]:
+        return set(self.paused_partitions)
+
+
+class FailingProcessor:
+    async def process(self, payloads: object) -> None:
+        raise ConnectionError("database unavailable")
+
+
+def _processor() -> tuple[BatchApplicationProcessor, CachedLoanApplicationRepository]:
+    cache = InMemoryStatusCache()
+    repository = CachedLoanApplicationRepository(
+        backing=InMemoryLoanApplicationRepository(), cache=cache, cache_ttl_seconds=60
+    )
+    use_case = ProcessApplication(repository=repository)
+    return BatchApplicationProcessor(use_case, concurrency=4), repository
+
+
+def test_latest_per_applicant_keeps_last_payload() -> None:
+    payloads = [
+        {"applicant_id": "a", "amount": "100", "term_months": 12},
+        {"applicant_id": "b", "amount": "200", "term_months": 12},
+        {"applicant_id": "a", "amount": "9000", "term_months": 12},
+        {"amount": "1"},
+    ]
+
+    result = latest_per_applicant(payloads)
+
+    assert [p.get("applicant_id") for p in result] == ["b", "a", None]
+    assert result[1]["amount"] == "9000"
+
+
+@pytest.mark.asyncio
+async def test_batch_processor_persists_deduplicated_payloads() -> None:
+    processor, repository = _processor()
+
+    await processor.process(
+        [
+            {"applicant_id": "a", "amount": "100", "term_months": 12},
+            {"applicant_id": "bad", "amount": "-5", "term_months": 12},
+            {"applicant_id": "a", "amount": "9000", "term_months": 12},
+        ]
+    )
+
+    latest = await repository.get_latest("a")
+    assert latest is not None
+    assert latest.amount == Decimal("9000")
+    assert latest.status == ApplicationStatus.REJECTED
+    assert await repository.get_latest("bad") is None
+
+
+class ChunkRecordingRepository(InMemoryLoanApplicationRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: list[list[str]] = []
+
+    async def record_decisions(
+        self, applications: Sequence[LoanApplication]
+    ) -> list[LoanApplication]:
+        self.writes.append([app.applicant_id for app in applications])
+        return await super().record_decisions(applications)
+
+
+@pytest.mark.asyncio
+async def test_batch_processor_splits_key_ordered_batch_across_concurrency() -> None:
+    repository = ChunkRecordingRepository()
+    processor = BatchApplicationProcessor(ProcessApplication(repository=repository), concurrency=2)
+    applicant_ids = ["a", "b", "c", "a", "d", "e"]
+
+    await processor.process(
+        [{"applicant_id": id_, "amount": "100", "term_months": 12} for id_ in applicant_ids]
+    )
+
+    assert sorted(repository.writes) == [["b", "c", "a"], ["d", "e"]]
+
+
+@pytest.mark.asyncio
+async def test_process_batch_commits_next_offset_per_partition() -> None:
+    processor, _ = _processor()
+    tp0, tp1 = TopicPartition(TOPIC, 0), TopicPartition(TOPIC, 1)
+    batch = {
+        tp0: [_record(0, 10, {"applicant_id": "a", "amount": "10", "term_months": 6})],
+        tp1: [
+            _record(1, 3, {"applicant_id": "b", "amount": "20", "term_months": 6}),
+            _record(1, 4, {"applicant_id": "c", "amount": "30", "term_months": 6}),
+        ],
+    }
+    consumer = FakeConsumer([])
+
+    assert await process_batch(consumer, processor, batch, ProcessorSettings())
+
+    assert consumer.committed == [{tp0: 11, tp1: 5}]
+    assert consumer.seeks == []
+
+
+class RecordingProcessor(BatchApplicationProcessor):
+    def __init__(self) -> None:
+        super().__init__(process_application=None, concurrency=4)  # type: ignore[arg-type]
+        self.lanes: list[list[str]] = []
+
+    async def process_lanes(self, lanes: Any) -> None:
+        self.lanes = [[payload["applicant_id"] for payload in lane] for lane in lanes]
+
+
+@pytest.mark.asyncio
+async def test_partition_ordering_runs_one_lane_per_partition_in_offset_order() -> None:
+    processor = RecordingProcessor()
+    tp0, tp1 = TopicPartition(TOPIC, 0), TopicPartition(TOPIC, 1)
+    batch = {
+        tp0: [
+            _record(0, 1, {"applicant_id": "a"}),
+            _record(0, 2, {"applicant_id": "b"}),
+            _record(0, 3, {"applicant_id": "a"}),
+        ],
+        tp1: [_record(1, 1, {"applicant_id": "c"})],
+    }
+    consumer = FakeConsumer([])
+
+    assert await process_batch(consumer, processor, batch, ProcessorSettings(ordering="partition"))
+
+    assert processor.lanes == [["b", "a"], ["c"]]
+    assert consumer.committed == [{tp0: 4, tp1: 2}]
+
+
+@pytest.mark.asyncio
+async def test_process_batch_rewinds_without_commit_on_failure() -> None:
+    tp0 = TopicPartition(TOPIC, 0)
+    batch = {tp0: [_record(0, 7, {}), _record(0, 8, {})]}
+    consumer = FakeConsumer([])
+    settings = ProcessorSettings(retry_backoff_seconds=0)
+    failing = FailingProcessor()
+
+    assert not await process_batch(consumer, failing, batch, settings)  # type: ignore[arg-type]
+
+    assert consumer.committed == []
+    assert consumer.seeks == [(tp0, 7)]
+
+
+@pytest.mark.asyncio
+async def test_process_batch_rewinds_only_assigned_partitions() -> None:
+    tp0, revoked = TopicPartition(TOPIC, 0), TopicPartition(TOPIC, 7)
+    batch = {tp0: [_record(0, 7, {})], revoked: [_record(7, 3, {})]}
+    consumer = FakeConsumer([])
+    settings = ProcessorSettings(retry_backoff_seconds=0)
+    failing = FailingProcessor()
+
+    assert not await process_batch(consumer, failing, batch, settings)  # type: ignore[arg-type]
+
+    assert consumer.seeks == [(tp0, 7)]
+
+
+@pytest.mark.asyncio
+async def test_fetch_batch_lingers_until_batch_is_full() -> None:
+    tp0 = TopicPartition(TOPIC, 0)
+    consumer = FakeConsumer(
+        [
+            {tp0: [_record(0, 0, {})]},
+            {tp0: [_record(0, 1, {}), _record(0, 2, {})]},
+            {tp0: [_record(0, 3, {})]},
+        ]
+    )
+
+    batch = await fetch_batch(consumer, ProcessorSettings(batch_size=3, linger_ms=1000))
+
+    assert [r.offset for r in batch[tp0]] == [0, 1, 2]
+
+
+class ScriptedProcessor(BatchApplicationProcessor):
+    def __init__(self, delays: list[float], fail_first: bool = False) -> None:
+        super().__init__(process_application=None, concurrency=4)  # type: ignore[arg-type]
+        self.batches: list[list[str]] = []
+        self._delays = delays
+        self._fail_first = fail_first
+
+    async def process(self, payloads: Any) -> None:
+        await asyncio.sleep(self._delays.pop(0) if self._delays else 0)
+        if self._fail_first:
+            self._fail_first = False
+            raise ConnectionError("database unavailable")
+        self.batches.append([payload["applicant_id"] for payload in payloads])
+
+
+async def _run_until(pipeline: BackpressurePipeline, done: Any, timeout: float = 2.0) -> None:
+    task = asyncio.create_task(pipeline.run())
+    try:
+        async with asyncio.timeout(timeout):
+            while not done():
+                await asyncio.sleep(0.005)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+def _batches(*offsets: int) -> list[dict[TopicPartition, list[ConsumerRecord]]]:
+    tp0 = TopicPartition(TOPIC, 0)
+    return [{tp0: [_record(0, offset, {"applicant_id": f"a{offset}"})]} for offset in offsets]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_commits_in_order_and_bounds_records_in_flight() -> None:
+    consumer = FakeConsumer(_batches(0, 1, 2, 3))
+    processor = ScriptedProcessor(delays=[0.05, 0, 0, 0])
+    settings = ProcessorSettings(batch_size=10, queue_batches=1, max_in_flight=2, linger_ms=0)
+    pipeline = BackpressurePipeline(consumer, processor, settings)
+
+    await _run_until(pipeline, lambda: len(consumer.committed) == 4)
+
+    tp0 = TopicPartition(TOPIC, 0)
+    assert consumer.committed == [{tp0: 1}, {tp0: 2}, {tp0: 3}, {tp0: 4}]
+    assert processor.batches == [["a0"], ["a1"], ["a2"], ["a3"]]
+    assert all(limit is not None and limit <= 2 for limit in consumer.fetch_limits)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_rewinds_every_uncommitted_batch_after_failure() -> None:
+    consumer = FakeConsumer(_batches(5, 6))
+    processor = ScriptedProcessor(delays=[0.05], fail_first=True)
+    settings = ProcessorSettings(batch_size=10, linger_ms=0, retry_backoff_seconds=0)
+    pipeline = BackpressurePipeline(consumer, processor, settings)
+
+    await _run_until(pipeline, lambda: bool(consumer.seeks))
+
+    assert consumer.committed == []
+    assert consumer.seeks == [(TopicPartition(TOPIC, 0), 5)]
+    assert pipeline.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_pauses_partitions_while_processing_is_slow() -> None:
+    consumer = FakeConsumer(_batches(0, 1, 2))
+    processor = ScriptedProcessor(delays=[0.05, 0.05, 0])
+    settings = ProcessorSettings(
+        batch_size=10, linger_ms=0, pause_latency_ms=20, resume_latency_ms=10
+    )
+    pipeline = BackpressurePipeline(consumer, processor, settings)
+
+    await _run_until(pipeline, lambda: len(consumer.committed) == 3)
+
+    assert consumer.pause_calls == 1
+    assert consumer.paused_partitions == set()
+    assert not pipeline.paused
+
+
+class RevokingProcessor(ScriptedProcessor):
+    """Loses partition 1 to another consumer while persisting the first batch."""
+
+    def __init__(self, consumer: FakeConsumer) -> None:
+        super().__init__(delays=[])
+        self.consumer = consumer
+        self.listener: PipelineRebalanceListener | None = None
+
+    async def process(self, payloads: Any) -> None:
+        if self.listener is not None and not self.batches:
+            revoked = {TopicPartition(TOPIC, 1)}
+            self.consumer.assigned -= revoked
+            await self.listener.on_partitions_revoked(revoked)
+        await super().process(payloads)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_drops_revoked_partitions_mid_batch() -> None:
+    tp0, tp1 = TopicPartition(TOPIC, 0), TopicPartition(TOPIC, 1)
+    consumer = FakeConsumer(
+        [
+            {
+                tp0: [_record(0, 0, {"applicant_id": "a0"})],
+                tp1: [_record(1, 0, {"applicant_id": "b0"})],
+            },
+            {tp1: [_record(1, 1, {"applicant_id": "b1"})]},
+            {tp0: [_record(0, 1, {"applicant_id": "a1"})]},
+        ]
+    )
+    processor = RevokingProcessor(consumer)
+    settings = ProcessorSettings(batch_size=10, linger_ms=0, queue_batches=2)
+    pipeline = BackpressurePipeline(consumer, processor, settings)
+    processor.listener = PipelineRebalanceListener(pipeline)
+
+    await _run_until(pipeline, lambda: len(consumer.committed) == 2)
+
+    assert consumer.committed == [{tp0: 1}, {tp0: 2}]
+    assert processor.batches == [["a0", "b0"], ["a1"]]
+    assert pipeline.in_flight == 0
+
+
+class RedeliveringConsumer(FakeConsumer):
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        super().seek(partition, offset)
+        self._batches.insert(0, _batches(offset)[0])
+
+
+@pytest.mark.asyncio
+async def test_pipeline_refetches_after_commit_rejected_by_rebalance() -> None:
+    consumer = RedeliveringConsumer(_batches(3))
+    consumer.rejected_commits = 1
+    processor = ScriptedProcessor(delays=[])
+    settings = ProcessorSettings(batch_size=10, linger_ms=0, retry_backoff_seconds=60)
+    pipeline = BackpressurePipeline(consumer, processor, settings)
+
+    await _run_until(pipeline, lambda: bool(consumer.committed), timeout=1.0)
+
+    tp0 = TopicPartition(TOPIC, 0)
+    assert consumer.seeks == [(tp0, 3)]
+    assert consumer.committed == [{tp0: 4}]
+    assert processor.batches == [["a3"], ["a3"]]
@@ -0,0 +1,106 @@
+"""Unit tests for request coalescing on cache misses."""
+
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+from typing import Sequence
+
+import pytest
+
+from loans.domain import LoanApplication
+from loans.infrastructure import (
+    CachedLoanApplicationRepository,
+    InMemoryLoanApplicationRepository,
+    InMemoryStatusCache,
+)
+from loans.utils.concurrency import MicroBatcher, SingleFlight
+
+
+class CountingRepository(InMemoryLoanApplicationRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.single_lookups = 0
+        self.bulk_lookups: list[list[str]] = []
+
+    async def get_latest(self, applicant_id: str) -> LoanApplication | None:
+        self.single_lookups += 1
+        await asyncio.sleep(0.01)
+        return await super().get_latest(applicant_id)
+
+    async def get_latest_many(self, applicant_ids: Sequence[str]) -> dict[str, LoanApplication]:
+        self.bulk_lookups.append(list(applicant_ids))
+        return await super().get_latest_many(applicant_ids)
+
+
+def _application(applicant_id: str) -> LoanApplication:
+    return LoanApplication(applicant_id=applicant_id, amount=Decimal("100"), term_months=12)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_load_between_waiters() -> None:
+    calls = 0
+
+    async def loader() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    flight: SingleFlight[str, int] = SingleFlight()
+    results = await asyncio.gather(*(flight.do("key", loader) for _ in range(10)))
+
+    assert results == [42] * 10
+    assert calls == 1
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_merges_keys_within_window() -> None:
+    batches: list[list[str]] = []
+
+    async def bulk_loader(keys: Sequence[str]) -> dict[str, str]:
+        batches.append(list(keys))
+        return {key: key.upper() for key in keys if key != "missing"}
+
+    batcher: MicroBatcher[str, str] = MicroBatcher(
+        bulk_loader, window_seconds=0.01, max_batch_size=10
+    )
+    results = await asyncio.gather(*(batcher.load(key) for key in ["a", "b", "missing", "a"]))
+
+    assert results == ["A", "B", None, "A"]
+    assert batches == [["a", "b", "missing"]]
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_coalesces_concurrent_misses() -> None:
+    backing = CountingRepository()
+    await backing.upsert(_application("a"))
+    repository = CachedLoanApplicationRepository(
+        backing=backing, cache=InMemoryStatusCache(), cache_ttl_seconds=60
+    )
+
+    results = await asyncio.gather(*(repository.get_latest("a") for _ in range(20)))
+
+    assert all(result is not None for result in results)
+    assert backing.single_lookups == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_batches_misses_for_different_keys() -> None:
+    backing = CountingRepository()
+    await backing.upsert_many([_application("a"), _application("b")])
+    repository = CachedLoanApplicationRepository(
+        backing=backing,
+        cache=InMemoryStatusCache(),
+        cache_ttl_seconds=60,
+        miss_batch_window_seconds=0.01,
+    )
+
+    a, b, missing = await asyncio.gather(
+        repository.get_latest("a"), repository.get_latest("b"), repository.get_latest("zzz")
+    )
+
+    assert a is not None and b is not None and missing is None
+    assert backing.single_lookups == 0
+    assert backing.bulk_lookups == [["a", "b", "zzz"]]
@@ -0,0 +1,71 @@
+"""Unit tests for adapter timing and error instrumentation."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from prometheus_client import REGISTRY
+
+from loans.domain import LoanApplication
+from loans.infrastructure import InMemoryLoanApplicationRepository, InMemoryStatusCache
+from loans.infrastructure.instrumentation import (
+    InstrumentedLoanApplicationRepository,
+    InstrumentedStatusCache,
+)
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class BrokenRepository(InMemoryLoanApplicationRepository):
+    async def get_latest(self, applicant_id: str) -> LoanApplication | None:
+        raise ConnectionError("database unavailable")
+
+
+@pytest.mark.asyncio
+async def test_repository_wrapper_times_calls_and_counts_errors() -> None:
+    labels = {"port": "repository", "backend": "broken", "operation": "get_latest"}
+    repository = InstrumentedLoanApplicationRepository(BrokenRepository(), backend="broken")
+    calls_before = _sample("loan_application_adapter_operation_seconds_count", **labels)
+
+    with pytest.raises(ConnectionError):
+        await repository.get_latest("a")
+
+    assert _sample("loan_application_adapter_operation_seconds_count", **labels) == calls_before + 1
+    assert (
+        _sample(
+            "loan_application_adapter_operation_errors_total", error="ConnectionError", **labels
+        )
+        >= 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_wrapper_counts_hits_misses_and_absent_entries() -> None:
+    cache = InstrumentedStatusCache(InMemoryStatusCache(), backend="unit")
+    await cache.set(
+        LoanApplication(applicant_id="a", amount=Decimal("10"), term_months=6), ttl_seconds=60
+    )
+    await cache.mark_absent(["gone"], ttl_seconds=60)
+    before = {
+        result: _sample(
+            "loan_application_cache_lookups_total", tier="l2", backend="unit", result=result
+        )
+        for result in ("hit", "miss", "absent")
+    }
+
+    await cache.lookup_many(["a", "gone", "unknown", "a"])
+
+    after = {
+        result: _sample(
+            "loan_application_cache_lookups_total", tier="l2", backend="unit", result=result
+        )
+        for result in ("hit", "miss", "absent")
+    }
+    assert {result: after[result] - before[result] for result in after} == {
+        "hit": 1,
+        "miss": 1,
+        "absent": 1,
+    }
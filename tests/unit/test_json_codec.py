@@ -0,0 +1,38 @@
+"""Unit tests for the pluggable JSON codec."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from loans.domain import ApplicationStatus
+from loans.utils.json_codec import JsonCodec, available_codecs
+
+CODECS = list(available_codecs().values())
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_codec_round_trips_decimal_datetime_and_enum(codec: JsonCodec) -> None:
+    moment = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+
+    encoded = codec.dumps(
+        {"amount": Decimal("4999.99"), "at": moment, "status": ApplicationStatus.APPROVED}
+    )
+
+    assert isinstance(encoded, bytes)
+    decoded = codec.loads(encoded)
+    assert decoded["amount"] == "4999.99"
+    assert datetime.fromisoformat(decoded["at"]) == moment
+    assert decoded["status"] == "approved"
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_codec_rejects_unknown_types_unless_lenient(codec: JsonCodec) -> None:
+    with pytest.raises(TypeError):
+        codec.dumps({"value": object()})
+
+    assert codec.loads(codec.dumps({"value": frozenset()}, lenient=True)) == {
+        "value": "frozenset()"
+    }
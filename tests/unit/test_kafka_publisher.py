@@ -0,0 +1,102 @@
+"""Unit tests for the Kafka event publisher delivery tracking."""
+
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+from typing import Any, List, Tuple
+
+import pytest
+
+from loans.application.ports import ApplicationMessage
+from loans.infrastructure.messaging import (
+    KafkaApplicationEventPublisher,
+    build_partitioner,
+    parse_acks,
+    parse_compression_type,
+)
+
+
+class FakeProducer:
+    def __init__(self) -> None:
+        self.deliveries: List[asyncio.Future[Any]] = []
+        self.keys: List[bytes | None] = []
+        self.stopped = False
+
+    async def start(self) -> None:
+        return None
+
+    async def send(self, topic: str, value: Any, key: bytes | None = None) -> asyncio.Future[Any]:
+        self.keys.append(key)
+        delivery: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self.deliveries.append(delivery)
+        return delivery
+
+    async def flush(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+MESSAGE = ApplicationMessage(applicant_id="a", amount=Decimal("100"), term_months=12)
+
+
+@pytest.mark.asyncio
+async def test_async_publish_returns_before_ack_and_reports_failures() -> None:
+    producer = FakeProducer()
+    failures: List[Tuple[str, str, BaseException]] = []
+    publisher = KafkaApplicationEventPublisher(
+        lambda: producer,
+        wait_for_delivery=False,
+        on_delivery_failure=lambda topic, message, error: failures.append(
+            (topic, message.applicant_id, error)
+        ),
+    )
+
+    await publisher.publish("loans", MESSAGE)
+    await publisher.publish("loans", MESSAGE)
+    assert publisher.pending_deliveries == 2
+    assert producer.keys == [b"a", b"a"]
+
+    producer.deliveries[0].set_result(None)
+    producer.deliveries[1].set_exception(RuntimeError("broker down"))
+    await asyncio.sleep(0)
+
+    assert publisher.pending_deliveries == 0
+    assert [(topic, applicant) for topic, applicant, _ in failures] == [("loans", "a")]
+
+
+@pytest.mark.asyncio
+async def test_close_drains_pending_sends_before_stopping() -> None:
+    producer = FakeProducer()
+    publisher = KafkaApplicationEventPublisher(lambda: producer, wait_for_delivery=False)
+    await publisher.publish("loans", MESSAGE)
+
+    asyncio.get_running_loop().call_later(0.01, producer.deliveries[0].set_result, None)
+    await publisher.close()
+
+    assert producer.deliveries[0].done()
+    assert producer.stopped
+    assert publisher.pending_deliveries == 0
+
+
+def test_crc32_partitioner_is_stable_per_key() -> None:
+    partitioner = build_partitioner("crc32")
+    partitions = list(range(12))
+
+    chosen = {partitioner(b"applicant-1", partitions, partitions) for _ in range(5)}
+
+    assert len(chosen) == 1
+    assert chosen.pop() in partitions
+
+
+def test_producer_settings_are_validated() -> None:
+    assert parse_compression_type("") is None
+    assert parse_compression_type("ZSTD") == "zstd"
+    assert parse_acks("-1") == "all"
+    assert parse_acks("0") == 0
+    with pytest.raises(ValueError, match="KAFKA_COMPRESSION_TYPE"):
+        parse_compression_type("zstandard")
+    with pytest.raises(ValueError, match="KAFKA_ACKS"):
+        parse_acks("2")
@@ -0,0 +1,75 @@
+"""Unit tests for the in-process status cache tier."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from loans.domain import ApplicationStatus, LoanApplication
+from loans.infrastructure import (
+    CachedLoanApplicationRepository,
+    InMemoryLoanApplicationRepository,
+    InMemoryStatusCache,
+)
+from loans.infrastructure.cache import LocalStatusCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _application(applicant_id: str) -> LoanApplication:
+    return LoanApplication(applicant_id=applicant_id, amount=Decimal("100"), term_months=12)
+
+
+def test_local_cache_evicts_least_recently_used_entry() -> None:
+    cache = LocalStatusCache(max_entries=2, ttl_seconds=10)
+    cache.put(_application("a"))
+    cache.put(_application("b"))
+    assert cache.get("a") is not None
+
+    cache.put(_application("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert len(cache) == 2
+
+
+def test_local_cache_expires_entries_after_ttl() -> None:
+    clock = FakeClock()
+    cache = LocalStatusCache(max_entries=10, ttl_seconds=0.5, clock=clock)
+    cache.put(_application("a"))
+
+    clock.now = 0.4
+    assert cache.get("a") is not None
+    clock.now = 0.5
+    assert cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_serves_local_hits_and_evicts_on_write() -> None:
+    shared = InMemoryStatusCache()
+    local = LocalStatusCache(max_entries=10, ttl_seconds=60)
+    repository = CachedLoanApplicationRepository(
+        backing=InMemoryLoanApplicationRepository(),
+        cache=shared,
+        cache_ttl_seconds=60,
+        local_cache=local,
+    )
+    application = _application("a")
+    await repository.create(application)
+    assert await repository.get_latest("a") is not None
+
+    # A change made elsewhere is hidden by the local tier until this process writes.
+    await shared.set(application.with_status(ApplicationStatus.REJECTED), ttl_seconds=60)
+    served = await repository.get_latest("a")
+    assert served is not None and served.status == ApplicationStatus.PENDING
+
+    await repository.upsert(application.with_status(ApplicationStatus.APPROVED))
+    refreshed = await repository.get_latest("a")
+    assert refreshed is not None and refreshed.status == ApplicationStatus.APPROVED
@@ -0,0 +1,42 @@
+"""Unit tests for the queued, sampled JSON logging pipeline."""
+
+from __future__ import annotations
+
+import logging
+from queue import Queue
+
+import pytest
+
+from loans.utils.logging import DroppingQueueHandler, SamplingFilter, parse_sample_rates
+
+
+def _record(message: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("loans.test", level, __file__, 1, message, None, None)
+
+
+def test_parse_sample_rates_clamps_and_skips_blanks() -> None:
+    rates = parse_sample_rates(" application_status_fetched=0.01, ,application_submitted=2")
+
+    assert rates == {"application_status_fetched": 0.01, "application_submitted": 1.0}
+    with pytest.raises(ValueError):
+        parse_sample_rates("application_submitted=often")
+
+
+def test_sampling_filter_drops_only_sampled_info_events() -> None:
+    sampling = SamplingFilter({"application_status_fetched": 0.0})
+
+    assert not sampling.filter(_record("application_status_fetched"))
+    assert sampling.filter(_record("application_status_fetched", logging.WARNING))
+    assert sampling.filter(_record("application_submitted"))
+
+
+def test_queue_handler_drops_records_when_full_without_formatting() -> None:
+    queue: Queue[logging.LogRecord] = Queue(maxsize=1)
+    handler = DroppingQueueHandler(queue)
+    first = _record("application_submitted")
+
+    handler.handle(first)
+    handler.handle(_record("application_status_fetched"))
+
+    assert handler.dropped == 1
+    assert queue.get_nowait() is first
@@ -0,0 +1,47 @@
+"""Unit tests for the transactional outbox and its relay."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from sqlalchemy.dialects import postgresql
+
+from loans.domain import LoanApplication
+from loans.infrastructure.messaging import enqueue_statement
+from loans.infrastructure.messaging.outbox import _to_message
+
+
+def test_enqueue_statement_writes_one_row_per_application() -> None:
+    applications = [
+        LoanApplication(applicant_id="applicant-1", amount=Decimal("10.50"), term_months=6),
+        LoanApplication(applicant_id="applicant-2", amount=Decimal("20"), term_months=12),
+    ]
+
+    compiled = enqueue_statement("loan-applications", applications).compile(
+        dialect=postgresql.dialect()
+    )
+
+    assert str(compiled).startswith("INSERT INTO application_outbox (topic, payload)")
+    assert compiled.params["payload_m1"]["applicant_id"] == "applicant-2"
+    assert compiled.params["payload_m0"] == {
+        "applicant_id": "applicant-1",
+        "amount": "10.50",
+        "term_months": 6,
+    }
+
+
+def test_outbox_payload_round_trips_to_message() -> None:
+    application = LoanApplication(
+        applicant_id="applicant-1", amount=Decimal("10.50"), term_months=6
+    )
+    payload = (
+        enqueue_statement("topic", [application])
+        .compile(dialect=postgresql.dialect())
+        .params["payload_m0"]
+    )
+
+    message = _to_message(payload)
+
+    assert message.applicant_id == "applicant-1"
+    assert message.amount == Decimal("10.50")
+    assert message.term_months == 6
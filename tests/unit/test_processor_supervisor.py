@@ -0,0 +1,249 @@
+"""Unit tests for running several processor workers in one consumer group."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping
+
+import pytest
+from aiokafka.errors import IllegalStateError
+from aiokafka.structs import ConsumerRecord, TopicPartition
+
+from loans.interfaces.processor import (
+    BackpressurePipeline,
+    BatchApplicationProcessor,
+    PipelineRebalanceListener,
+    ProcessorSettings,
+)
+from loans.interfaces.processor.supervisor import WorkerSupervisor
+
+TOPIC = "loan-applications"
+
+
+def _crashing_worker(index: int) -> None:
+    Path(os.environ["SUPERVISOR_TEST_DIR"], f"{index}-{os.getpid()}").touch()
+    sys.exit(1)
+
+
+def _idle_worker(index: int) -> None:
+    Path(os.environ["SUPERVISOR_TEST_DIR"], f"{index}-{os.getpid()}").touch()
+    time.sleep(60)
+
+
+def _run_for(supervisor: WorkerSupervisor, seconds: float) -> None:
+    timer = threading.Timer(seconds, supervisor.stop)
+    timer.start()
+    try:
+        supervisor.run()
+    finally:
+        timer.cancel()
+
+
+def test_supervisor_restarts_crashed_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("SUPERVISOR_TEST_DIR", str(tmp_path))
+    supervisor = WorkerSupervisor(
+        _crashing_worker, workers=2, restart_backoff_seconds=0.05, poll_interval_seconds=0.05
+    )
+
+    _run_for(supervisor, 3.0)
+
+    started = [path.name.split("-")[0] for path in tmp_path.iterdir()]
+    assert started.count("0") >= 2
+    assert started.count("1") >= 2
+
+
+class ExitedProcess:
+    pid = None
+    exitcode = 1
+
+    def is_alive(self) -> bool:
+        return False
+
+
+def test_supervisor_backs_off_exited_workers_without_blocking(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    supervisor = WorkerSupervisor(_crashing_worker, workers=2, restart_backoff_seconds=0.2)
+    supervisor._processes = {0: ExitedProcess(), 1: ExitedProcess()}  # type: ignore[dict-item]
+    restarted: List[int] = []
+    monkeypatch.setattr(supervisor, "_start", restarted.append)
+
+    started = time.monotonic()
+    supervisor._restart_exited()
+
+    assert time.monotonic() - started < 0.1
+    assert restarted == []
+
+    time.sleep(0.25)
+    supervisor._restart_exited()
+
+    assert restarted == [0, 1]
+
+
+def test_supervisor_terminates_workers_on_stop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("SUPERVISOR_TEST_DIR", str(tmp_path))
+    supervisor = WorkerSupervisor(
+        _idle_worker, workers=2, shutdown_timeout_seconds=5, poll_interval_seconds=0.05
+    )
+
+    started = time.monotonic()
+    _run_for(supervisor, 2.0)
+
+    assert sorted(path.name.split("-")[0] for path in tmp_path.iterdir()) == ["0", "1"]
+    assert time.monotonic() - started < 10
+
+
+class FakeGroup:
+    """Two-partition topic shared by the members of one consumer group (eager rebalancing)."""
+
+    def __init__(self, records_per_partition: int) -> None:
+        self.log = {
+            TopicPartition(TOPIC, partition): [
+                ConsumerRecord(
+                    TOPIC,
+                    partition,
+                    offset,
+                    0,
+                    0,
+                    None,
+                    {"applicant_id": f"{partition}-{offset}"},
+                    None,
+                    0,
+                    0,
+                    (),
+                )
+                for offset in range(records_per_partition)
+            ]
+            for partition in (0, 1)
+        }
+        self.committed = {tp: 0 for tp in self.log}
+        self.members: List[GroupMember] = []
+
+    async def join(self, member: GroupMember) -> None:
+        for current in self.members:
+            await current.listener.on_partitions_revoked(set(current.assigned))
+            current.assigned = set()
+        self.members.append(member)
+        partitions = sorted(self.log, key=lambda tp: tp.partition)
+        for index, current in enumerate(self.members):
+            current.assigned = set(partitions[index :: len(self.members)])
+            current.positions = {tp: self.committed[tp] for tp in current.assigned}
+            await current.listener.on_partitions_assigned(set(current.assigned))
+
+
+class GroupMember:
+    def __init__(self, group: FakeGroup) -> None:
+        self.group = group
+        self.assigned: set[TopicPartition] = set()
+        self.positions: Dict[TopicPartition, int] = {}
+        self.paused_partitions: set[TopicPartition] = set()
+        self.listener: PipelineRebalanceListener
+
+    async def getmany(
+        self, *partitions: TopicPartition, timeout_ms: int = 0, max_records: int | None = None
+    ) -> dict[TopicPartition, list[ConsumerRecord]]:
+        await asyncio.sleep(0.001)
+        fetched: dict[TopicPartition, list[ConsumerRecord]] = {}
+        budget = max_records or sys.maxsize
+        for tp in sorted(self.assigned - self.paused_partitions, key=lambda tp: tp.partition):
+            records = self.group.log[tp][self.positions[tp] :][:budget]
+            if records:
+                fetched[tp] = records
+                self.positions[tp] += len(records)
+                budget -= len(records)
+            if not budget:
+                break
+        return fetched
+
+    async def commit(self, offsets: Mapping[TopicPartition, int] | None = None) -> None:
+        for tp in offsets or {}:
+            self._require_assigned(tp)
+        self.group.committed.update(offsets or {})
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        self._require_assigned(partition)
+        self.positions[partition] = offset
+
+    def assignment(self) -> set[TopicPartition]:
+        return set(self.assigned)
+
+    def pause(self, *partitions: TopicPartition) -> None:
+        self.paused_partitions.update(partitions)
+
+    def resume(self, *partitions: TopicPartition) -> None:
+        self.paused_partitions.difference_update(partitions)
+
+    def paused(self) -> set[TopicPartition]:
+        return set(self.paused_partitions)
+
+    def _require_assigned(self, partition: TopicPartition) -> None:
+        if partition not in self.assigned:
+            raise IllegalStateError(f"No current assignment for partition {partition}")
+
+
+class GatedProcessor(BatchApplicationProcessor):
+    """Holds its first batch until ``release`` is set."""
+
+    def __init__(self) -> None:
+        super().__init__(process_application=None, concurrency=1)  # type: ignore[arg-type]
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.processed: List[str] = []
+
+    async def process(self, payloads: Any) -> None:
+        self.started.set()
+        await self.release.wait()
+        self.processed.extend(payload["applicant_id"] for payload in payloads)
+
+
+def _worker(
+    group: FakeGroup, processor: BatchApplicationProcessor
+) -> tuple[GroupMember, BackpressurePipeline]:
+    member = GroupMember(group)
+    pipeline = BackpressurePipeline(member, processor, ProcessorSettings(batch_size=4, linger_ms=0))
+    member.listener = PipelineRebalanceListener(pipeline)
+    return member, pipeline
+
+
+@pytest.mark.asyncio
+async def test_worker_restart_rebalances_sibling_with_batch_in_flight() -> None:
+    group = FakeGroup(records_per_partition=3)
+    busy = GatedProcessor()
+    busy_member, busy_pipeline = _worker(group, busy)
+    await group.join(busy_member)
+    busy_task = asyncio.create_task(busy_pipeline.run())
+    await asyncio.wait_for(busy.started.wait(), timeout=1.0)
+
+    # A restarted sibling rejoins the group while the first worker is mid-batch.
+    restarted = GatedProcessor()
+    restarted.release.set()
+    restarted_member, restarted_pipeline = _worker(group, restarted)
+    await group.join(restarted_member)
+    restarted_task = asyncio.create_task(restarted_pipeline.run())
+    busy.release.set()
+
+    try:
+        async with asyncio.timeout(2.0):
+            while group.committed != {tp: 3 for tp in group.log}:
+                await asyncio.sleep(0.005)
+        assert not busy_task.done()
+        assert not restarted_task.done()
+    finally:
+        for task in (busy_task, restarted_task):
+            task.cancel()
+        await asyncio.gather(busy_task, restarted_task, return_exceptions=True)
+
+    assert busy_member.assigned == {TopicPartition(TOPIC, 0)}
+    assert restarted.processed == ["1-0", "1-1", "1-2"]
+    # The batch in flight during the rebalance is still written (decisions are idempotent)
+    # but only partition 0 is committed by its original worker.
+    assert {"0-0", "0-1", "0-2"} <= set(busy.processed)
@@ -0,0 +1,269 @@
+"""Unit tests for repository batch operations."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from datetime import timedelta
+from decimal import Decimal
+from typing import Sequence
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy.dialects import postgresql
+
+from loans.application import ProcessApplication, ProcessApplicationCommand
+from loans.application.ports import CacheMarker
+from loans.domain import ApplicationStatus, LoanApplication
+from loans.infrastructure import (
+    CachedLoanApplicationRepository,
+    InMemoryLoanApplicationRepository,
+    InMemoryStatusCache,
+    WriteBehindLoanApplicationRepository,
+)
+from loans.infrastructure.cache import LocalStatusCache
+from loans.infrastructure.repositories.postgres_applications import _merge_statement
+
+
+def _application(applicant_id: str, amount: str = "100") -> LoanApplication:
+    return LoanApplication(applicant_id=applicant_id, amount=Decimal(amount), term_months=12)
+
+
+def test_merge_statement_renders_single_multi_row_upsert() -> None:
+    stmt = _merge_statement([_application("a"), _application("b")], create_only=False)
+
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert sql.count("INSERT INTO loan_applications") == 1
+    assert "applicant_id_m1" in sql
+    assert "ON CONFLICT (applicant_id) DO UPDATE SET" in sql
+    assert "status = excluded.status" in sql
+    assert "created_at = excluded" not in sql
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_batch_operations_round_trip() -> None:
+    cache = InMemoryStatusCache()
+    backing = InMemoryLoanApplicationRepository()
+    repository = CachedLoanApplicationRepository(backing=backing, cache=cache, cache_ttl_seconds=60)
+
+    await repository.upsert_many([_application("a"), _application("b"), _application("a", "250")])
+    await backing.upsert(_application("c").with_status(ApplicationStatus.APPROVED))
+
+    result = await repository.get_latest_many(["a", "b", "c", "missing", "a"])
+
+    assert set(result) == {"a", "b", "c"}
+    assert result["a"].amount == Decimal("250")
+    cached = await cache.get("c")
+    assert cached is not None
+    assert cached.status == ApplicationStatus.APPROVED
+
+
+class CountingRepository(InMemoryLoanApplicationRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups = 0
+
+    async def get_latest(self, applicant_id: str) -> LoanApplication | None:
+        self.lookups += 1
+        return await super().get_latest(applicant_id)
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_remembers_unknown_applicants_until_created() -> None:
+    cache = InMemoryStatusCache()
+    backing = CountingRepository()
+    repository = CachedLoanApplicationRepository(
+        backing=backing, cache=cache, cache_ttl_seconds=60, negative_ttl_seconds=30
+    )
+
+    assert await repository.get_latest("ghost") is None
+    assert await repository.get_latest("ghost") is None
+    assert backing.lookups == 1
+    assert await cache.lookup("ghost") is CacheMarker.ABSENT
+
+    await repository.create(_application("ghost"))
+
+    created = await repository.get_latest("ghost")
+    assert created is not None
+    assert backing.lookups == 1
+
+
+def _cache_sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(f"loan_application_{name}", labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_counts_tiers_and_samples_stale_entries() -> None:
+    cache = InMemoryStatusCache()
+    backing = InMemoryLoanApplicationRepository()
+    repository = CachedLoanApplicationRepository(
+        backing=backing,
+        cache=cache,
+        cache_ttl_seconds=60,
+        local_cache=LocalStatusCache(max_entries=10, ttl_seconds=60),
+        consistency_sample_rate=1.0,
+        cache_backend="unit",
+    )
+    cached = _application("a")
+    await cache.set(cached, ttl_seconds=60)
+    await backing.upsert(
+        replace(
+            cached,
+            status=ApplicationStatus.APPROVED,
+            updated_at=cached.updated_at + timedelta(seconds=5),
+        )
+    )
+    await backing.upsert(_application("b"))
+    l1 = {"tier": "l1", "backend": "local"}
+    hits = _cache_sample("cache_lookups_total", result="hit", **l1)
+    misses = _cache_sample("cache_lookups_total", result="miss", **l1)
+    l2 = {"tier": "l2", "backend": "unit"}
+    l2_hits = _cache_sample("cache_lookups_total", result="hit", **l2)
+    l2_misses = _cache_sample("cache_lookups_total", result="miss", **l2)
+    backfills = _cache_sample("repository_cache_backfills_total", result="found")
+    stale = _cache_sample("repository_cache_consistency_checks_total", result="stale")
+    lag = _cache_sample("repository_cache_staleness_seconds_sum")
+
+    assert await repository.get_latest("a") == cached
+    assert await repository.get_latest("a") == cached
+    assert await repository.get_latest("b") is not None
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    assert _cache_sample("cache_lookups_total", result="hit", **l1) == hits + 1
+    assert _cache_sample("cache_lookups_total", result="miss", **l1) == misses + 2
+    assert _cache_sample("cache_lookups_total", result="hit", **l2) == l2_hits + 1
+    assert _cache_sample("cache_lookups_total", result="miss", **l2) == l2_misses + 1
+    assert _cache_sample("repository_cache_backfills_total", result="found") == backfills + 1
+    assert _cache_sample("repository_cache_consistency_checks_total", result="stale") == stale + 1
+    assert _cache_sample("repository_cache_staleness_seconds_sum") == pytest.approx(lag + 5)
+
+
+@pytest.mark.asyncio
+async def test_mark_absent_does_not_replace_live_snapshot() -> None:
+    cache = InMemoryStatusCache()
+    await cache.set(_application("a"), ttl_seconds=60)
+
+    await cache.mark_absent(["a", "b"], ttl_seconds=60)
+
+    assert isinstance(await cache.lookup("a"), LoanApplication)
+    assert await cache.lookup("b") is CacheMarker.ABSENT
+    assert await cache.get_many(["a", "b"]) == {"a": await cache.get("a")}
+
+
+class CountingCache(InMemoryStatusCache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    async def set_many(self, applications: Sequence[LoanApplication], ttl_seconds: int) -> None:
+        self.writes += 1
+        await super().set_many(applications, ttl_seconds)
+
+
+@pytest.mark.asyncio
+async def test_process_application_writes_decisions_once_without_reading() -> None:
+    cache = CountingCache()
+    backing = CountingRepository()
+    repository = CachedLoanApplicationRepository(backing=backing, cache=cache, cache_ttl_seconds=60)
+    submitted = _application("a", "1000")
+    await backing.create(submitted)
+    use_case = ProcessApplication(repository=repository)
+
+    decided = await use_case.execute_many(
+        [
+            ProcessApplicationCommand(applicant_id="a", amount=Decimal("1000"), term_months=12),
+            ProcessApplicationCommand(applicant_id="b", amount=Decimal("9000"), term_months=24),
+        ]
+    )
+
+    assert [(app.applicant_id, app.status) for app in decided] == [
+        ("a", ApplicationStatus.APPROVED),
+        ("b", ApplicationStatus.REJECTED),
+    ]
+    assert decided[0].created_at == submitted.created_at
+    assert backing.lookups == 0
+    assert cache.writes == 1
+    assert await cache.get("b") == decided[1]
+
+
+class RecordingRepository(InMemoryLoanApplicationRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.decision_writes: list[list[str]] = []
+        self.fail = False
+
+    async def record_decisions(
+        self, applications: Sequence[LoanApplication]
+    ) -> list[LoanApplication]:
+        self.decision_writes.append([app.applicant_id for app in applications])
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        return await super().record_decisions(applications)
+
+
+@pytest.mark.asyncio
+async def test_write_behind_collapses_concurrent_decisions_into_one_write() -> None:
+    backing = RecordingRepository()
+    repository = WriteBehindLoanApplicationRepository(backing, flush_interval_seconds=0.01)
+    older = _application("a").with_status(ApplicationStatus.REJECTED)
+    newer = replace(
+        older, status=ApplicationStatus.APPROVED, updated_at=older.updated_at + timedelta(seconds=1)
+    )
+
+    results = await asyncio.gather(
+        repository.record_decisions([newer]),
+        repository.record_decisions(
+            [older, _application("b").with_status(ApplicationStatus.APPROVED)]
+        ),
+    )
+
+    assert backing.decision_writes == [["a", "b"]]
+    assert results[0][0].status == ApplicationStatus.APPROVED
+    assert [app.applicant_id for app in results[1]] == ["a", "b"]
+    stored = await backing.get_latest("a")
+    assert stored is not None and stored.status == ApplicationStatus.APPROVED
+
+
+@pytest.mark.asyncio
+async def test_write_behind_upsert_keeps_newer_pending_decision() -> None:
+    backing = RecordingRepository()
+    repository = WriteBehindLoanApplicationRepository(backing, flush_interval_seconds=60)
+    row = _application("a", "1000")
+    decided = replace(
+        row, status=ApplicationStatus.APPROVED, updated_at=row.updated_at + timedelta(seconds=1)
+    )
+
+    decision = asyncio.ensure_future(repository.record_decisions([decided]))
+    await asyncio.sleep(0)
+    upsert = asyncio.ensure_future(repository.upsert(replace(row, amount=Decimal("1500"))))
+    await asyncio.sleep(0)
+    await repository.flush()
+    await asyncio.gather(decision, upsert)
+
+    stored = await backing.get_latest("a")
+    assert stored is not None
+    assert stored.amount == Decimal("1500")
+    assert stored.status == ApplicationStatus.APPROVED
+    assert stored.updated_at == decided.updated_at
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flushes_at_row_limit_and_reports_failures() -> None:
+    backing = RecordingRepository()
+    repository = WriteBehindLoanApplicationRepository(
+        backing, flush_interval_seconds=60, max_pending_rows=2
+    )
+
+    await asyncio.wait_for(
+        repository.record_decisions([_application("a"), _application("b")]), timeout=1
+    )
+    assert backing.decision_writes == [["a", "b"]]
+
+    backing.fail = True
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(
+            repository.record_decisions([_application("c"), _application("d")]), timeout=1
+        )
+    assert repository.pending_rows == 0
@@ -0,0 +1,63 @@
+"""Unit tests for cached snapshot codecs."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from loans.domain import ApplicationStatus, LoanApplication
+from loans.infrastructure.cache import BinarySnapshotCodec, JsonSnapshotCodec
+
+
+def _application(amount: str = "4500.00") -> LoanApplication:
+    return LoanApplication(
+        applicant_id="applicant-ü-123",
+        amount=Decimal(amount),
+        term_months=24,
+        status=ApplicationStatus.APPROVED,
+        created_at=datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        updated_at=datetime(2024, 5, 1, 12, 31, 0, 1, tzinfo=timezone.utc),
+    )
+
+
+@pytest.mark.parametrize("amount", ["4500.00", "0.01", "-12.5", "5E+3", "99999999999.99"])
+def test_binary_codec_round_trips_snapshot(amount: str) -> None:
+    codec = BinarySnapshotCodec()
+    application = _application(amount)
+
+    decoded = codec.decode(codec.encode(application))
+
+    assert decoded == application
+    assert str(decoded.amount) == amount
+
+
+def test_binary_codec_is_smaller_than_json() -> None:
+    application = _application()
+
+    assert (
+        len(BinarySnapshotCodec().encode(application))
+        < len(JsonSnapshotCodec().encode(application)) / 3
+    )
+
+
+def test_codecs_decode_each_others_payloads() -> None:
+    application = _application()
+
+    assert BinarySnapshotCodec().decode(JsonSnapshotCodec().encode(application)) == application
+    assert JsonSnapshotCodec().decode(BinarySnapshotCodec().encode(application)) == application
+
+
+def test_binary_codec_falls_back_to_json_for_oversized_amounts() -> None:
+    application = _application("1" * 30)
+
+    payload = BinarySnapshotCodec().encode(application)
+
+    assert payload.startswith(b"{")
+    assert BinarySnapshotCodec().decode(payload) == application
+
+
+def test_decode_rejects_unknown_format() -> None:
+    with pytest.raises(ValueError):
+        BinarySnapshotCodec().decode(b"\x7f garbage")
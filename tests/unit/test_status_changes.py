@@ -0,0 +1,55 @@
+"""Unit tests for in-process status change fan-out."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from loans.domain import ApplicationStatus, LoanApplication
+from loans.infrastructure.messaging import (
+    InMemoryStatusChangeBus,
+    StatusWatchRegistry,
+    WatchCapacityError,
+)
+
+
+def _application(applicant_id: str, status: ApplicationStatus) -> LoanApplication:
+    return LoanApplication(
+        applicant_id=applicant_id, amount=Decimal("100"), term_months=12, status=status
+    )
+
+
+@pytest.mark.asyncio
+async def test_subscription_keeps_only_latest_snapshot() -> None:
+    registry = StatusWatchRegistry()
+    bus = InMemoryStatusChangeBus(registry)
+
+    with registry.subscribe("a") as subscription:
+        await bus.notify(
+            [
+                _application("a", ApplicationStatus.PENDING),
+                _application("b", ApplicationStatus.APPROVED),
+                _application("a", ApplicationStatus.REJECTED),
+            ]
+        )
+
+        latest = await subscription.next(timeout=0.1)
+        assert latest is not None
+        assert latest.status == ApplicationStatus.REJECTED
+        assert await subscription.next(timeout=0.01) is None
+
+    assert len(registry) == 0
+
+
+def test_registry_rejects_watchers_beyond_capacity() -> None:
+    registry = StatusWatchRegistry(max_subscriptions=1)
+    first = registry.subscribe("a")
+
+    with pytest.raises(WatchCapacityError):
+        registry.subscribe("b")
+
+    first.close()
+    first.close()
+    registry.subscribe("b").close()
+    assert len(registry) == 0